@@ -17,9 +17,20 @@ Must begin with a pandas DataFrame containing 'wide' data where:
 # Register animated_plot accessor for Pandas DataFrames and Series:
 import pandas as pd
 from pandas.core.accessor import CachedAccessor
-from .plotting import AnimatedAccessor, plot, animate_multiple_plots
+from .plotting import (
+    AnimatedAccessor,
+    plot,
+    animate_multiple_plots,
+    animate_multiple_plots_async,
+)
+from ._base_chart import SaveProgress, vectorized
 
 from .base import load_dataset
+from .batch import BatchJob, render_batch
+from .cache import FrameCache, GeometryCache
+from .raster import SpriteCache
+from .streaming import StreamingChart, astream_plot, stream_plot
+from .tiles import TileStore
 
 version = "0.2.4"
 
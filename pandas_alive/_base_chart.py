@@ -4,26 +4,19 @@ Methods & Attributes defined will be shared on all other chart types, is also in
 
 """
 
-import datetime
 import typing
 
 import attr
 import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-import matplotlib.units as munits
 import numpy as np
 import pandas as pd
-from matplotlib import ticker
+from matplotlib import cm, ticker
 from matplotlib.animation import FuncAnimation, PillowWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import Colormap, to_rgba
 
-# For conciseDateFormatter for all plots https://matplotlib.org/3.1.0/gallery/ticks_and_spines/date_concise_formatter.html
-converter = mdates.ConciseDateConverter()
-munits.registry[np.datetime64] = converter
-munits.registry[datetime.date] = converter
-munits.registry[datetime.datetime] = converter
-
 
 DARK24 = [
     "#2E91E5",
@@ -53,6 +46,141 @@ DARK24 = [
 ]
 
 
+def _format_frame_ranges(frames: typing.Sequence[int]) -> str:
+    """ Format frame numbers compactly as ranges, eg "0-4, 7"
+
+    Args:
+        frames (typing.Sequence[int]): Frame numbers in increasing order
+
+    Returns:
+        str: Comma separated ranges
+    """
+    ranges = []
+    for frame in frames:
+        if ranges and frame == ranges[-1][1] + 1:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return ", ".join(
+        str(start) if start == end else f"{start}-{end}" for start, end in ranges
+    )
+
+
+# Figure layouts measured by `calculate_new_figsize`, keyed by `get_layout_key()`
+_layout_cache: typing.Optional[typing.Dict[typing.Tuple, typing.Tuple]] = None
+
+
+def _enable_layout_cache() -> None:
+    """ Reuse measured figure layouts between charts created in this process
+
+    Measuring a layout draws two throwaway figures, when rendering many charts with the same styling & labels (see `pandas_alive.batch`) the measurement only needs to be done once. Layouts are cached per process, so the cache must only be enabled where rcParams don't change between charts.
+    """
+    global _layout_cache
+    if _layout_cache is None:
+        _layout_cache = {}
+
+# Interpolation steps per period kept by preview renders, see `_BaseChart.apply_preview`
+PREVIEW_STEPS_PER_PERIOD = 2
+
+# Fraction of the resolution preview renders are drawn at
+PREVIEW_DPI_SCALE = 0.25
+
+# Extensions `_BaseChart.save_many` writes a single frame to instead of an animation
+STILL_EXTENSIONS = ("png", "jpg", "jpeg", "webp")
+
+
+def vectorized(func: typing.Callable) -> typing.Callable:
+    """ Mark a `period_summary_func` or `perpendicular_bar_func` as handling every frame in one call
+
+    Instead of being called with each frame's values (and ranks), `func` is called once with DataFrames of all frames, one row per frame.
+
+    - `period_summary_func` is passed the values and returns the same dictionary as for a single frame, with "s" holding one string per frame.
+    - `perpendicular_bar_func` is passed the values & ranks and returns an array with one value per frame.
+
+    Results must only depend on their own frame's row, frames added by `stream_plot` are passed in as they arrive.
+
+    Example:
+        .. code-block::
+            @pandas_alive.vectorized
+            def summary(df):
+                totals = df.sum(axis=1).map("Total: {:,.0f}".format)
+                return {"x": 0.85, "y": 0.2, "s": totals, "ha": "right"}
+
+            @pandas_alive.vectorized
+            def upper_quartile(df, df_rank):
+                # Bars that aren't visible are ranked 0
+                return df.where(df_rank > 0).quantile(0.75, axis=1)
+
+            df.plot_animated(
+                period_summary_func=summary, perpendicular_bar_func=upper_quartile
+            )
+
+    Args:
+        func (typing.Callable): Function taking DataFrames of frames
+
+    Returns:
+        typing.Callable: `func`, marked as vectorized
+    """
+    func.vectorized = True
+    return func
+
+
+@attr.s
+class SaveProgress:
+    """
+    Progress of saving an animation, emitted after each frame is written
+
+    Args:
+        filename (str): File being written
+        frame (int): Number of frames written so far
+        total (int): Number of frames to write
+    """
+
+    filename: str = attr.ib()
+    frame: int = attr.ib()
+    total: int = attr.ib()
+
+
+async def _iter_steps_async(
+    steps: typing.Iterator,
+    executor: "concurrent.futures.Executor" = None,
+    timeout: float = None,
+) -> typing.AsyncIterator:
+    """ Advance a generator of rendering steps in an executor, so the event loop isn't blocked while drawing
+
+    The generator is closed if iteration stops early (cancellation, timeout or `aclose()`), once the step in progress has finished, so it can clean up partial output.
+
+    Args:
+        steps (typing.Iterator): Generator drawing a frame on each step
+        executor (concurrent.futures.Executor, optional): Executor to draw in. Defaults to the event loop's default executor.
+        timeout (float, optional): Seconds allowed for all steps before raising `asyncio.TimeoutError`. Defaults to None.
+
+    Yields:
+        typing.Any: Value yielded by each step
+    """
+    import asyncio
+
+    loop = asyncio.get_event_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    done = object()
+    step = None
+    try:
+        while True:
+            step = loop.run_in_executor(executor, next, steps, done)
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            # Shielded so the step keeps its future when the wait is cancelled
+            value = await asyncio.wait_for(asyncio.shield(step), remaining)
+            if value is done:
+                return
+            yield value
+    except BaseException:
+        if step is not None and not step.done():
+            # The figure is being drawn on in the executor, it can't be cleaned up until the frame is done
+            await asyncio.wait([step])
+        steps.close()
+        raise
+
+
 @attr.s()
 class _BaseChart:
     """
@@ -210,7 +338,7 @@ class _BaseChart:
         """
         if isinstance(cmap, str):
             try:
-                cmap = DARK24 if cmap == "dark24" else plt.cm.get_cmap(cmap)
+                cmap = DARK24 if cmap == "dark24" else cm.get_cmap(cmap)
             except ValueError:
                 # Try setting a list of repeating colours if no cmap found (for single colours)
                 cmap = [to_rgba(cmap)] * len(self.get_data_cols(self.df))
@@ -231,6 +359,18 @@ class _BaseChart:
 
         return chart_colors
 
+    def get_palette_colors(self) -> typing.List[typing.Tuple[int, int, int]]:
+        """ Colors known to be drawn, kept exact when encoding GIFs with a shared palette: figure & axes faces, text, grid and the chart's colors
+
+        Returns:
+            typing.List[typing.Tuple[int, int, int]]: RGB colors in order of importance
+        """
+        colors = [self.fig.get_facecolor(), self.ax.get_facecolor(), "black", "white"]
+        return [
+            tuple(int(round(channel * 255)) for channel in to_rgba(color)[:3])
+            for color in colors + list(self.colors)
+        ]
+
     def get_single_color(self, color_string: str) -> typing.Tuple[int, int, int, int]:
         """
         Get single RBGA value from string
@@ -276,6 +416,7 @@ class _BaseChart:
 
         # ufunc error occurs in anaconda environments if not converted to datetime instead of Timestamp
         if isinstance(xlim_start, pd.Timestamp):
+            self.set_date_axis(ax.xaxis)
             ax.set_xlim(xlim_start.to_pydatetime(), xlim_end.to_pydatetime())
         else:
             ax.set_xlim(xlim_start, xlim_end)
@@ -306,6 +447,19 @@ class _BaseChart:
             #     .max(skipna=True)*ylim_scale,
             # )
 
+    def set_date_axis(self, axis: matplotlib.axis.Axis) -> None:
+        """ Label an axis of dates concisely, as `matplotlib.dates.ConciseDateConverter` does, without registering a converter for every date plotted in the process
+
+        https://matplotlib.org/3.1.0/gallery/ticks_and_spines/date_concise_formatter.html
+
+        Args:
+            axis (matplotlib.axis.Axis): Axis of dates
+        """
+        if not isinstance(axis.get_major_formatter(), mdates.ConciseDateFormatter):
+            locator = mdates.AutoDateLocator()
+            axis.set_major_locator(locator)
+            axis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
     def rename_data_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Converts all column names to string
@@ -416,6 +570,582 @@ class _BaseChart:
         """
         return range(len(self.df.index))
 
+    def push_period(
+        self,
+        period: typing.Any,
+        values: typing.Union[pd.Series, typing.Mapping],
+        max_periods: int = None,
+    ) -> range:
+        """ Extend the chart with a new period, only interpolating from the last period to the new one
+
+        Used by `StreamingChart` to animate rows as they arrive. Columns missing from `values` are NaN and new columns are ignored.
+
+        Args:
+            period (typing.Any): Index value of the new period
+            values (typing.Union[pd.Series, typing.Mapping]): Values of the new period for each column
+            max_periods (int, optional): Only keep this many periods of history, older frames are dropped so memory stays bounded. Defaults to None.
+
+        Returns:
+            range: Frames added for the new period, to be animated in order
+        """
+        row = pd.DataFrame(
+            [values], index=pd.Index([period], name=self.orig_df.index.name)
+        )
+        row = row.reindex(columns=self.orig_df.columns)
+        segment = pd.concat([self.orig_df.iloc[[-1]], row])
+        if not isinstance(segment.columns, pd.MultiIndex):
+            segment = self.rename_data_columns(segment)
+        segment = self.get_interpolated_df(
+            segment, self.steps_per_period, self.interpolate_period
+        ).iloc[1:]
+
+        self.orig_df = pd.concat([self.orig_df, row])
+        self.df = pd.concat([self.df, segment])
+        if max_periods is not None:
+            self.orig_df = self.orig_df.iloc[-(max_periods + 1) :]
+            self.df = self.df.iloc[-(max_periods * self.steps_per_period + 1) :]
+        self._row_hashes = None
+        # Only the new frames are formatted & summarised
+        if getattr(self, "_period_labels", None) is not None:
+            self._period_labels = np.concatenate(
+                [self._period_labels, self.format_periods(segment.index)]
+            )[-len(self.df) :]
+        if getattr(self, "_period_summaries", None) is not None:
+            text_dict, texts = self._period_summaries
+            self._period_summaries = (
+                text_dict,
+                np.concatenate([texts, self.summarize_periods(segment)[1]])[
+                    -len(self.df) :
+                ],
+            )
+        return range(len(self.df) - len(segment), len(self.df))
+
+    def get_period_movement(self) -> np.ndarray:
+        """ How much the chart changes over each period, from the changes in values and in ranks between consecutive periods
+
+        Both are normalised to sum to 1 over all periods, so either large changes in value or a reshuffle of ranks give a period more movement.
+
+        Returns:
+            np.ndarray: Movement of each period, one fewer than the number of rows in `orig_df`
+        """
+        values = self.orig_df.select_dtypes(include=[np.number])
+        movement = np.zeros(len(values) - 1)
+        for changes in (values.values, values.rank(axis=1).values):
+            period_changes = np.nansum(np.abs(np.diff(changes, axis=0)), axis=1)
+            if period_changes.sum() > 0:
+                movement += period_changes / period_changes.sum()
+        return movement
+
+    def get_adaptive_steps(self, frame_budget: int) -> np.ndarray:
+        """ Number of interpolation steps for each period, sharing `frame_budget` frames between periods by their movement
+
+        Each period gets at least one and at most `steps_per_period` steps. Steps are handed out one at a time to the period whose steps currently cover the most movement, so each step covers a similar amount of movement.
+
+        Args:
+            frame_budget (int): Number of distinct frames to draw, including the first frame
+
+        Raises:
+            ValueError: If the budget is less than one frame per period plus the first frame
+
+        Returns:
+            np.ndarray: Steps of each period
+        """
+        import heapq
+
+        movement = self.get_period_movement()
+        steps = np.ones(len(movement), dtype=int)
+        extra = frame_budget - 1 - len(movement)
+        if extra < 0:
+            raise ValueError(
+                f"`frame_budget` must be at least {len(movement) + 1}, a frame for each period and the first frame"
+            )
+        heap = [(-change, period) for period, change in enumerate(movement) if change]
+        heapq.heapify(heap)
+        while extra > 0 and heap:
+            _, period = heapq.heappop(heap)
+            if steps[period] == self.steps_per_period:
+                continue
+            steps[period] += 1
+            extra -= 1
+            heapq.heappush(heap, (-movement[period] / steps[period], period))
+        return steps
+
+    def apply_frame_budget(self, frame_budget: int) -> None:
+        """ Adaptive timeline, only draw `frame_budget` distinct frames with more steps given to periods with more movement, see `get_adaptive_steps`
+
+        Every period keeps `steps_per_period` frames, so the duration and pacing of the animation don't change. Frames between a period's steps hold the previous step, and are repeated rather than drawn when saving (see `get_repeated_frames`).
+
+        Args:
+            frame_budget (int): Number of distinct frames to draw, including the first frame
+        """
+        frames_per_period = self.steps_per_period
+        offsets = np.arange(frames_per_period)
+        rows = []
+        for period, steps in enumerate(self.get_adaptive_steps(frame_budget)):
+            # Step each frame of the period holds, at its offset in the period
+            step = offsets * steps // frames_per_period
+            rows.append(period * frames_per_period + step * frames_per_period // steps)
+        rows.append([len(self.df) - 1])
+        self.hold_frames(np.concatenate(rows))
+
+    def hold_frames(self, rows: np.ndarray) -> None:
+        """ Show the interpolated row at `rows` in each frame instead of the frame's own row, frames after the last of `rows` are dropped
+
+        Args:
+            rows (np.ndarray): Row to show in each frame
+        """
+        self.df = self.df.iloc[rows]
+        self._row_hashes = None
+        self._period_labels = None
+        self._period_summaries = None
+
+    def get_preview_frame_step(self) -> int:
+        """ Smallest step between frames that keeps at most `PREVIEW_STEPS_PER_PERIOD` steps per period, dividing `steps_per_period` so frames stay on period boundaries
+
+        Returns:
+            int: Number of frames each preview frame stands in for
+        """
+        steps = self.steps_per_period
+        return min(
+            step
+            for step in range(1, steps + 1)
+            if steps % step == 0 and steps // step <= PREVIEW_STEPS_PER_PERIOD
+        )
+
+    def apply_preview(self) -> None:
+        """ Draft mode to check an animation quickly before the final render
+
+        Only every `get_preview_frame_step()` frame is drawn and each is shown for that many frames' time, so the duration and period pacing match the final render, as does the layout. Frames are drawn at `PREVIEW_DPI_SCALE` of the resolution, without antialiasing or tick labels.
+        """
+        frame_step = self.get_preview_frame_step()
+        self.hold_frames(np.arange(0, len(self.df), frame_step))
+        self.steps_per_period //= frame_step
+        self.dpi = max(1, int(self.dpi * PREVIEW_DPI_SCALE))
+        self.fig.set_dpi(self.dpi)
+
+        anim_func = self.anim_func
+        styled_axes = []
+
+        def draft_anim_func(frame: int) -> None:
+            anim_func(frame)
+            # Ticks created later follow the axes' tick params, `animate_multiple_plots` swaps in its own axes
+            if self.ax not in styled_axes:
+                self.ax.tick_params(labelbottom=False, labelleft=False)
+                styled_axes.append(self.ax)
+            for artist in self.ax.patches + self.ax.lines + self.ax.collections:
+                artist.set_antialiased(False)
+
+        self.anim_func = draft_anim_func
+
+    def get_row_hashes(self) -> np.ndarray:
+        """ Hash of each row (frame) of the interpolated DataFrame, calculated once
+
+        Returns:
+            np.ndarray: Array of uint64 hashes, one per frame
+        """
+        if getattr(self, "_row_hashes", None) is None:
+            self._row_hashes = pd.util.hash_pandas_object(self.df, index=True).values
+        return self._row_hashes
+
+    def get_frame_data(self, i: int) -> typing.Tuple:
+        """ Data that determines the contents of frame `i`, used to key cached frames
+
+        By default a frame shows the history of all rows up to `i` (eg, lines), charts only showing the current row override this.
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            typing.Tuple: Hashable parts of the frame's data slice
+        """
+        return (self.get_row_hashes()[: i + 1],)
+
+    def get_repeated_frames(self) -> np.ndarray:
+        """ Whether each frame looks the same as the frame before it, so it can be repeated instead of redrawn
+
+        By default a frame shows the history of all rows up to `i`, which only looks the same as the previous frame when its row repeats the previous row, period included. Charts only showing the current row override this with `get_repeated_periods`.
+
+        Returns:
+            np.ndarray: Boolean for each frame, the first frame is never repeated
+        """
+        hashes = self.get_row_hashes()
+        return np.concatenate([[False], hashes[1:] == hashes[:-1]])
+
+    def get_repeated_periods(self, *hashes: np.ndarray) -> np.ndarray:
+        """ Whether each frame looks the same as the frame before it, for charts only showing the current period
+
+        The period itself may change (eg, forward filled data), as long as its label & summary don't.
+
+        Args:
+            *hashes (np.ndarray): Hashes for each frame of everything else drawn, eg values & ranks
+
+        Returns:
+            np.ndarray: Boolean for each frame, the first frame is never repeated
+        """
+        repeated = np.ones(len(hashes[0]), dtype=bool)
+        repeated[0] = False
+        for frame_hashes in hashes:
+            repeated[1:] &= frame_hashes[1:] == frame_hashes[:-1]
+        # Only format labels of frames whose data is repeated
+        for i in np.flatnonzero(repeated):
+            repeated[i] = self.get_period_texts(i) == self.get_period_texts(i - 1)
+        return repeated
+
+    def get_style_params(self) -> typing.Dict[str, typing.Any]:
+        """ Parameters other than the data that change how frames look, used to key cached frames
+
+        Returns:
+            typing.Dict[str, typing.Any]: Chart attributes along with figure size, resolution and layout
+        """
+        from . import version
+
+        excluded = ("df", "fig", "writer", "enable_progress_bar")
+        params = {
+            field.name: getattr(self, field.name)
+            for field in attr.fields(self.__class__)
+            if field.name not in excluded
+        }
+        params.update(
+            chart=self.__class__.__name__,
+            pandas_alive=version,
+            matplotlib=matplotlib.__version__,
+            size_inches=tuple(self.fig.get_size_inches()),
+            fig_dpi=self.fig.dpi,
+            axes=[tuple(ax.get_position().bounds) for ax in self.fig.axes],
+        )
+        if self.fixed_max:
+            # Limits are taken from the entire DataFrame instead of the frame's slice
+            params["extent"] = self.get_extent()
+        return params
+
+    def get_extent(self) -> typing.Tuple:
+        """ First & last period and smallest & largest value of the entire DataFrame
+
+        Returns:
+            typing.Tuple: (first period, last period, min value, max value)
+        """
+        values = self.df.select_dtypes(include=[np.number]).values
+        return (
+            self.df.index[0],
+            self.df.index[-1],
+            np.nanmin(values),
+            np.nanmax(values),
+        )
+
+    def render_png(self, i: int) -> bytes:
+        """ Animate frame `i` and render the figure to PNG
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            bytes: Encoded PNG image
+        """
+        import io
+
+        self.anim_func(i)
+        buffer = io.BytesIO()
+        self.fig.savefig(buffer, format="png", dpi=self.dpi)
+        return buffer.getvalue()
+
+    def render_image(self, i: int) -> "PIL.Image.Image":
+        """ Animate frame `i` and render the figure to an image
+
+        Charts that can draw frames without encoding them to PNG (eg, `BarChartRace(engine="raster")`) override this.
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            PIL.Image.Image: Rendered frame
+        """
+        import io
+
+        from PIL import Image
+
+        return Image.open(io.BytesIO(self.render_png(i)))
+
+    def is_first_frame(self, i: int) -> bool:
+        """ Whether frame `i` is the first drawn on the axes, so charts create their artists instead of updating them
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            bool: True for frame 0, or the frame passed to `reset_frames`
+        """
+        return i == getattr(self, "_first_frame", 0)
+
+    def reset_frames(self, first: int = 0) -> None:
+        """ Remove the chart's artists from its axes, so frame `first` is drawn next as if it were the first frame
+
+        Args:
+            first (int, optional): Frame number to draw next. Defaults to 0.
+        """
+        ax = self.ax
+        for item in ax.lines + ax.collections + ax.containers + ax.texts:
+            item.remove()
+        self._first_frame = first
+
+    def iter_frames(
+        self, start: int = 0, stop: int = None
+    ) -> typing.Iterator[np.ndarray]:
+        """ Draw frames from `start` without drawing the frames before it
+
+        Example:
+            ``poster = next(chart.iter_frames(len(chart.get_frames()) - 1))``
+
+        Args:
+            start (int, optional): First frame number to draw. Defaults to 0.
+            stop (int, optional): Frame number to stop before. Defaults to the number of frames.
+
+        Yields:
+            np.ndarray: RGBA image of each frame of shape (height, width, 4), as drawn when saving
+        """
+        if stop is None:
+            stop = len(self.get_frames())
+        enable_progress_bar = self.enable_progress_bar
+        self.enable_progress_bar = False
+        self.reset_frames(start)
+        try:
+            for i in range(start, stop):
+                yield np.array(self.render_image(i).convert("RGBA"))
+        finally:
+            # Leave the axes as after a save, so the chart can be saved or drawn again
+            self.reset_frames()
+            self.enable_progress_bar = enable_progress_bar
+
+    def render_frame(self, i: int) -> np.ndarray:
+        """ Draw frame `i` directly, without drawing the frames before it
+
+        Args:
+            i (int): Frame number, counting from the end if negative
+
+        Returns:
+            np.ndarray: RGBA image of shape (height, width, 4), as drawn when saving
+        """
+        i = self.get_frames()[i]
+        frames = self.iter_frames(i, i + 1)
+        try:
+            return next(frames)
+        finally:
+            frames.close()
+
+    def get_frame_keys(
+        self, style_params: typing.Dict[str, typing.Any] = None
+    ) -> typing.List[str]:
+        """ Content-address of every frame, from the frame's data and the chart's style
+
+        Args:
+            style_params (typing.Dict[str, typing.Any], optional): Style parameters to key frames with. Defaults to `get_style_params()`.
+
+        Returns:
+            typing.List[str]: Key of each frame
+        """
+        from .cache import make_key
+
+        if style_params is None:
+            style_params = self.get_style_params()
+        return [
+            make_key(style_params, self.get_frame_data(i)) for i in self.get_frames()
+        ]
+
+    def iter_frame_images(
+        self,
+        frame_cache: "FrameCache" = None,
+        frames: typing.Iterable = None,
+        skip_repeated: bool = False,
+    ) -> typing.Iterator[typing.Optional["PIL.Image.Image"]]:
+        """ Render frames of the animation as images
+
+        With a `frame_cache`, frames whose data and styling are unchanged since a previous render are read back from disk instead of being redrawn.
+
+        Args:
+            frame_cache (FrameCache, optional): Cache to read & store encoded frames. Defaults to None.
+            frames (typing.Iterable, optional): Frame numbers to render in increasing order. Defaults to all frames.
+            skip_repeated (bool, optional): Yield None instead of drawing frames that look the same as the frame yielded before them, see `get_repeated_frames`. Defaults to False.
+
+        Yields:
+            typing.Optional[PIL.Image.Image]: Image of each frame in order, or None for a skipped repeat
+        """
+        import io
+
+        from PIL import Image
+
+        from .cache import make_key
+
+        if frames is None:
+            frames = self.get_frames()
+        if frame_cache is not None:
+            style_params = self.get_style_params()
+        if skip_repeated:
+            repeated = self.get_repeated_frames()
+        last_drawn = -1
+        previous = None
+        for i in frames:
+            if skip_repeated and previous == i - 1 and repeated[i]:
+                previous = i
+                if self.enable_progress_bar:
+                    self.update_progress_bar()
+                yield None
+                continue
+            previous = i
+            data = None
+            if frame_cache is not None:
+                key = make_key(style_params, self.get_frame_data(i))
+                data = frame_cache.get(key)
+            if data is None:
+                if i != last_drawn + 1:
+                    self.reset_frames(i)
+                last_drawn = i
+                if frame_cache is None:
+                    yield self.render_image(i)
+                    continue
+                data = self.render_png(i)
+                frame_cache.put(key, data)
+            elif self.enable_progress_bar:
+                self.update_progress_bar()
+            yield Image.open(io.BytesIO(data))
+
+    def get_manifest_path(self, filename: str) -> str:
+        """ Location of the manifest describing the frames rendered to `filename`, used by `save(append=True)`
+
+        Args:
+            filename (str): Animation file name
+
+        Returns:
+            str: Path to manifest
+        """
+        return filename + ".pandas_alive.json"
+
+    def get_frames_to_append(
+        self, filename: str
+    ) -> typing.Tuple[typing.Sequence[int], typing.Dict[str, typing.Any]]:
+        """ Compare the chart with the manifest of a previous render to `filename` to find the frames to append
+
+        The input extends the previous render when the data of every previously rendered frame is unchanged. Frames whose data is unchanged but whose fixed limits changed (eg, `fixed_max=True` with new maximums) are reported in a warning as needing a re-render.
+
+        Args:
+            filename (str): Animation file name
+
+        Returns:
+            typing.Tuple[typing.Sequence[int], typing.Dict[str, typing.Any]]: Frames to render, appending to the existing file if not all frames, and the manifest to write once rendered
+        """
+        import json
+        import os
+        import warnings
+
+        style_params = self.get_style_params()
+        frame_keys = self.get_frame_keys(style_params)
+        # Keys without fixed limits, to tell new data apart from limits changing
+        style_params.pop("extent", None)
+        data_keys = self.get_frame_keys(style_params)
+
+        frames = self.get_frames()
+        manifest = {"frame_keys": frame_keys, "data_keys": data_keys}
+        manifest_path = self.get_manifest_path(filename)
+        if not (os.path.exists(filename) and os.path.exists(manifest_path)):
+            return frames, manifest
+        try:
+            with open(manifest_path) as f:
+                previous = json.load(f)
+            num_rendered = len(previous["frame_keys"])
+            if len(previous["data_keys"]) != num_rendered:
+                raise ValueError("Mismatched number of frame and data keys")
+        except (ValueError, KeyError, TypeError):
+            # JSONDecodeError is a ValueError
+            warnings.warn(
+                f"Manifest {manifest_path} is corrupt or from an older version, rendering all frames"
+            )
+            return frames, manifest
+
+        if previous.get("output_size") != os.path.getsize(filename):
+            warnings.warn(
+                f"{filename} was changed since it was last rendered, rendering all frames"
+            )
+            return frames, manifest
+        if (
+            num_rendered > len(frames)
+            or data_keys[:num_rendered] != previous["data_keys"]
+        ):
+            warnings.warn(
+                f"Data doesn't extend the data previously rendered to {filename}, rendering all frames"
+            )
+            return frames, manifest
+
+        stale = [
+            i
+            for i, (key, rendered_key) in enumerate(
+                zip(frame_keys, previous["frame_keys"])
+            )
+            if key != rendered_key
+        ]
+        if len(stale) == num_rendered:
+            warnings.warn(
+                f"Limits changed for all frames previously rendered to {filename}, rendering all frames"
+            )
+            return frames, manifest
+        if stale:
+            warnings.warn(
+                f"Limits changed for frames {_format_frame_ranges(stale)} previously rendered to {filename}, save without `append=True` to re-render them"
+            )
+            # Manifest describes what is in the file, stale frames included
+            manifest["frame_keys"] = previous["frame_keys"] + frame_keys[num_rendered:]
+        return frames[num_rendered:], manifest
+
+    def iter_save_frames(
+        self, filename: str, frame_cache: "FrameCache" = None, append: bool = False
+    ) -> typing.Iterator["SaveProgress"]:
+        """ Render frames one by one and write them with an encoder suitable for `filename`, yielding progress after each frame
+
+        Frames that look the same as the previous frame aren't drawn, the encoder repeats the previous frame instead (see `get_repeated_frames`).
+
+        If the generator is closed before it's exhausted (eg, the save was cancelled), the encoder is aborted so no partial output is left behind.
+
+        Args:
+            filename (str): File name with extension to save animation to, either a GIF or a video written with ffmpeg
+            frame_cache (FrameCache, optional): Cache to read & store encoded frames. Defaults to None.
+            append (bool, optional): Only render frames added since the previous save to `filename` and append them to it. Defaults to False.
+
+        Yields:
+            SaveProgress: Number of frames written so far
+        """
+        import json
+        import os
+
+        from .encoders import get_encoder
+
+        interval = self.period_length / self.steps_per_period
+        frames = self.get_frames()
+        if append:
+            frames, manifest = self.get_frames_to_append(filename)
+
+        if len(frames):
+            encoder = get_encoder(
+                filename,
+                self.fps,
+                interval,
+                append=len(frames) < len(self.get_frames()),
+                colors=self.get_palette_colors(),
+            )
+            try:
+                images = self.iter_frame_images(frame_cache, frames, skip_repeated=True)
+                for num, image in enumerate(images):
+                    if image is None:
+                        encoder.repeat_frame()
+                    else:
+                        encoder.add_frame(image)
+                    yield SaveProgress(filename, num + 1, len(frames))
+            except BaseException:
+                encoder.abort()
+                raise
+            encoder.finish()
+
+        if append:
+            manifest["output_size"] = os.path.getsize(filename)
+            with open(self.get_manifest_path(filename), "w") as f:
+                json.dump(manifest, f)
+
     def make_animation(
         self, frames: typing.Union[typing.Iterable, int], init_func: typing.Callable
     ) -> FuncAnimation:
@@ -446,6 +1176,7 @@ class _BaseChart:
         import io
 
         fig = plt.Figure(figsize=self.figsize)
+        FigureCanvasAgg(fig)
 
         ax = fig.add_subplot()
 
@@ -483,6 +1214,40 @@ class _BaseChart:
         height = orig_pos.y1 - bottom
         return [left, bottom, width, height]
 
+    def get_layout_key(self) -> typing.Tuple:
+        """ Everything `calculate_new_figsize` depends on, charts with equal keys share the same layout
+
+        Returns:
+            typing.Tuple: Hashable layout key
+        """
+        return (
+            type(self).__name__,
+            tuple(self.figsize),
+            self.tick_label_size,
+            self.title,
+            tuple(str(column) for column in self.df.columns),
+            str(self.df.values.max()),
+        )
+
+    def layout_figure(self, real_fig: plt.figure) -> typing.List[float]:
+        """ Size figure to allow for labels, reusing the measured layout of a previous chart with the same `get_layout_key()` if the layout cache is enabled
+
+        Args:
+            real_fig (plt.figure): Figure before calculation
+
+        Returns:
+            typing.List[float]: The dimensions [left, bottom, width, height] of the new axes, see `calculate_new_figsize`
+        """
+        if _layout_cache is None:
+            return self.calculate_new_figsize(real_fig)
+        key = self.get_layout_key()
+        if key not in _layout_cache:
+            rect = self.calculate_new_figsize(real_fig)
+            _layout_cache[key] = (tuple(real_fig.get_size_inches()), tuple(rect))
+        size_inches, rect = _layout_cache[key]
+        real_fig.set_size_inches(size_inches)
+        return list(rect)
+
     def apply_style(self, ax: matplotlib.pyplot.Axes) -> matplotlib.pyplot.Axes:
         """
         Apply styling to axes with spines and grid, can be overridden
@@ -510,14 +1275,131 @@ class _BaseChart:
         """
 
         fig = plt.Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(fig)
         # limit = (0.2, self.n_bars + 0.8)
-        rect = self.calculate_new_figsize(fig)
+        rect = self.layout_figure(fig)
         ax = fig.add_axes(rect)
 
         ax = self.apply_style(ax)
 
         return fig, ax
 
+    def format_periods(self, periods: pd.Index) -> np.ndarray:
+        """ Format period labels with `period_fmt`, dates are formatted in one vectorized call
+
+        Args:
+            periods (pd.Index): Index values of frames
+
+        Returns:
+            np.ndarray: Object array of period labels
+        """
+        if not self.period_fmt:
+            labels = periods.astype(str)
+        elif periods.dtype.kind == "M":  # Date time
+            labels = periods.strftime(self.period_fmt)
+        else:
+            labels = [self.period_fmt.format(x=period) for period in periods]
+        return np.asarray(labels, dtype=object)
+
+    def get_period_labels(self) -> np.ndarray:
+        """ Period label of every frame, formatted once
+
+        Returns:
+            np.ndarray: Object array of period labels, one per frame
+        """
+        if getattr(self, "_period_labels", None) is None:
+            self._period_labels = self.format_periods(self.df.index)
+        return self._period_labels
+
+    def get_period_text(self, i: int) -> str:
+        """ Period label of frame `i`, formatted with `period_fmt`
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            str: Period label
+        """
+        return self.get_period_labels()[i]
+
+    def check_summary(self, text_dict: typing.Dict) -> typing.Dict:
+        """ Check the dictionary returned by `period_summary_func` can be passed to matplotlib's `text`
+
+        Args:
+            text_dict (typing.Dict): Dictionary returned by `period_summary_func`
+
+        Raises:
+            ValueError: If the dictionary doesn't contain "x", "y" and "s"
+
+        Returns:
+            typing.Dict: `text_dict`
+        """
+        if "x" not in text_dict or "y" not in text_dict or "s" not in text_dict:
+            name = self.period_summary_func.__name__
+            raise ValueError(
+                f"The dictionary returned from `{name}` must contain "
+                '"x", "y", and "s"'
+            )
+        return text_dict
+
+    def summarize_periods(
+        self, df: pd.DataFrame
+    ) -> typing.Tuple[typing.Dict, np.ndarray]:
+        """ Summarise frames in one call of a `vectorized` `period_summary_func`
+
+        Args:
+            df (pd.DataFrame): Frames to summarise, one row per frame
+
+        Raises:
+            ValueError: If the dictionary doesn't contain "x", "y" and "s", or "s" doesn't hold one string per frame
+
+        Returns:
+            typing.Tuple[typing.Dict, np.ndarray]: Text properties shared by all frames, and each frame's text
+        """
+        text_dict = dict(self.check_summary(self.period_summary_func(df)))
+        texts = np.asarray(list(text_dict.pop("s")), dtype=object)
+        if len(texts) != len(df):
+            name = self.period_summary_func.__name__
+            raise ValueError(
+                f'"s" returned from `{name}` must contain one string per frame, '
+                f"got {len(texts)} for {len(df)} frames"
+            )
+        return text_dict, texts
+
+    def get_period_summary(self, i: int) -> typing.Dict:
+        """ Summary of frame `i` from `period_summary_func`, a `vectorized` function summarises all frames the first time
+
+        Args:
+            i (int): Frame number
+
+        Raises:
+            ValueError: If the dictionary doesn't contain "x", "y" and "s"
+
+        Returns:
+            typing.Dict: Text & its position in axes coordinates, along with properties of the matplotlib `Text`
+        """
+        if getattr(self.period_summary_func, "vectorized", False):
+            if getattr(self, "_period_summaries", None) is None:
+                self._period_summaries = self.summarize_periods(self.df)
+            text_dict, texts = self._period_summaries
+            return dict(text_dict, s=texts[i])
+        return self.check_summary(self.period_summary_func(self.df.iloc[i]))
+
+    def get_period_texts(self, i: int) -> typing.Tuple:
+        """ Texts shown for the period of frame `i`, the period label and period summary
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            typing.Tuple: Period label & summary, None for those not shown
+        """
+        label = self.get_period_text(i) if self.period_label else None
+        summary = None
+        if self.period_summary_func:
+            summary = self.get_period_summary(i)["s"]
+        return label, summary
+
     def show_period(self, i: int) -> None:
         """
         Show period label on plot
@@ -529,14 +1411,7 @@ class _BaseChart:
             ValueError: If custom period label location is used must contain `x`, `y` and `s` in dictionary.
         """
         if self.period_label:
-            if self.period_fmt:
-                idx_val = self.df.index[i]
-                if self.df.index.dtype.kind == "M":  # Date time
-                    s = idx_val.strftime(self.period_fmt)
-                else:
-                    s = self.period_fmt.format(x=idx_val)
-            else:
-                s = self.df.index.astype(str)[i]
+            s = self.get_period_text(i)
             num_texts = len(self.ax.texts)
             if num_texts == 0:
                 # first frame
@@ -549,14 +1424,7 @@ class _BaseChart:
                 self.ax.texts[0].set_text(s)
 
         if self.period_summary_func:
-            values = self.df.iloc[i]
-            text_dict = self.period_summary_func(values)
-            if "x" not in text_dict or "y" not in text_dict or "s" not in text_dict:
-                name = self.period_summary_func.__name__
-                raise ValueError(
-                    f"The dictionary returned from `{name}` must contain "
-                    '"x", "y", and "s"'
-                )
+            text_dict = self.get_period_summary(i)
             if len(self.ax.texts) != 2:
                 self.ax.text(transform=self.ax.transAxes, **text_dict)
             else:
@@ -571,56 +1439,243 @@ class _BaseChart:
         for ax in self.fig.axes:
             for item in ax.lines + ax.collections + ax.containers + ax.texts:
                 item.remove()
+        self._first_frame = 0
     
-    def save(self, filename: str) -> None:
+    def save(
+        self, filename: str, frame_cache: "FrameCache" = None, append: bool = False
+    ) -> None:
         """ Save method for FuncAnimation.
 
         Args:
             filename (str): File name with extension to save animation to, supported formats at https://matplotlib.org/3.1.1/api/animation_api.html
+            frame_cache (typing.Union[FrameCache, str], optional): Cache (or directory for one) to reuse frames whose data and styling are unchanged since a previous save. Only supported for GIFs and the ffmpeg writer. Defaults to None.
+            append (bool, optional): If the data extends the data previously saved to `filename`, only render frames for the new periods and append them to the file without re-encoding it. Only supported for GIFs and the ffmpeg writer. Defaults to False.
+        """
+        for _ in self.iter_save(filename, frame_cache, append):
+            pass
+
+    def save_many(
+        self, outputs: typing.Dict[str, typing.Dict[str, typing.Any]]
+    ) -> None:
+        """ Save the animation to several files at once, drawing each frame only once
+
+        Each frame is handed to every output on worker threads while the next frame is drawn, and outputs are finished in parallel. Animations are written as GIFs or videos with ffmpeg, files with an extension in `STILL_EXTENSIONS` get a single frame. If only stills are saved, only their frames are drawn.
+
+        Example:
+            ``chart.save_many({"race.mp4": {}, "race.gif": {"scale": 0.5}, "poster.png": {"frame": -1}})``
+
+        Args:
+            outputs (typing.Dict[str, typing.Dict[str, typing.Any]]): Options for each file name with extension. `scale` resizes frames by a factor, `frame` is the frame number of a still, counting from the end if negative. Stills default to the last frame.
+
+        Raises:
+            ValueError: If an output has options other than `scale` & `frame`, or `frame` is given for an animation
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait
+
+        from PIL import Image
+
+        from .encoders import get_encoder
+
+        frames = self.get_frames()
+        interval = self.period_length / self.steps_per_period
+        self.fps = 1000 / interval
+        encoders, stills, scales = {}, {}, {}
+        for filename, options in outputs.items():
+            unknown = set(options) - {"scale", "frame"}
+            if unknown:
+                raise ValueError(
+                    f"Unknown options {sorted(unknown)} for '{filename}', use 'scale' or 'frame'"
+                )
+            scales[filename] = options.get("scale", 1)
+            if filename.split(".")[-1].lower() in STILL_EXTENSIONS:
+                stills[filename] = frames[options.get("frame", -1)]
+            elif "frame" in options:
+                raise ValueError(
+                    f"'frame' is only used for still images ({', '.join(STILL_EXTENSIONS)}), not '{filename}'"
+                )
+            else:
+                encoders[filename] = get_encoder(
+                    filename, self.fps, interval, colors=self.get_palette_colors()
+                )
+        if not encoders:
+            frames = sorted(set(stills.values()))
+
+        def scale_image(image: Image.Image, scale: float) -> Image.Image:
+            if scale == 1:
+                return image
+            size = tuple(max(1, round(length * scale)) for length in image.size)
+            return image.resize(size, Image.LANCZOS)
+
+        def add_frame(filename: str, image: typing.Optional[Image.Image]) -> None:
+            if image is None:
+                encoders[filename].repeat_frame()
+            else:
+                encoders[filename].add_frame(scale_image(image, scales[filename]))
+
+        def save_still(filename: str, image: Image.Image) -> None:
+            image = scale_image(image, scales[filename])
+            if filename.split(".")[-1].lower() in ("jpg", "jpeg"):
+                image = image.convert("RGB")
+            image.save(filename)
+
+        if self.enable_progress_bar:
+            self.setup_progress_bar()
+        pending = []
+        with ThreadPoolExecutor(len(outputs)) as pool:
+            try:
+                images = self.iter_frame_images(frames=frames, skip_repeated=True)
+                for i, image in zip(frames, images):
+                    # Outputs take frames in order, so the previous frame must be written first
+                    for future in pending:
+                        future.result()
+                    if image is not None:
+                        # Decoded once here rather than lazily by each thread
+                        image.load()
+                        last_image = image
+                    pending = [pool.submit(add_frame, name, image) for name in encoders]
+                    pending += [
+                        pool.submit(save_still, name, last_image)
+                        for name, frame in stills.items()
+                        if frame == i
+                    ]
+                for future in pending:
+                    future.result()
+                pending = [pool.submit(encoder.finish) for encoder in encoders.values()]
+                for future in pending:
+                    future.result()
+            except BaseException:
+                wait(pending)
+                for encoder in encoders.values():
+                    encoder.abort()
+                raise
+        if self.enable_progress_bar:
+            self.progress_bar.close()
+        self.clearing()
+
+    async def save_async(
+        self,
+        filename: str,
+        frame_cache: "FrameCache" = None,
+        append: bool = False,
+        executor: "concurrent.futures.Executor" = None,
+        timeout: float = None,
+        progress_callback: typing.Callable[["SaveProgress"], None] = None,
+    ) -> None:
+        """ Save without blocking the event loop, see `iter_save_async`
+
+        Example:
+            ``await df.plot_animated().save_async("race.gif", timeout=60)``
+
+        Args:
+            filename (str): File name with extension to save animation to
+            frame_cache (typing.Union[FrameCache, str], optional): See `save`. Defaults to None.
+            append (bool, optional): See `save`. Defaults to False.
+            executor (concurrent.futures.Executor, optional): Executor to draw frames in. Defaults to the event loop's default executor.
+            timeout (float, optional): Seconds allowed for the whole save before raising `asyncio.TimeoutError`. Defaults to None.
+            progress_callback (typing.Callable[[SaveProgress], None], optional): Called in the event loop with progress after each frame. Defaults to None.
+        """
+        async for progress in self.iter_save_async(
+            filename, frame_cache, append, executor=executor, timeout=timeout
+        ):
+            if progress_callback is not None:
+                progress_callback(progress)
+
+    def iter_save_async(
+        self,
+        filename: str,
+        frame_cache: "FrameCache" = None,
+        append: bool = False,
+        executor: "concurrent.futures.Executor" = None,
+        timeout: float = None,
+    ) -> typing.AsyncIterator["SaveProgress"]:
+        """ Save without blocking the event loop, yielding progress after each frame
+
+        Frames are drawn one at a time in `executor`. On cancellation, timeout or closing the iterator, the save stops after the frame being drawn and partial output is removed. Videos are written with ffmpeg frame by frame so they can be stopped too, other writers save in a single step.
+
+        Args:
+            filename (str): File name with extension to save animation to
+            frame_cache (typing.Union[FrameCache, str], optional): See `save`. Defaults to None.
+            append (bool, optional): See `save`. Defaults to False.
+            executor (concurrent.futures.Executor, optional): Executor to draw frames in. Defaults to the event loop's default executor.
+            timeout (float, optional): Seconds allowed for the whole save before raising `asyncio.TimeoutError`. Defaults to None.
+
+        Returns:
+            typing.AsyncIterator[SaveProgress]: Progress after each frame
+        """
+        return _iter_steps_async(
+            self.iter_save(filename, frame_cache, append, stepwise=True),
+            executor,
+            timeout,
+        )
+
+    def iter_save(
+        self,
+        filename: str,
+        frame_cache: "FrameCache" = None,
+        append: bool = False,
+        stepwise: bool = False,
+    ) -> typing.Iterator["SaveProgress"]:
+        """ Save the animation, yielding progress after each frame written
+
+        Args:
+            filename (str): File name with extension to save animation to, see `save`
+            frame_cache (typing.Union[FrameCache, str], optional): See `save`. Defaults to None.
+            append (bool, optional): See `save`. Defaults to False.
+            stepwise (bool, optional): Write videos frame by frame with ffmpeg instead of in a single step with `FuncAnimation.save`. Defaults to False.
+
+        Yields:
+            SaveProgress: Number of frames written so far
         """
 
         # Inspiration for design pattern https://github.com/altair-viz/altair/blob/c55707730935159e4e2d2c789a6dd2bc3f1ec0f2/altair/utils/save.py
         # https://altair-viz.github.io/user_guide/saving_charts.html
-        
+
         if self.enable_progress_bar:
             self.setup_progress_bar()
 
+        if isinstance(frame_cache, str):
+            from .cache import FrameCache
+
+            frame_cache = FrameCache(frame_cache)
+        if (frame_cache is not None or append) and self.writer not in (None, "ffmpeg"):
+            import warnings
+
+            warnings.warn(
+                f"`frame_cache` and `append` are only supported for GIFs and the ffmpeg writer, rendering all frames using {self.writer}"
+            )
+            frame_cache = None
+            append = False
+
         anim = self.make_animation(self.get_frames(), self.init_func)
         self.fps = 1000 / self.period_length * self.steps_per_period
-        interval = self.period_length / self.steps_per_period
-        num_frames = len(self.get_frames())
 
         extension = filename.split(".")[-1]
+        num_frames = len(self.get_frames())
+        # Other writers can only save all frames in one go
+        stepwise = stepwise and self.writer in (None, "ffmpeg")
+        # Repeated frames are only skipped when frames are written one by one
+        repeats = self.writer in (None, "ffmpeg") and self.get_repeated_frames().any()
         try:
-            if self.writer:
+            if (
+                self.writer
+                and frame_cache is None
+                and not append
+                and not stepwise
+                and not repeats
+            ):
                 anim.save(filename, fps=self.fps, dpi=self.dpi, writer=self.writer)
+                yield SaveProgress(filename, num_frames, num_frames)
+            elif (
+                extension == "gif"
+                or frame_cache is not None
+                or append
+                or stepwise
+                or repeats
+            ):
+                yield from self.iter_save_frames(filename, frame_cache, append)
             else:
-                if extension == "gif":
-                    import io
-                    import matplotlib
-
-                    matplotlib.use("Agg")
-                    from PIL import Image
-
-                    frames = []
-                    for i in range(0, num_frames):
-                        self.anim_func(i)
-                        buffer = io.BytesIO()
-                        self.fig.savefig(buffer, format="png")
-                        buffer.seek(0)
-                        image = Image.open(buffer)
-                        plt.close()
-                        frames.append(image)
-                    frames[0].save(
-                        filename,
-                        save_all=True,
-                        append_images=frames[:],
-                        optimize=False,
-                        duration=interval,
-                        loop=0,
-                    )
-                else:
-                    anim.save(filename, fps=self.fps, dpi=self.dpi)
+                anim.save(filename, fps=self.fps, dpi=self.dpi)
+                yield SaveProgress(filename, num_frames, num_frames)
             if self.enable_progress_bar:
                 self.progress_bar.close()
             # Clearing axes contents after save, so that fig's axes can be re-used in a 
@@ -0,0 +1,160 @@
+""" Render many charts across a pool of worker processes or threads
+
+Each worker process imports pandas_alive & warms matplotlib's font cache once, then renders jobs one after another. Workers reuse the measured figure layout between charts whose styling & labels match, so only the first of many similar charts pays for measuring it.
+
+Charts only draw on their own figures & Agg canvases and don't change matplotlib's global state (rcParams, unit converters or pyplot's figures), so independent charts can also be rendered on threads of one process with `threads=True`.
+
+Example:
+    ``results = pandas_alive.render_batch([(df, {"kind": "race"}, f"{region}.gif") for region, df in frames.items()], workers=8)``
+"""
+
+import typing
+
+import attr
+import pandas as pd
+
+
+@attr.s
+class BatchJob:
+    """
+    Chart to render in a batch
+
+    Args:
+        data (typing.Union[pd.DataFrame, str]): DataFrame to plot, or path to a CSV (index in the first column), pickle or Parquet file to read it from in the worker
+        kwargs (typing.Dict[str, typing.Any]): Chart options as per :func: pandas_alive.plotting.plot
+        output (str): File name with extension to save the animation to
+    """
+
+    data: typing.Union[pd.DataFrame, str] = attr.ib()
+    kwargs: typing.Dict[str, typing.Any] = attr.ib()
+    output: str = attr.ib()
+
+
+@attr.s
+class BatchResult:
+    """
+    Outcome of rendering a `BatchJob`
+
+    Args:
+        output (str): File name the animation was saved to
+        error (str): Formatted traceback if rendering failed, otherwise None
+        seconds (float): Time taken to read the data, create & save the chart
+    """
+
+    output: str = attr.ib()
+    error: typing.Optional[str] = attr.ib()
+    seconds: float = attr.ib()
+
+    @property
+    def ok(self) -> bool:
+        """ Whether the chart was rendered without error
+        """
+        return self.error is None
+
+
+def _read_data(path: str) -> pd.DataFrame:
+    """ Read DataFrame from a file by its extension
+
+    Args:
+        path (str): Path to a `.csv`, `.pkl`/`.pickle` or `.parquet` file
+
+    Raises:
+        ValueError: If the extension isn't supported
+
+    Returns:
+        pd.DataFrame: DataFrame read from `path`
+    """
+    extension = path.split(".")[-1].lower()
+    if extension == "csv":
+        return pd.read_csv(path, index_col=0, parse_dates=[0])
+    if extension in ("pkl", "pickle"):
+        return pd.read_pickle(path)
+    if extension == "parquet":
+        return pd.read_parquet(path)
+    raise ValueError(f"Can't read data from '{path}', use a CSV, pickle or Parquet file")
+
+
+def init_worker() -> None:
+    """ Warm up a worker process before it renders its first job
+
+    Imports are done & matplotlib's fonts are loaded by drawing a throwaway figure with text, and the layout cache is enabled so similar charts reuse their measured layout. Pass as `initializer` when creating your own executor for `render_batch`.
+    """
+    import io
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from . import _base_chart
+
+    fig = Figure()
+    fig.text(0.5, 0.5, "0123456789")
+    FigureCanvasAgg(fig).print_figure(io.BytesIO(), format="png")
+    _base_chart._enable_layout_cache()
+
+
+def render_job(job: BatchJob) -> BatchResult:
+    """ Render a single job, capturing any error instead of raising it
+
+    Args:
+        job (BatchJob): Job to render
+
+    Returns:
+        BatchResult: Outcome of the job
+    """
+    import time
+    import traceback
+
+    from .plotting import plot
+
+    start = time.perf_counter()
+    try:
+        data = job.data
+        if not isinstance(data, (pd.DataFrame, pd.Series)):
+            data = _read_data(data)
+        kwargs = dict(job.kwargs)
+        kwargs.setdefault("enable_progress_bar", False)
+        plot(data, filename=job.output, **kwargs)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return BatchResult(job.output, error, time.perf_counter() - start)
+
+
+def render_batch(
+    jobs: typing.Iterable[
+        typing.Union[
+            BatchJob,
+            typing.Tuple[
+                typing.Union[pd.DataFrame, str], typing.Dict[str, typing.Any], str
+            ],
+        ]
+    ],
+    workers: int = None,
+    executor: "concurrent.futures.Executor" = None,
+    threads: bool = False,
+) -> typing.List[BatchResult]:
+    """
+    Render many charts in parallel across worker processes or threads
+
+    A failing job doesn't stop the batch, its traceback is returned in its result.
+
+    Example:
+        ``pandas_alive.render_batch([("north.csv", {"kind": "race"}, "north.gif"), ("south.csv", {"kind": "race"}, "south.gif")], workers=2)``
+
+    Args:
+        jobs (typing.Iterable[typing.Union[BatchJob, typing.Tuple]]): Jobs, or (data, kwargs, output) tuples, see `BatchJob`
+        workers (int, optional): Number of worker processes or threads. Defaults to the number of CPUs (see `concurrent.futures` for the default number of threads).
+        executor (concurrent.futures.Executor, optional): Existing pool of processes or threads to keep warm between batches, created with `initializer=pandas_alive.batch.init_worker`. Defaults to None.
+        threads (bool, optional): Render on threads of this process instead of worker processes, DataFrames aren't pickled but drawing shares matplotlib's lock on its fonts. Defaults to False.
+
+    Returns:
+        typing.List[BatchResult]: Results in the same order as `jobs`
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    jobs = [job if isinstance(job, BatchJob) else BatchJob(*job) for job in jobs]
+    if executor is not None:
+        return list(executor.map(render_job, jobs))
+    pool_class = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    with pool_class(workers, initializer=init_worker) as pool:
+        return list(pool.map(render_job, jobs))
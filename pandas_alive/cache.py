@@ -0,0 +1,259 @@
+""" On-disk caches shared by all chart types
+
+This module contains a content-addressed frame cache, so re-rendering a chart only redraws frames whose data or styling changed, and a cache of map geometries simplified for the resolution they're drawn at.
+
+Example:
+    ``df.plot_animated(filename="race.gif", frame_cache=pandas_alive.FrameCache("~/.cache/pandas_alive"))``
+"""
+
+import hashlib
+import os
+import tempfile
+import typing
+
+import attr
+import numpy as np
+import pandas as pd
+from matplotlib.colors import Colormap
+
+
+def _update_hash(hasher: typing.Any, obj: typing.Any) -> None:
+    """ Feed an object into a hash in a way that is stable between Python sessions
+
+    Args:
+        hasher (typing.Any): Hash object from `hashlib` to update
+        obj (typing.Any): Object to feed, containers are walked recursively
+    """
+    hasher.update(type(obj).__name__.encode())
+    if obj is None or isinstance(obj, (bool, int, float, str, np.generic)):
+        hasher.update(repr(obj).encode())
+    elif isinstance(obj, bytes):
+        hasher.update(obj)
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"{obj.dtype.str}{obj.shape}".encode())
+        if obj.dtype.kind == "O":
+            hasher.update(repr(obj.tolist()).encode())
+        else:
+            hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        if isinstance(obj, pd.DataFrame):
+            _update_hash(hasher, obj.columns)
+        _update_hash(hasher, pd.util.hash_pandas_object(obj).values)
+    elif isinstance(obj, Colormap):
+        _update_hash(hasher, obj.name)
+        _update_hash(hasher, obj(np.arange(obj.N)))
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=repr):
+            _update_hash(hasher, key)
+            _update_hash(hasher, obj[key])
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj
+        for item in items:
+            _update_hash(hasher, item)
+    elif callable(obj) and hasattr(obj, "__code__"):
+        # Hash the function body so editing a summary function invalidates frames
+        hasher.update(f"{obj.__module__}.{obj.__qualname__}".encode())
+        hasher.update(obj.__code__.co_code)
+        _update_hash(hasher, [c for c in obj.__code__.co_consts if not callable(c)])
+    else:
+        hasher.update(repr(obj).encode())
+
+
+def make_key(*parts: typing.Any) -> str:
+    """ Create a content-address from any number of parts
+
+    Args:
+        *parts (typing.Any): Objects (arrays, DataFrames, dicts of parameters, etc) that determine the cached content
+
+    Returns:
+        str: Hex digest suitable for use as a file name
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        _update_hash(hasher, part)
+    return hasher.hexdigest()
+
+
+@attr.s
+class _DiskCache:
+    """
+    Content-addressed store of bytes on local disk with size-bounded LRU eviction
+
+    Recency is tracked with file modification times, so a cache directory can be shared between processes and sessions.
+
+    Args:
+        path (str): Directory to store entries in, will be created if missing
+        max_bytes (int, optional): Upper bound for the total size of entries on disk. Defaults to 1 GiB.
+    """
+
+    suffix = ".bin"
+
+    path: str = attr.ib(
+        converter=lambda path: os.path.abspath(os.path.expanduser(str(path)))
+    )
+    max_bytes: int = attr.ib(default=2 ** 30)
+
+    def __attrs_post_init__(self):
+        """ Create the cache directory and defer measuring it until first write
+        """
+        os.makedirs(self.path, exist_ok=True)
+        self._size = None
+
+    def get_path(self, key: str) -> str:
+        """ Location on disk of the entry for `key`
+
+        Args:
+            key (str): Key as returned by `make_key`
+
+        Returns:
+            str: Path to entry
+        """
+        return os.path.join(self.path, key + self.suffix)
+
+    def get(self, key: str) -> typing.Optional[bytes]:
+        """ Read an entry, marking it as recently used
+
+        Args:
+            key (str): Key as returned by `make_key`
+
+        Returns:
+            typing.Optional[bytes]: Stored content or None if not cached
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            # Missing or evicted by another process in the meantime
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """ Store an entry, evicting least recently used entries if the cache grows beyond `max_bytes`
+
+        Args:
+            key (str): Key as returned by `make_key`
+            data (bytes): Content to store
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.get_path(key))
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self.get_path(key))
+
+    def _entries(self) -> typing.List[typing.Tuple[str, int, float]]:
+        """ List entries on disk
+
+        Returns:
+            typing.List[typing.Tuple[str, int, float]]: Path, size in bytes and last access time of each entry
+        """
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(self.suffix):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def evict(self) -> None:
+        """ Remove least recently used entries until the cache is within 90% of `max_bytes`
+
+        Evicting below the bound avoids rescanning the directory on every subsequent write.
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(entry[1] for entry in entries)
+        target = self.max_bytes * 0.9
+        for path, entry_size, _ in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+    def clear(self) -> None:
+        """ Remove all entries from the cache
+        """
+        for path, _, _ in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._size = 0
+
+
+@attr.s
+class FrameCache(_DiskCache):
+    """
+    On-disk cache of encoded (PNG) animation frames
+
+    Frames are keyed by a hash of the data that determines them (see `_BaseChart.get_frame_data`) and the chart's style parameters, so a later `save` only redraws frames whose data or styling changed.
+
+    Example:
+        ``df.plot_animated(filename="race.mp4", frame_cache=FrameCache("~/.cache/pandas_alive", max_bytes=5 * 2 ** 30))``
+
+    Args:
+        path (str): Directory to store cached frames in, will be created if missing
+        max_bytes (int, optional): Upper bound for the total size of cached frames on disk. Defaults to 1 GiB.
+    """
+
+    suffix = ".png"
+
+
+@attr.s
+class GeometryCache(_DiskCache):
+    """
+    On-disk cache of map geometries simplified for a resolution, see `MapChart.simplify_geometries`
+
+    Geometries are stored as well-known binary (WKB), keyed by a hash of the original geometries and the simplification tolerance & extent.
+
+    Example:
+        ``gdf.plot_animated(filename="map.gif", simplify=True, geometry_cache="~/.cache/pandas_alive/geometries")``
+
+    Args:
+        path (str): Directory to store simplified geometries in, will be created if missing
+        max_bytes (int, optional): Upper bound for the total size of cached geometries on disk. Defaults to 1 GiB.
+    """
+
+    suffix = ".wkb"
+
+    def get_wkb(self, key: str) -> typing.Optional[typing.List[bytes]]:
+        """ Read the WKB of each geometry stored with `put_wkb`
+
+        Args:
+            key (str): Key as returned by `make_key`
+
+        Returns:
+            typing.Optional[typing.List[bytes]]: WKB of each geometry or None if not cached
+        """
+        data = self.get(key)
+        if data is None:
+            return None
+        count = int(np.frombuffer(data, dtype="<i8", count=1)[0])
+        lengths = np.frombuffer(data, dtype="<i8", count=count, offset=8)
+        ends = 8 * (count + 1) + np.cumsum(lengths)
+        return [data[end - length : end] for end, length in zip(ends, lengths)]
+
+    def put_wkb(self, key: str, wkbs: typing.Sequence[bytes]) -> None:
+        """ Store the WKB of each geometry, prefixed by their number & lengths
+
+        Args:
+            key (str): Key as returned by `make_key`
+            wkbs (typing.Sequence[bytes]): WKB of each geometry
+        """
+        lengths = np.array([len(wkb) for wkb in wkbs], dtype="<i8")
+        header = np.array([len(wkbs)], dtype="<i8").tobytes() + lengths.tobytes()
+        self.put(key, header + b"".join(wkbs))
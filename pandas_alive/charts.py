@@ -4,27 +4,21 @@ This module contains functions for chart types.
 
 """
 
-import datetime
 import typing
 from typing import Mapping
 
 import attr
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-import matplotlib.units as munits
 import numpy as np
 import pandas as pd
 from matplotlib import colors, ticker, transforms
 from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import Colormap
 
 from ._base_chart import _BaseChart
-
-# For conciseDateFormatter for all plots https://matplotlib.org/3.1.0/gallery/ticks_and_spines/date_concise_formatter.html
-converter = mdates.ConciseDateConverter()
-munits.registry[np.datetime64] = converter
-munits.registry[datetime.date] = converter
-munits.registry[datetime.datetime] = converter
+from .raster import SpriteText
 
 
 @attr.s()
@@ -46,6 +40,7 @@ class BarChartRace(_BaseChart):
     fixed_order: typing.Union[list, bool] = attr.ib()
 
     perpendicular_bar_func: typing.Callable = attr.ib()
+    engine: str = attr.ib(default="agg")
 
     def __attrs_post_init__(self):
         """ Properties to be determined after initialization
@@ -98,6 +93,7 @@ class BarChartRace(_BaseChart):
         Raises:
             ValueError: If sort value is not provided (either 'asc' or 'desc')
             ValueError: Orientation must be 'h' (horizontal) or 'v' (vertical)
+            ValueError: Engine must be 'agg' or 'raster'
         """
         super().validate_params()
 
@@ -107,6 +103,9 @@ class BarChartRace(_BaseChart):
         if self.orientation not in ("h", "v"):
             raise ValueError('`orientation` must be "h" or "v"')
 
+        if self.engine not in ("agg", "raster"):
+            raise ValueError('`engine` must be "agg" or "raster"')
+
     def get_colors(
         self, cmap: typing.Union[str, Colormap, typing.List[str]]
     ) -> np.array:
@@ -170,8 +169,9 @@ class BarChartRace(_BaseChart):
             typing.Tuple[plt.figure,plt.axes]: Figure & axes instance
         """
         fig = plt.Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(fig)
         limit = (0.2, self.n_visible + 0.8)
-        rect = self.calculate_new_figsize(fig)
+        rect = self.layout_figure(fig)
         ax = fig.add_axes(rect)
         if self.orientation == "h":
             ax.set_ylim(limit)
@@ -195,6 +195,14 @@ class BarChartRace(_BaseChart):
             spine.set_visible(False)
         return fig, ax
 
+    def get_layout_key(self) -> typing.Tuple:
+        """ Layout also depends on orientation and bar labels skip missing values
+
+        Returns:
+            typing.Tuple: Hashable layout key
+        """
+        return super().get_layout_key() + (self.orientation, str(self.df.max().max()))
+
     def calculate_new_figsize(self, real_fig: plt.figure) -> typing.List[float]:
         """ Calculate figure size to allow for labels, etc
 
@@ -208,6 +216,7 @@ class BarChartRace(_BaseChart):
 
         # df_values = self.prepare_data()
         fig = plt.Figure(figsize=self.figsize)
+        FigureCanvasAgg(fig)
         # if self.title:
         # fig.tight_layout(rect=[0, 0, 1, 0.9])  # To include title
         ax = fig.add_subplot()
@@ -260,11 +269,14 @@ class BarChartRace(_BaseChart):
         ax.set_title(self.title)
         fig.canvas.print_figure(io.BytesIO())
 
-    def plot_bars(self, i: int) -> None:
-        """ Plot bars in bar chart race on axes
+    def get_visible_bars(self, i: int) -> typing.Tuple:
+        """ Bars shown in frame `i`, in column order
 
         Args:
-            i (int): index of current frame in animation
+            i (int): Frame number
+
+        Returns:
+            typing.Tuple: Rank, value, column name & color of each visible bar
         """
         bar_location = self.df_rank.iloc[i].values
 
@@ -276,6 +288,57 @@ class BarChartRace(_BaseChart):
         bar_length = self.df.iloc[i].values[top_filt]
         cols = self.df.columns[top_filt]
         colors = self.bar_colors[top_filt]
+        return bar_location, bar_length, cols, colors
+
+    def calculate_perpendicular_values(
+        self, df: pd.DataFrame, df_rank: pd.DataFrame
+    ) -> np.ndarray:
+        """ Position of the perpendicular bar in each frame, for string aggregations & `vectorized` functions
+
+        Aggregations are calculated along rows with bars that aren't visible masked out, the same as aggregating each frame's visible bars.
+
+        Args:
+            df (pd.DataFrame): Values of frames, one row per frame
+            df_rank (pd.DataFrame): Ranks of frames
+
+        Returns:
+            np.ndarray: Value the perpendicular bar is drawn at in each frame
+        """
+        if not isinstance(self.perpendicular_bar_func, str):
+            return np.asarray(self.perpendicular_bar_func(df, df_rank), dtype=float)
+        ranks = df_rank.values
+        # Same bars as `get_visible_bars`, missing ranks aren't visible
+        visible = (ranks > 0) & (ranks < self.n_visible + 1)
+        visible_values = pd.DataFrame(np.where(visible, df.values, np.nan))
+        return visible_values.agg(self.perpendicular_bar_func, axis=1).values
+
+    def get_perpendicular_value(self, i: int) -> float:
+        """ Position of the perpendicular bar in frame `i`, from `perpendicular_bar_func`
+
+        String aggregations & `vectorized` functions are calculated for all frames the first time, other functions are called with frame `i`'s values & ranks.
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            float: Value the perpendicular bar is drawn at
+        """
+        func = self.perpendicular_bar_func
+        if not isinstance(func, str) and not getattr(func, "vectorized", False):
+            return func(self.df.iloc[i], self.df_rank.iloc[i])
+        if getattr(self, "_perpendicular_values", None) is None:
+            self._perpendicular_values = self.calculate_perpendicular_values(
+                self.df, self.df_rank
+            )
+        return self._perpendicular_values[i]
+
+    def plot_bars(self, i: int) -> None:
+        """ Plot bars in bar chart race on axes
+
+        Args:
+            i (int): index of current frame in animation
+        """
+        bar_location, bar_length, cols, colors = self.get_visible_bars(i)
 
         if self.orientation == "h":
             self.ax.barh(
@@ -325,23 +388,23 @@ class BarChartRace(_BaseChart):
                     ha = "center"
                     va = "bottom"
                 xtext, ytext = self.ax.transLimits.inverted().transform((xtext, ytext))
-                self.ax.text(
-                    xtext,
-                    ytext,
-                    text,
-                    ha=ha,
-                    rotation=rotation,
-                    fontsize=self.bar_label_size,
-                    va=va,
+                # Values only repeat between some frames, so they're only cached once drawn twice
+                self.ax._add_text(
+                    SpriteText(
+                        xtext,
+                        ytext,
+                        text,
+                        ha=ha,
+                        rotation=rotation,
+                        fontsize=self.bar_label_size,
+                        va=va,
+                        sprite_cache=self.get_sprite_cache(),
+                        min_uses=2,
+                    )
                 )
 
         if self.perpendicular_bar_func:
-            if isinstance(self.perpendicular_bar_func, str):
-                val = pd.Series(bar_length).agg(self.perpendicular_bar_func)
-            else:
-                values = self.df.iloc[i]
-                ranks = self.df_rank.iloc[i]
-                val = self.perpendicular_bar_func(values, ranks)
+            val = self.get_perpendicular_value(i)
 
             if not self.ax.lines:
                 if self.orientation == "h":
@@ -355,6 +418,176 @@ class BarChartRace(_BaseChart):
                 else:
                     line.set_ydata([val] * 2)
 
+    def get_frame_data(self, i: int) -> typing.Tuple:
+        """ Bar chart races only show the current row's values and ranks
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            typing.Tuple: Hashes of values & ranks of frame `i`
+        """
+        return (self.get_row_hashes()[i], self.get_rank_hashes()[i])
+
+    def hold_frames(self, rows: np.ndarray) -> None:
+        """ Ranks are held along with values
+
+        Args:
+            rows (np.ndarray): Row to show in each frame
+        """
+        super().hold_frames(rows)
+        self.df_rank = self.df_rank.iloc[rows]
+        self._rank_hashes = None
+        self._perpendicular_values = None
+
+    def apply_preview(self) -> None:
+        """ Bar labels aren't drawn in previews either
+        """
+        super().apply_preview()
+        self.label_bars = False
+
+    def get_rank_hashes(self) -> np.ndarray:
+        """ Hash of the ranks of each frame, calculated once
+
+        Returns:
+            np.ndarray: Array of uint64 hashes, one per frame
+        """
+        if getattr(self, "_rank_hashes", None) is None:
+            self._rank_hashes = pd.util.hash_pandas_object(
+                self.df_rank, index=False
+            ).values
+        return self._rank_hashes
+
+    def get_repeated_frames(self) -> np.ndarray:
+        """ Bar chart races only show the current row, frames repeat when values, ranks and period texts do
+
+        Returns:
+            np.ndarray: Boolean for each frame
+        """
+        return self.get_repeated_periods(
+            pd.util.hash_pandas_object(self.df, index=False).values,
+            self.get_rank_hashes(),
+        )
+
+    def push_period(
+        self,
+        period: typing.Any,
+        values: typing.Union[pd.Series, Mapping],
+        max_periods: int = None,
+    ) -> range:
+        """ Extend the chart with a new period, ranking only the new period
+
+        Args:
+            period (typing.Any): Index value of the new period
+            values (typing.Union[pd.Series, Mapping]): Values of the new period for each column
+            max_periods (int, optional): Only keep this many periods of history. Defaults to None.
+
+        Returns:
+            range: Frames added for the new period
+        """
+        frames = super().push_period(period, values, max_periods)
+        if self.fixed_order:
+            new_ranks = self.df_rank.iloc[[-1] * len(frames)]
+        else:
+            new_ranks = self.calculate_ranks(self.orig_df.iloc[-2:]).iloc[1:]
+        self.df_rank = pd.concat([self.df_rank, new_ranks]).iloc[-len(self.df) :]
+        self._rank_hashes = None
+        if getattr(self, "_perpendicular_values", None) is not None:
+            # Only calculated for the new frames
+            new_values = self.calculate_perpendicular_values(
+                self.df.iloc[-len(frames) :], self.df_rank.iloc[-len(frames) :]
+            )
+            self._perpendicular_values = np.concatenate(
+                [self._perpendicular_values, new_values]
+            )[-len(self.df) :]
+        return frames
+
+    def get_sprite_cache(self) -> "SpriteCache":
+        """ Cache of the chart's text sprites, shared by bar labels drawn with Agg and the raster engine
+
+        Returns:
+            SpriteCache: Sprite cache, kept between saves
+        """
+        from .raster import SpriteCache
+
+        if getattr(self, "_sprite_cache", None) is None:
+            self._sprite_cache = SpriteCache()
+        return self._sprite_cache
+
+    def get_raster_engine(self) -> "RasterBarChartRace":
+        """ Engine drawing frames for `engine="raster"`, set up once for the chart's current resolution
+
+        Returns:
+            RasterBarChartRace: Raster engine
+        """
+        from .raster import RasterBarChartRace
+
+        raster = getattr(self, "_raster", None)
+        if raster is None or raster.dpi != self.dpi:
+            raster = self._raster = RasterBarChartRace(self)
+        return raster
+
+    def render_image(self, i: int) -> "PIL.Image.Image":
+        """ Draw frame `i` with the chart's engine
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            PIL.Image.Image: Rendered frame
+        """
+        from PIL import Image
+
+        if self.engine != "raster":
+            return super().render_image(i)
+        if self.enable_progress_bar:
+            self.update_progress_bar()
+        return Image.fromarray(self.get_raster_engine().draw(i), "RGBA")
+
+    def render_png(self, i: int) -> bytes:
+        """ Draw frame `i` with the chart's engine and encode it to PNG
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            bytes: Encoded PNG image
+        """
+        import io
+
+        if self.engine != "raster":
+            return super().render_png(i)
+        buffer = io.BytesIO()
+        self.render_image(i).save(buffer, format="png")
+        return buffer.getvalue()
+
+    def iter_save(
+        self,
+        filename: str,
+        frame_cache: "FrameCache" = None,
+        append: bool = False,
+        stepwise: bool = False,
+    ) -> typing.Iterator["SaveProgress"]:
+        """ The raster engine only draws frames written one by one, so videos are written stepwise with it
+
+        Args:
+            filename (str): File name with extension to save animation to, see `save`
+            frame_cache (typing.Union[FrameCache, str], optional): See `save`. Defaults to None.
+            append (bool, optional): See `save`. Defaults to False.
+            stepwise (bool, optional): See `_BaseChart.iter_save`. Defaults to False.
+
+        Yields:
+            SaveProgress: Number of frames written so far
+        """
+        stepwise = stepwise or self.engine == "raster"
+        return super().iter_save(filename, frame_cache, append, stepwise)
+
+    def clearing(self):
+        """ The raster engine is set up again for the next save, in case the figure changed
+        """
+        super().clearing()
+        self._raster = None
+
     def anim_func(self, i: int) -> None:
         """ Animation function, removes all bars and updates legend/period annotation.
 
@@ -400,6 +633,7 @@ class ScatterChart(_BaseChart):
         self._points: typing.Dict = {}
         for name in self.data_cols:
             self._points[name] = {"x": [], "y": [], "size": []}
+        self._point_artists: typing.Dict = {}
         if isinstance(self.size, str) and self.size not in self.data_cols:
             raise ValueError(
                 f"Size provided as string: {self.size}, not present in dataframe columns"
@@ -419,9 +653,8 @@ class ScatterChart(_BaseChart):
         if not self.fixed_max:
             super().set_x_y_limits(self.df, i, self.ax)
         # If fixed_max is true then run it once to improve performance
-        elif i == 0:
+        elif self.is_first_frame(i):
             super().set_x_y_limits(self.df, i, self.ax)
-        j = 0
         for name, color in zip(self.data_cols, self.colors):
             self._points[name]["x"] = self.df[name].index[: i + 1]
             self._points[name]["y"] = self.df[name].iloc[: i + 1]
@@ -429,8 +662,8 @@ class ScatterChart(_BaseChart):
                 self._points[name]["size"] = abs(self.df[self.size].iloc[: i + 1])
             else:
                 self._points[name]["size"] = np.full((i + 1), self.size)
-            if i == 0:
-                self.sc = self.ax.scatter(
+            if self.is_first_frame(i):
+                self.sc = self._point_artists[name] = self.ax.scatter(
                     self._points[name]["x"],
                     self._points[name]["y"],
                     s=self._points[name]["size"],
@@ -446,21 +679,30 @@ class ScatterChart(_BaseChart):
                         handle.set_sizes([15])
             else:
                 # update all points
-                self.ax.collections[j].set_color(color)
+                self._point_artists[name].set_facecolor(color)
                 if isinstance(self.df.index, pd.DatetimeIndex):
                     # date_array = np.c_[mdates.date2num(self._points[name]["x"]), self._points[name]["y"]]
-                    self.ax.collections[j].set_offsets(
+                    self._point_artists[name].set_offsets(
                         np.c_[
                             mdates.date2num(self._points[name]["x"]),
                             self._points[name]["y"],
                         ]
                     )
                 else:
-                    self.ax.collections[j].set_offsets(
+                    self._point_artists[name].set_offsets(
                         np.c_[self._points[name]["x"], self._points[name]["y"]]
                     )
-                self.ax.collections[j].set_sizes(self._points[name]["size"])
-            j += 1
+                self._point_artists[name].set_sizes(self._points[name]["size"])
+
+    def get_style_params(self) -> typing.Dict[str, typing.Any]:
+        """ Vertical limits are padded by a fraction of the entire DataFrame's range, so all frames depend on its extent
+
+        Returns:
+            typing.Dict[str, typing.Any]: Chart style parameters
+        """
+        params = super().get_style_params()
+        params["extent"] = self.get_extent()
+        return params
 
     def anim_func(self, i: int) -> None:
         """ Animation function, plots all scatter points and updates legend/period annotation.
@@ -504,6 +746,8 @@ class LineChart(_BaseChart):
         self._lines: typing.Dict = {}
         for name in self.data_cols:
             self._lines[name] = {"x": [], "y": []}
+        self._line_artists: typing.Dict = {}
+        self._fills: typing.Dict = {}
 
     def plot_line(self, i: int) -> None:
         """ Function for plotting all lines in dataframe
@@ -515,22 +759,22 @@ class LineChart(_BaseChart):
         if not self.fixed_max:
             super().set_x_y_limits(self.df, i, self.ax)
         # If fixed_max is true then run it once to improve performance
-        elif i == 0:
+        elif self.is_first_frame(i):
             super().set_x_y_limits(self.df, i, self.ax)
-        j = 0
         # fills = [""]
         for name, color in zip(self.data_cols, self.line_colors):
             self._lines[name]["x"] = self.df[name].index[: i + 1]
             self._lines[name]["y"] = self.df[name].iloc[: i + 1]
-            if i == 0:
-                self.ax.plot(
+            if self.is_first_frame(i):
+                # `line_width` is plotted as a second line, the column's line is the first
+                self._line_artists[name] = self.ax.plot(
                     self._lines[name]["x"],
                     self._lines[name]["y"],
                     self.line_width,
                     color=color,
                     label=name,
                     **self.kwargs,
-                )
+                )[0]
                 if self.add_legend:
                     handles, labels = self.ax.get_legend_handles_labels()
                     self.ax.legend(handles[::2], labels[::2], fontsize="x-small")
@@ -544,34 +788,26 @@ class LineChart(_BaseChart):
                 #     fills = self.ax.collections[-1]
             else:
                 # update all lines
-                self.ax.lines[j].set_color(color)
-                self.ax.lines[j].set_data(
+                self._line_artists[name].set_color(color)
+                self._line_artists[name].set_data(
                     self._lines[name]["x"], self._lines[name]["y"]
                 )
-            j += 1
             if self.fill_under_line_color:
                 # Fills need to be removed and re-generated, or else `matplotlib`
                 # adds a new one per frame, performance degrades and alpha doesn't show properly.
-                if i == 0:
-                    self.ax.fill_between(
-                        self._lines[name]["x"],
-                        self._lines[name]["y"],
-                        color=self.get_single_color(self.fill_under_line_color),
-                        alpha=0.5,
-                    )
-                    self.fills = self.ax.collections[-1]
-                else:
-                    self.fills.remove()
-                    self.ax.fill_between(
-                        self._lines[name]["x"],
-                        self._lines[name]["y"],
-                        color=self.get_single_color(self.fill_under_line_color),
-                        alpha=0.5,
-                    )
-                    self.fills = self.ax.collections[-1]
+                fill = self._fills.get(name)
+                # Already removed if the axes were reset
+                if fill is not None and fill.axes is not None:
+                    fill.remove()
+                self._fills[name] = self.ax.fill_between(
+                    self._lines[name]["x"],
+                    self._lines[name]["y"],
+                    color=self.get_single_color(self.fill_under_line_color),
+                    alpha=0.5,
+                )
 
         # Set label_events once, it improves loop performance by x 4.
-        if self.label_events and i == 0:
+        if self.label_events and self.is_first_frame(i):
             # from datetime import datetime
             # import numpy as np
 
@@ -592,6 +828,16 @@ class LineChart(_BaseChart):
                     fontsize="x-small",
                 )
 
+    def get_style_params(self) -> typing.Dict[str, typing.Any]:
+        """ Vertical limits are padded by a fraction of the entire DataFrame's range, so all frames depend on its extent
+
+        Returns:
+            typing.Dict[str, typing.Any]: Chart style parameters
+        """
+        params = super().get_style_params()
+        params["extent"] = self.get_extent()
+        return params
+
     def anim_func(self, i: int) -> None:
         """ Animation function, updates all lines and legend/period annotation.
 
@@ -632,6 +878,7 @@ class PieChart(_BaseChart):
         self._wedges: typing.Dict = {}
         for name in self.data_cols:
             self._wedges[name] = {"size": []}
+        self._pie_artists = []
 
     def plot_wedge(self, i: int) -> None:
         """ Function for plotting all lines in dataframe
@@ -640,9 +887,6 @@ class PieChart(_BaseChart):
             i (int): Index of frame for animation
         """
 
-        for text in self.ax.texts[int(bool(self.period_fmt)) :]:
-            text.remove()
-
         # super().set_x_y_limits(self.df, i)
         # print(self.df[self.data_cols].notnull())
         filt_nan = self.df[self.data_cols].iloc[i].notnull()
@@ -655,9 +899,17 @@ class PieChart(_BaseChart):
         for label in wedges.index:
             wedge_color_list.append(self.wedge_colors[label])
 
-        self.ax.pie(
-            wedges.values, labels=wedges.index, colors=wedge_color_list, **self.kwargs
-        )
+        # Wedges, labels & any percentages, removed before the next frame
+        self._pie_artists = [
+            artist
+            for artists in self.ax.pie(
+                wedges.values,
+                labels=wedges.index,
+                colors=wedge_color_list,
+                **self.kwargs,
+            )
+            for artist in artists
+        ]
 
         # for name, color in zip(self.data_cols, self.wedge_colors):
 
@@ -670,6 +922,27 @@ class PieChart(_BaseChart):
         #         **self.kwargs,
         #     )
 
+    def get_frame_data(self, i: int) -> typing.Tuple:
+        """ Pie charts only show the current row
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            typing.Tuple: Hash of row of frame `i`
+        """
+        return (self.get_row_hashes()[i],)
+
+    def get_repeated_frames(self) -> np.ndarray:
+        """ Pie charts only show the current row, frames repeat when values and period texts do
+
+        Returns:
+            np.ndarray: Boolean for each frame
+        """
+        return self.get_repeated_periods(
+            pd.util.hash_pandas_object(self.df, index=False).values
+        )
+
     def anim_func(self, i: int) -> None:
         """ Animation function, removes all wedges and updates legend/period annotation.
 
@@ -678,11 +951,14 @@ class PieChart(_BaseChart):
         """
         if self.enable_progress_bar:
             self.update_progress_bar()
-        for wedge in self.ax.patches:
-            wedge.remove()
-        self.plot_wedge(i)
+        for artist in self._pie_artists:
+            # Already removed if the axes were cleared after a save
+            if artist.axes is not None:
+                artist.remove()
+        # Period texts are drawn before the wedge labels, so they stay first in `ax.texts`
         if self.period_fmt:
             self.show_period(i)
+        self.plot_wedge(i)
 
     def init_func(self) -> None:
         """ Initialization function for animation
@@ -725,15 +1001,15 @@ class BarChart(_BaseChart):
                 self.df.iloc[: i + 1].values.max() + 1e-6,
             )
         # If fixed_max is true then run it once to improve performance
-        elif i == 0:
+        elif self.is_first_frame(i):
             super().set_x_y_limits(self.df, i, self.ax)
             # bars are flat at the bottom/top, so no need to apply a tolerance like
             # with line/scatter charts.
             self.ax.set_ylim(self.df.values.min(), self.df.values.max())
 
         for name, color in zip(self.data_cols, self.bar_colors):
-            self._bars[name]["x"].append(self.df[name].index[i])
-            self._bars[name]["y"].append(self.df[name].iloc[i])
+            self._bars[name]["x"] = self.df[name].index[: i + 1]
+            self._bars[name]["y"] = self.df[name].iloc[: i + 1]
             self.ax.bar(
                 self._bars[name]["x"],
                 self._bars[name]["y"],
@@ -875,7 +1151,10 @@ class BubbleChart(_BaseChart):
         )
         # setting up colorbar when color is a pd column and doesn't exist
         # already from a previous animation run with the same custom figure.
-        if i == 0 and self.color_bar:
+        cbar = getattr(self, "cbar", None)
+        if self.color_bar and (
+            cbar is None or cbar.ax.figure is not self.fig or not cbar.ax.collections
+        ):
             self.cbar = self.fig.colorbar(self.sc)
             # this sets colorbar scales & settings to remain constant for all frames
             self.cbar.ax.tick_params(labelsize="small")
@@ -886,6 +1165,27 @@ class BubbleChart(_BaseChart):
             # this is required for all iterations to update colour on bubbles
             self.sc.set_clim(self.vmin, self.vmax)
 
+    def get_frame_data(self, i: int) -> typing.Tuple:
+        """ Bubble charts only show the current row
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            typing.Tuple: Hash of row of frame `i`
+        """
+        return (self.get_row_hashes()[i],)
+
+    def get_repeated_frames(self) -> np.ndarray:
+        """ Bubble charts only show the current row, frames repeat when values and period texts do
+
+        Returns:
+            np.ndarray: Boolean for each frame
+        """
+        return self.get_repeated_periods(
+            pd.util.hash_pandas_object(self.df, index=False).values
+        )
+
     def anim_func(self, i: int) -> None:
         """ Animation function, removes bubbles and updates legend/period annotation.
 
@@ -0,0 +1,281 @@
+""" Render multiple plots on separate offscreen canvases and composite them into frames
+
+Instead of drawing every subplot on one shared Figure, each plot is drawn on its own Agg canvas sized to its cell of the layout, optionally in a separate worker process per plot. Frames are assembled by copying each panel into its cell of a static background (figure face, suptitle & spacing), which is only drawn once. Anything a plot draws outside of its cell (eg, a date offset label reaching into the next subplot) is clipped.
+
+Example:
+    ``pandas_alive.animate_multiple_plots("dashboard.gif", [bar_chart, line_chart], composite=True)``
+"""
+
+import typing
+
+import numpy as np
+
+# Number of frames each panel renders per task sent to its worker
+CHUNK_SIZE = 8
+
+# Fraction of the space between neighbouring axes given to the axes below or left of it
+GAP_SPLIT = 1 / 3
+
+# Panels set up in this worker process, by panel number
+_panels: typing.Dict[int, typing.Tuple[typing.Any, typing.Any, typing.Tuple]] = {}
+
+
+def get_cells(
+    fig: "plt.Figure", top: float = 1.0
+) -> typing.List[typing.Tuple[float, float, float, float]]:
+    """ Split figure into one cell per axes, each covering its axes and part of the space to its neighbours
+
+    Tick labels are drawn below & left of axes, so the axes above or right of a gap gets most of it and the axes below or left of it gets `GAP_SPLIT`, enough for a title.
+
+    Args:
+        fig (plt.Figure): Figure with the layout of the subplots
+        top (float, optional): Top of the cells touching the top of the figure, in figure coordinates, eg to keep the suptitle out of every cell. Defaults to 1.0.
+
+    Returns:
+        typing.List[typing.Tuple[float, float, float, float]]: (left, bottom, right, top) of each cell in figure coordinates
+    """
+    boxes = [ax.get_position() for ax in fig.axes]
+    cells = []
+    for box in boxes:
+        left, bottom, right, cell_top = 0.0, 0.0, 1.0, top
+        for other in boxes:
+            overlaps_rows = other.y0 < box.y1 and other.y1 > box.y0
+            overlaps_columns = other.x0 < box.x1 and other.x1 > box.x0
+            if overlaps_rows and other.x1 <= box.x0:
+                left = max(left, other.x1 + (box.x0 - other.x1) * GAP_SPLIT)
+            if overlaps_rows and other.x0 >= box.x1:
+                right = min(right, box.x1 + (other.x0 - box.x1) * GAP_SPLIT)
+            if overlaps_columns and other.y1 <= box.y0:
+                bottom = max(bottom, other.y1 + (box.y0 - other.y1) * GAP_SPLIT)
+            if overlaps_columns and other.y0 >= box.y1:
+                cell_top = min(cell_top, box.y1 + (other.y0 - box.y1) * GAP_SPLIT)
+        cells.append((left, bottom, right, cell_top))
+    return cells
+
+
+def render_background(fig: "plt.Figure", dpi: int) -> typing.Tuple[np.ndarray, float]:
+    """ Draw figure without its axes, leaving the figure face, suptitle & spacing
+
+    Args:
+        fig (plt.Figure): Figure with the layout of the subplots
+        dpi (int): Resolution to draw at
+
+    Returns:
+        typing.Tuple[np.ndarray, float]: RGBA image and the bottom of the figure's texts (eg, suptitle) in figure coordinates
+    """
+    import io
+
+    from PIL import Image
+
+    visible = [ax.get_visible() for ax in fig.axes]
+    for ax in fig.axes:
+        ax.set_visible(False)
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=dpi)
+    finally:
+        for ax, was_visible in zip(fig.axes, visible):
+            ax.set_visible(was_visible)
+    buffer.seek(0)
+    background = np.array(Image.open(buffer).convert("RGBA"))
+    top = 1.0
+    for text in fig.texts:
+        if text.get_visible() and text.get_text():
+            extent = text.get_window_extent().transformed(fig.transFigure.inverted())
+            top = min(top, extent.y0)
+    return background, top
+
+
+def setup_panel(
+    plot: "_BaseChart",
+    cell: typing.Tuple[int, int, int, int],
+    axes_bounds: typing.Tuple[float, float, float, float],
+    dpi: int,
+) -> typing.Tuple["FigureCanvasAgg", typing.Tuple[int, int]]:
+    """ Create the offscreen canvas for a plot and initialise the plot on it
+
+    Styling matches the plot's subplot in `animate_multiple_plots`.
+
+    Args:
+        plot (_BaseChart): Plot to draw on the panel
+        cell (typing.Tuple[int, int, int, int]): (top row, bottom row, left column, right column) in pixels of the panel's cell in the frame
+        axes_bounds (typing.Tuple[float, float, float, float]): (left, bottom, width, height) of the axes in the panel's figure coordinates
+        dpi (int): Resolution to draw at
+
+    Returns:
+        typing.Tuple[FigureCanvasAgg, typing.Tuple[int, int]]: Panel canvas and its (height, width) in pixels
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    from .plotting import setup_subplot
+
+    height, width = cell[1] - cell[0], cell[3] - cell[2]
+    # Half a pixel extra so rounding never makes the canvas smaller than the cell
+    fig = plt.Figure(
+        figsize=((width + 0.5) / dpi, (height + 0.5) / dpi),
+        dpi=dpi,
+        tight_layout=False,
+    )
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes(axes_bounds)
+    setup_subplot(plot, ax)
+    plot.init_func()
+    return canvas, (height, width)
+
+
+def render_panel(
+    plot: "_BaseChart",
+    canvas: "FigureCanvasAgg",
+    size: typing.Tuple[int, int],
+    frames: typing.Sequence[int],
+) -> np.ndarray:
+    """ Draw frames of a plot on its panel
+
+    Args:
+        plot (_BaseChart): Plot drawn on the panel
+        canvas (FigureCanvasAgg): Panel canvas
+        size (typing.Tuple[int, int]): (height, width) of the panel in pixels
+        frames (typing.Sequence[int]): Frame numbers to draw in order
+
+    Returns:
+        np.ndarray: RGBA images of shape (frames, height, width, 4)
+    """
+    height, width = size
+    images = np.empty((len(frames), height, width, 4), dtype=np.uint8)
+    for num, frame in enumerate(frames):
+        plot.anim_func(frame)
+        canvas.draw()
+        images[num] = np.asarray(canvas.buffer_rgba())[:height, :width]
+    return images
+
+
+def _init_worker(panels: typing.Dict[int, typing.Tuple]) -> None:
+    """ Set up the panels rendered by this worker process
+
+    Args:
+        panels (typing.Dict[int, typing.Tuple]): Arguments of `setup_panel` by panel number
+    """
+    for num, args in panels.items():
+        plot = args[0]
+        _panels[num] = (plot,) + setup_panel(*args)
+
+
+def _render_worker_panel(num: int, frames: typing.Sequence[int]) -> np.ndarray:
+    """ Draw frames of a panel set up in this worker process, see `render_panel`
+
+    Args:
+        num (int): Panel number
+        frames (typing.Sequence[int]): Frame numbers to draw in order
+
+    Returns:
+        np.ndarray: RGBA images of shape (frames, height, width, 4)
+    """
+    return render_panel(*_panels[num], frames)
+
+
+def iter_composite_frames(
+    fig: "plt.Figure",
+    plots: typing.List["_BaseChart"],
+    num_frames: int,
+    dpi: int,
+    workers: int = None,
+) -> typing.Iterator[np.ndarray]:
+    """ Render each plot on its own panel and yield the frames composited from them
+
+    Args:
+        fig (plt.Figure): Figure with the layout of the subplots, one axes per plot, and suptitle
+        plots (typing.List[_BaseChart]): Plots in the same order as the figure's axes
+        num_frames (int): Number of frames to render
+        dpi (int): Resolution to draw at
+        workers (int, optional): Number of processes to render panels in, panels are shared out between them. 0 renders all panels in this process, as do platforms that can't fork. Defaults to one process per plot.
+
+    Yields:
+        np.ndarray: RGBA frame
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    background, top = render_background(fig, dpi)
+    height, width = background.shape[:2]
+    panels = []
+    for ax, plot, (left, bottom, right, cell_top) in zip(
+        fig.axes, plots, get_cells(fig, top)
+    ):
+        cell = tuple(
+            int(round(position))
+            for position in (
+                (1 - cell_top) * height,
+                (1 - bottom) * height,
+                left * width,
+                right * width,
+            )
+        )
+        box = ax.get_position()
+        cell_width, cell_height = right - left, cell_top - bottom
+        axes_bounds = (
+            (box.x0 - left) / cell_width,
+            (box.y0 - bottom) / cell_height,
+            box.width / cell_width,
+            box.height / cell_height,
+        )
+        panels.append((plot, cell, axes_bounds, dpi))
+
+    if workers is None:
+        workers = len(plots)
+    if workers == 0 or "fork" not in multiprocessing.get_all_start_methods():
+        renderers = []
+        for args in panels:
+            plot = args[0]
+            canvas, size = setup_panel(*args)
+            renderers.append(
+                lambda frames, plot=plot, canvas=canvas, size=size: render_panel(
+                    plot, canvas, size, frames
+                )
+            )
+        pools = []
+    else:
+        # Forked so plots (which may hold unpicklable functions) don't need to be pickled
+        context = multiprocessing.get_context("fork")
+        workers = min(workers, len(plots))
+        pools = [
+            ProcessPoolExecutor(
+                1,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(
+                    {
+                        num: args
+                        for num, args in enumerate(panels)
+                        if num % workers == worker
+                    },
+                ),
+            )
+            for worker in range(workers)
+        ]
+        renderers = [
+            lambda frames, num=num: pools[num % workers].submit(
+                _render_worker_panel, num, frames
+            )
+            for num in range(len(panels))
+        ]
+
+    def render_chunk(start: int) -> typing.List:
+        frames = list(range(start, min(start + CHUNK_SIZE, num_frames)))
+        return [render(frames) for render in renderers]
+
+    try:
+        # Workers render the next chunk while the current one is composited
+        pending = render_chunk(0) if num_frames else []
+        for start in range(0, num_frames, CHUNK_SIZE):
+            chunk = [images if not pools else images.result() for images in pending]
+            if start + CHUNK_SIZE < num_frames:
+                pending = render_chunk(start + CHUNK_SIZE)
+            for num in range(len(chunk[0])):
+                frame = background.copy()
+                for (plot, cell, _, _), images in zip(panels, chunk):
+                    frame[cell[0] : cell[1], cell[2] : cell[3]] = images[num]
+                yield frame
+    finally:
+        for pool in pools:
+            pool.shutdown()
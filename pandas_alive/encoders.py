@@ -0,0 +1,699 @@
+""" Encoders for writing rendered frames to animation files
+
+Charts render each frame to an image, encoders assemble those images into an output file. Used when frames don't come straight from a `FuncAnimation`, eg when reusing frames from a `FrameCache`.
+
+"""
+
+import os
+import typing
+
+import attr
+import numpy as np
+
+
+def _skip_sub_blocks(data: bytes, pos: int) -> int:
+    """ Skip over a sequence of GIF data sub-blocks
+
+    Args:
+        data (bytes): GIF file contents
+        pos (int): Position of the first sub-block's size byte
+
+    Returns:
+        int: Position just after the block terminator
+    """
+    while data[pos]:
+        pos += data[pos] + 1
+    return pos + 1
+
+
+def split_gif(data: bytes) -> typing.Tuple[bytes, bytes, typing.List[bytes]]:
+    """ Split GIF into its header, global color table and frame blocks
+
+    Application extensions (eg, the looping block) are dropped from the frame blocks and image descriptors are given the global color table as a local color table, so the blocks can be spliced onto the end of another GIF.
+
+    Args:
+        data (bytes): GIF file contents
+
+    Raises:
+        ValueError: If data isn't a GIF
+
+    Returns:
+        typing.Tuple[bytes, bytes, typing.List[bytes]]: Header & logical screen descriptor, global color table and self-contained blocks for each frame
+    """
+    if data[:3] != b"GIF":
+        raise ValueError("Not a GIF file")
+    screen_flags = data[10]
+    pos = 13
+    color_table = b""
+    if screen_flags & 0x80:
+        color_table = data[pos : pos + 3 * 2 ** ((screen_flags & 0x07) + 1)]
+        pos += len(color_table)
+    header = data[:13]
+
+    blocks = []
+    while data[pos] != 0x3B:
+        start = pos
+        if data[pos] == 0x21:
+            # Extension introducer and label followed by sub-blocks
+            pos = _skip_sub_blocks(data, pos + 2)
+            if data[start + 1] != 0xFF:
+                blocks.append(data[start:pos])
+        elif data[pos] == 0x2C:
+            image_flags = data[pos + 9]
+            pos += 10
+            if image_flags & 0x80:
+                # Frame already has its own local color table
+                pos += 3 * 2 ** ((image_flags & 0x07) + 1)
+                descriptor = data[start:pos]
+            else:
+                image_flags |= 0x80 | (screen_flags & 0x07)
+                descriptor = data[start : pos - 1] + bytes([image_flags]) + color_table
+            # LZW minimum code size followed by sub-blocks
+            end = _skip_sub_blocks(data, pos + 1)
+            blocks.append(descriptor + data[pos:end])
+            pos = end
+        else:
+            raise ValueError(f"Unexpected block {data[pos]:#x} in GIF at byte {pos}")
+    return header, color_table, blocks
+
+
+def append_gif(filename: str, data: bytes) -> None:
+    """ Append the frames of a GIF onto the end of an existing GIF file in place
+
+    Existing frames are not decoded or re-encoded, the new frames are written in place of the trailer.
+
+    Args:
+        filename (str): Existing GIF file to append to
+        data (bytes): GIF file contents with frames to append
+
+    Raises:
+        ValueError: If the GIFs' dimensions differ or the existing file is incomplete
+    """
+    header, _, blocks = split_gif(data)
+    with open(filename, "r+b") as f:
+        existing_header = f.read(13)
+        if existing_header[6:10] != header[6:10]:
+            raise ValueError(f"Can't append frames of a different size to {filename}")
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b";":
+            raise ValueError(f"{filename} is not a complete GIF file")
+        f.seek(-1, os.SEEK_END)
+        for block in blocks:
+            f.write(block)
+        f.write(b";")
+
+
+@attr.s
+class GifEncoder:
+    """
+    Encode frames to a GIF with Pillow
+
+    Args:
+        filename (str): File name to write GIF to
+        interval (float): Duration of each frame in milliseconds
+        append (bool, optional): Append frames to the existing GIF at `filename` instead of overwriting it. Defaults to False.
+    """
+
+    filename: str = attr.ib()
+    interval: float = attr.ib()
+    append: bool = attr.ib(default=False)
+
+    def __attrs_post_init__(self):
+        """ Frames are held until `finish` as Pillow writes GIFs in a single call
+        """
+        self.frames = []
+
+    def add_frame(self, image: "PIL.Image.Image") -> None:
+        """ Add frame to end of animation
+
+        Args:
+            image (PIL.Image.Image): Rendered frame
+        """
+        self.frames.append(image)
+
+    def repeat_frame(self) -> None:
+        """ Show the last frame added for another interval, Pillow merges identical consecutive frames into one with a longer duration
+        """
+        self.frames.append(self.frames[-1])
+
+    def abort(self) -> None:
+        """ Discard frames without writing, `filename` is left untouched
+        """
+        self.frames = []
+
+    def finish(self) -> None:
+        """ Write all frames to `filename`
+        """
+        if self.append:
+            import io
+
+            buffer = io.BytesIO()
+            self.frames[0].save(
+                buffer,
+                format="gif",
+                save_all=True,
+                append_images=self.frames[1:],
+                optimize=False,
+                duration=self.interval,
+                loop=0,
+            )
+            append_gif(self.filename, buffer.getvalue())
+            return
+        self.frames[0].save(
+            self.filename,
+            save_all=True,
+            append_images=self.frames[:],
+            optimize=False,
+            duration=self.interval,
+            loop=0,
+        )
+
+
+@attr.s
+class GifStreamEncoder:
+    """
+    Encode frames to a GIF as they arrive, only holding the current frame in memory
+
+    Each frame is written to `filename` as soon as it's added, the file is only a complete GIF once `finish` writes the trailer.
+
+    Args:
+        filename (str): File name to write GIF to
+        interval (float): Duration of each frame in milliseconds
+    """
+
+    filename: str = attr.ib()
+    interval: float = attr.ib()
+
+    def __attrs_post_init__(self):
+        """ File is opened on the first frame
+        """
+        self._file = None
+        self._last_frame = None
+
+    def add_frame(self, image: "PIL.Image.Image") -> None:
+        """ Encode frame and write it to the end of `filename`
+
+        Args:
+            image (PIL.Image.Image): Rendered frame
+        """
+        import io
+
+        buffer = io.BytesIO()
+        image.save(buffer, format="gif", duration=self.interval, loop=0)
+        data = buffer.getvalue()
+        if self._file is None:
+            self._file = open(self.filename, "wb")
+            # Header, looping block and first frame without the trailer
+            self._file.write(data[:-1])
+        else:
+            _, _, blocks = split_gif(data)
+            self._file.write(b"".join(blocks))
+        self._file.flush()
+        self._last_frame = image
+
+    def repeat_frame(self) -> None:
+        """ Write the last frame added again, as frames already written can't be extended
+        """
+        self.add_frame(self._last_frame)
+
+    def abort(self) -> None:
+        """ Stop writing, `filename` is left as a complete GIF of the frames written so far
+        """
+        self.finish()
+
+    def finish(self) -> None:
+        """ Write the trailer and close `filename`
+        """
+        if self._file is None:
+            return
+        self._file.write(b";")
+        self._file.close()
+        self._file = None
+
+
+# Palette index left out of the palette for pixels unchanged since the previous frame
+TRANSPARENT_INDEX = 255
+
+
+@attr.s
+class PaletteGifEncoder:
+    """
+    Encode frames to a GIF with one palette shared by all frames, writing only what changed since the previous frame
+
+    The palette starts with `colors` (eg, the chart's colors, up to half of the palette) and is filled up with the colors of the first frame. Frames are mapped to the palette with a lookup table on 5 bits per channel, pixels with one of `colors` keep it exactly. After the first frame, only the bounding box of changed pixels is written, with unchanged pixels in it transparent. Frames are written as they're added and frames identical to the previous one extend its duration.
+
+    When appending, frames are mapped to the existing GIF's global color table, so a GIF rendered in parts matches one rendered in one go.
+
+    Args:
+        filename (str): File name to write GIF to
+        interval (float): Duration of each frame in milliseconds
+        colors (typing.Sequence[typing.Tuple[int, int, int]]): RGB colors known to be drawn, in order of importance
+        append (bool, optional): Append frames to the existing GIF at `filename` instead of overwriting it. Defaults to False.
+    """
+
+    filename: str = attr.ib()
+    interval: float = attr.ib()
+    colors: typing.Sequence[typing.Tuple[int, int, int]] = attr.ib()
+    append: bool = attr.ib(default=False)
+
+    def __attrs_post_init__(self):
+        """ File, palette & lookup table are set up on the first frame
+        """
+        self._file = None
+        self._append_from = None
+        self._lut = None
+        self._previous = None
+        self._pending = None
+        self._num_frames = 0
+        self._written_centiseconds = 0
+
+    def get_known_colors(self) -> typing.List[typing.Tuple[int, int, int]]:
+        """ Distinct known colors that go first in the palette, up to half of it
+
+        Returns:
+            typing.List[typing.Tuple[int, int, int]]: RGB colors
+        """
+        known = dict.fromkeys(tuple(int(c) for c in color) for color in self.colors)
+        return list(known)[: TRANSPARENT_INDEX // 2]
+
+    def build_palette(self, image: "PIL.Image.Image") -> np.ndarray:
+        """ Palette of the known colors filled up with the colors of `image`
+
+        Args:
+            image (PIL.Image.Image): First frame
+
+        Returns:
+            np.ndarray: Palette of up to 255 RGB colors, of shape (colors, 3)
+        """
+        known = self.get_known_colors()
+        quantized = image.convert("RGB").quantize(TRANSPARENT_INDEX - len(known))
+        quantized_palette = np.array(quantized.getpalette()).reshape(-1, 3)
+        used = sorted(index for _, index in quantized.getcolors(TRANSPARENT_INDEX))
+        colors = known + [tuple(color) for color in quantized_palette[used]]
+        return np.array(list(dict.fromkeys(colors)), dtype=np.int32)
+
+    def build_lut(self, palette: np.ndarray) -> np.ndarray:
+        """ Nearest palette index for every color on 5 bits per channel
+
+        Args:
+            palette (np.ndarray): RGB palette of shape (colors, 3)
+
+        Returns:
+            np.ndarray: Palette index of each 15 bit color
+        """
+        levels = (np.arange(32) << 3) + 4
+        grid = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), -1)
+        grid = grid.reshape(-1, 3)
+        lut = np.empty(len(grid), dtype=np.uint8)
+        # In chunks to bound memory of the distances
+        for start in range(0, len(grid), 4096):
+            chunk = grid[start : start + 4096, None, :] - palette[None, :, :]
+            lut[start : start + 4096] = (chunk ** 2).sum(-1).argmin(-1)
+        # Known colors map to themselves even if another color is nearer their cell's centre
+        for color in reversed(self.get_known_colors()):
+            matches = np.flatnonzero((palette == color).all(axis=1))
+            if len(matches):
+                lut[self.get_cells(np.array(color))] = matches[0]
+        return lut
+
+    def get_cells(self, rgb: np.ndarray) -> np.ndarray:
+        """ Lookup table cell of each color
+
+        Args:
+            rgb (np.ndarray): RGB colors, last dimension of 3 channels
+
+        Returns:
+            np.ndarray: Index into the lookup table of each color
+        """
+        rgb = rgb.astype(np.int32) >> 3
+        return (rgb[..., 0] << 10) | (rgb[..., 1] << 5) | rgb[..., 2]
+
+    def add_frame(self, image: "PIL.Image.Image") -> None:
+        """ Map frame to the palette and write the previous frame
+
+        Args:
+            image (PIL.Image.Image): Rendered frame
+        """
+        if self._lut is None:
+            if self.append:
+                palette = self.open_existing(image.size)
+            else:
+                palette = self.build_palette(image)
+                self._file = open(self.filename, "wb")
+                self.write_header(image.size, palette)
+            self._lut = self.build_lut(palette)
+        indices = self._lut[self.get_cells(np.asarray(image.convert("RGB")))]
+        if self._previous is None:
+            self._pending = (indices, (0, 0), False)
+        else:
+            changed = indices != self._previous
+            if not changed.any():
+                self.repeat_frame()
+                return
+            rows = np.flatnonzero(changed.any(axis=1))
+            columns = np.flatnonzero(changed.any(axis=0))
+            box = np.s_[rows[0] : rows[-1] + 1, columns[0] : columns[-1] + 1]
+            delta = indices[box].copy()
+            delta[~changed[box]] = TRANSPARENT_INDEX
+            self.write_pending()
+            self._pending = (delta, (int(columns[0]), int(rows[0])), True)
+        self._previous = indices
+        self._num_frames += 1
+
+    def repeat_frame(self) -> None:
+        """ Show the last frame added for another interval
+        """
+        self._num_frames += 1
+
+    def write_header(self, size: typing.Tuple[int, int], palette: np.ndarray) -> None:
+        """ Write the header, global color table & looping block
+
+        Args:
+            size (typing.Tuple[int, int]): Width and height of frames in pixels
+            palette (np.ndarray): RGB palette of shape (colors, 3)
+        """
+        import struct
+
+        color_table = np.zeros((256, 3), dtype=np.uint8)
+        color_table[: len(palette)] = palette
+        self._file.write(b"GIF89a" + struct.pack("<HHBBB", *size, 0xF7, 0, 0))
+        self._file.write(color_table.tobytes())
+        self._file.write(b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def open_existing(self, size: typing.Tuple[int, int]) -> np.ndarray:
+        """ Open the existing GIF to write frames in place of its trailer
+
+        Args:
+            size (typing.Tuple[int, int]): Width and height of frames in pixels
+
+        Raises:
+            ValueError: If the GIF's dimensions differ, it has no global color table or it's incomplete
+
+        Returns:
+            np.ndarray: RGB palette of the GIF's global color table, without the transparent index
+        """
+        import struct
+
+        self._file = open(self.filename, "r+b")
+        try:
+            header = self._file.read(13)
+            if struct.unpack("<HH", header[6:10]) != tuple(size):
+                raise ValueError(
+                    f"Can't append frames of a different size to {self.filename}"
+                )
+            if not header[10] & 0x80:
+                raise ValueError(f"{self.filename} has no global color table")
+            color_table = self._file.read(3 * 2 ** ((header[10] & 0x07) + 1))
+            self._file.seek(-1, os.SEEK_END)
+            if self._file.read(1) != b";":
+                raise ValueError(f"{self.filename} is not a complete GIF file")
+        except BaseException:
+            self._file.close()
+            self._file = None
+            raise
+        self._file.seek(-1, os.SEEK_END)
+        self._append_from = self._file.tell()
+        palette = np.frombuffer(color_table, dtype=np.uint8).reshape(-1, 3)
+        return palette[:TRANSPARENT_INDEX].astype(np.int32)
+
+    def write_pending(self) -> None:
+        """ Write the frame waiting for its duration, which lasts until the frames added since
+        """
+        import struct
+
+        from PIL import GifImagePlugin, Image
+
+        if self._pending is None:
+            return
+        indices, offset, transparent = self._pending
+        # Rounded from the start of the animation so durations don't drift
+        end = round(self._num_frames * self.interval / 10)
+        duration = end - self._written_centiseconds
+        # Previous frame is kept under this one, its unchanged pixels are transparent
+        flags = 1 << 2 | int(transparent)
+        self._file.write(
+            b"!\xf9\x04" + struct.pack("<BHBB", flags, duration, TRANSPARENT_INDEX, 0)
+        )
+        self._file.write(
+            b"".join(GifImagePlugin.getdata(Image.fromarray(indices, "L"), offset))
+        )
+        self._written_centiseconds = end
+        self._pending = None
+
+    def abort(self) -> None:
+        """ Stop writing and remove the partial GIF, when appending the existing GIF is restored
+        """
+        if self._file is None:
+            return
+        if self._append_from is not None:
+            self._file.seek(self._append_from)
+            self._file.write(b";")
+            self._file.truncate()
+            self._file.close()
+        else:
+            self._file.close()
+            os.remove(self.filename)
+        self._file = None
+
+    def finish(self) -> None:
+        """ Write the last frame & the trailer and close `filename`
+        """
+        if self._file is None:
+            return
+        self.write_pending()
+        self._file.write(b";")
+        self._file.close()
+        self._file = None
+
+
+@attr.s
+class FFMpegEncoder:
+    """
+    Encode frames to a video by piping raw RGBA frames to ffmpeg
+
+    The ffmpeg executable, codec and bitrate follow matplotlib's `animation.*` rcParams, same as `matplotlib.animation.FFMpegWriter`.
+
+    Args:
+        filename (str): File name to write video to
+        fps (float): Frames per second of the video
+        append (bool, optional): Append frames to the existing video at `filename` instead of overwriting it. New frames are encoded to a separate segment which is joined to the video without re-encoding it. Defaults to False.
+    """
+
+    filename: str = attr.ib()
+    fps: float = attr.ib()
+    append: bool = attr.ib(default=False)
+
+    def __attrs_post_init__(self):
+        """ ffmpeg is started on the first frame, once the frame size is known
+        """
+        self._proc = None
+        self._output = None
+        self._last_frame = None
+
+    def _make_output(self) -> str:
+        """ Path for ffmpeg to write to, a temporary segment next to `filename` when appending
+
+        Returns:
+            str: Output path
+        """
+        if not self.append:
+            return self.filename
+        import tempfile
+
+        directory, name = os.path.split(os.path.abspath(self.filename))
+        fd, output = tempfile.mkstemp(
+            dir=directory, prefix=name + ".", suffix=os.path.splitext(name)[1]
+        )
+        os.close(fd)
+        return output
+
+    def _remove_segment(self) -> None:
+        """ Remove the temporary segment written when appending
+        """
+        if self.append and self._output is not None and os.path.exists(self._output):
+            os.remove(self._output)
+
+    def get_args(self, size: typing.Tuple[int, int]) -> typing.List[str]:
+        """ Command line for ffmpeg
+
+        Args:
+            size (typing.Tuple[int, int]): Width and height of frames in pixels
+
+        Returns:
+            typing.List[str]: Arguments to launch ffmpeg with
+        """
+        from matplotlib import rcParams
+
+        args = [
+            rcParams["animation.ffmpeg_path"],
+            "-f",
+            "rawvideo",
+            "-vcodec",
+            "rawvideo",
+            "-s",
+            "%dx%d" % size,
+            "-pix_fmt",
+            "rgba",
+            "-r",
+            str(self.fps),
+            "-loglevel",
+            "error",
+            "-i",
+            "pipe:",
+            "-vcodec",
+            rcParams["animation.codec"],
+        ]
+        if rcParams["animation.codec"] == "h264":
+            # yuv420p needs even dimensions and is what most players support
+            args += ["-pix_fmt", "yuv420p", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+        if rcParams["animation.bitrate"] > 0:
+            args += ["-b", "%dk" % rcParams["animation.bitrate"]]
+        return args + ["-y", self._output]
+
+    def add_frame(self, image: "PIL.Image.Image") -> None:
+        """ Pipe frame to ffmpeg
+
+        Args:
+            image (PIL.Image.Image): Rendered frame
+
+        Raises:
+            RuntimeError: If ffmpeg can't be found
+        """
+        import subprocess
+
+        if self._proc is None:
+            self._output = self._make_output()
+            try:
+                self._proc = subprocess.Popen(
+                    self.get_args(image.size),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+            except FileNotFoundError:
+                self._remove_segment()
+                raise RuntimeError(
+                    "Ensure that a matplotlib writer library is installed, see https://github.com/JackMcKew/pandas_alive/blob/main/README.md#requirements for more details"
+                )
+        self._last_frame = image.convert("RGBA").tobytes()
+        self._proc.stdin.write(self._last_frame)
+
+    def repeat_frame(self) -> None:
+        """ Pipe the last frame added to ffmpeg again, without converting it
+        """
+        self._proc.stdin.write(self._last_frame)
+
+    def finish(self) -> None:
+        """ Close the pipe and wait for ffmpeg to finish writing
+
+        Raises:
+            RuntimeError: If ffmpeg exits with an error
+        """
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            stderr = self._proc.stderr.read().decode(errors="replace")
+            if self._proc.wait() != 0:
+                raise RuntimeError(f"ffmpeg failed to write {self.filename}: {stderr}")
+            if self.append:
+                concat_videos(self.filename, self._output)
+        finally:
+            self._remove_segment()
+
+    def abort(self) -> None:
+        """ Stop ffmpeg without finishing the video and remove its partial output, when appending the existing video is left untouched
+        """
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.communicate()
+        if self._output is not None and os.path.exists(self._output):
+            os.remove(self._output)
+
+
+def concat_videos(filename: str, segment: str) -> None:
+    """ Join a video segment onto the end of a video with ffmpeg, copying streams without re-encoding
+
+    Both videos must share codec, frame size and frame rate.
+
+    Args:
+        filename (str): Video to append to, replaced once joined
+        segment (str): Video to append
+
+    Raises:
+        RuntimeError: If ffmpeg exits with an error
+    """
+    import subprocess
+    import tempfile
+
+    from matplotlib import rcParams
+
+    directory, name = os.path.split(os.path.abspath(filename))
+    fd, list_path = tempfile.mkstemp(dir=directory, suffix=".txt")
+    fd_out, joined = tempfile.mkstemp(
+        dir=directory, prefix=name + ".", suffix=os.path.splitext(name)[1]
+    )
+    os.close(fd_out)
+    try:
+        with os.fdopen(fd, "w") as f:
+            for path in (filename, segment):
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        result = subprocess.run(
+            [
+                rcParams["animation.ffmpeg_path"],
+                "-loglevel",
+                "error",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                list_path,
+                "-c",
+                "copy",
+                "-y",
+                joined,
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg failed to append to {filename}: {result.stderr.decode(errors='replace')}"
+            )
+        os.replace(joined, filename)
+    finally:
+        os.remove(list_path)
+        if os.path.exists(joined):
+            os.remove(joined)
+
+
+def get_encoder(
+    filename: str,
+    fps: float,
+    interval: float,
+    append: bool = False,
+    stream: bool = False,
+    colors: typing.Sequence[typing.Tuple[int, int, int]] = None,
+) -> typing.Union[GifEncoder, GifStreamEncoder, PaletteGifEncoder, FFMpegEncoder]:
+    """ Get encoder suitable for extension of `filename`
+
+    Args:
+        filename (str): File name with extension to write to
+        fps (float): Frames per second of the animation
+        interval (float): Duration of each frame in milliseconds
+        append (bool, optional): Append to existing file instead of overwriting it. Defaults to False.
+        stream (bool, optional): Write each frame as soon as it's added instead of holding frames in memory. Defaults to False.
+        colors (typing.Sequence[typing.Tuple[int, int, int]], optional): RGB colors known to be drawn, new GIFs are encoded with a shared palette starting with these, see `PaletteGifEncoder`. Defaults to None.
+
+    Returns:
+        typing.Union[GifEncoder, GifStreamEncoder, PaletteGifEncoder, FFMpegEncoder]: Encoder instance
+    """
+    if filename.split(".")[-1] == "gif":
+        if colors is not None:
+            return PaletteGifEncoder(filename, interval, colors, append=append)
+        if stream:
+            return GifStreamEncoder(filename, interval)
+        return GifEncoder(filename, interval, append=append)
+    return FFMpegEncoder(filename, fps, append=append)
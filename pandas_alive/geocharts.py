@@ -9,15 +9,123 @@ import attr
 import geopandas
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-import matplotlib.units as munits
 import numpy as np
 import pandas as pd
 
 from matplotlib import colors, ticker, transforms
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import PathCollection
 from matplotlib.colors import Colormap
 
 from ._base_chart import _BaseChart
+from .cache import GeometryCache, make_key
+from .tiles import TileStore
+
+# `GeoDataFrame.plot` keywords which style geometries by all of a frame's values
+REPLOT_KWARGS = (
+    "scheme",
+    "categorical",
+    "categories",
+    "legend",
+    "missing_kwds",
+    "color",
+)
+
+# `contextily.add_basemap` keywords which aren't passed on to `imshow`
+BASEMAP_KWARGS = (
+    "zoom",
+    "source",
+    "interpolation",
+    "attribution",
+    "attribution_size",
+    "reset_extent",
+    "crs",
+    "resampling",
+    "url",
+)
+
+
+@attr.s
+class GeoFrames:
+    """
+    Values of a map's geometries in every frame, kept apart from the geometries
+
+    Values are a (geometries, frames) array interpolated along the time axis, laid out so the values of each frame are contiguous.
+
+    Args:
+        values (np.ndarray): Float array of shape (number of geometries, number of frames)
+        periods (pd.Index): Period of each frame
+    """
+
+    values: np.ndarray = attr.ib()
+    periods: pd.Index = attr.ib()
+
+    @classmethod
+    def from_periods(
+        cls,
+        values: np.ndarray,
+        periods: pd.Index,
+        steps_per_period: int,
+        interpolate_period: bool,
+    ) -> "GeoFrames":
+        """ Interpolate `steps_per_period` frames from each period to the next, like `_BaseChart.get_interpolated_df` interpolates rows
+
+        Values are interpolated linearly, across missing values too. Missing values before a geometry's first value stay missing, those after its last value hold it.
+
+        Args:
+            values (np.ndarray): Array of shape (number of geometries, number of periods)
+            periods (pd.Index): Period of each column of `values`
+            steps_per_period (int): The number of steps to go from one period to the next
+            interpolate_period (bool): Whether to interpolate the periods (dates are spaced evenly), otherwise frames show the period they step from
+
+        Returns:
+            GeoFrames: Values & periods of every frame
+        """
+        values = np.asarray(values, dtype=float)
+        num_frames = (len(periods) - 1) * steps_per_period + 1
+        frames = np.empty((len(values), num_frames), order="F")
+        frames[:, ::steps_per_period] = values
+        # Computed as `np.interp` computes it, so frames match interpolating with pandas
+        slopes = np.diff(values, axis=1) / steps_per_period
+        for step in range(1, steps_per_period):
+            frames[:, step::steps_per_period] = slopes * step + values[:, :-1]
+
+        missing = np.isnan(values)
+        frame_numbers = np.arange(num_frames)
+        for row in np.flatnonzero(missing.any(axis=1) & ~missing.all(axis=1)):
+            present = np.flatnonzero(~missing[row])
+            frames[row] = np.interp(
+                frame_numbers, present * steps_per_period, values[row, present]
+            )
+            frames[row, : present[0] * steps_per_period] = np.nan
+
+        if interpolate_period and periods.dtype.kind == "M":
+            periods = pd.date_range(periods[0], periods[-1], periods=num_frames)
+        elif interpolate_period and periods.dtype.kind in "iuf":
+            periods = pd.Index(
+                np.interp(
+                    frame_numbers,
+                    np.arange(len(periods)) * steps_per_period,
+                    periods.astype(float),
+                )
+            )
+        else:
+            periods = periods[frame_numbers // steps_per_period]
+        return cls(frames, periods)
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    def get_frame(self, i: int) -> np.ndarray:
+        """ Values of every geometry in frame `i`
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            np.ndarray: Float array, one value per geometry
+        """
+        return self.values[:, i]
 
 
 @attr.s
@@ -35,11 +143,16 @@ class MapChart(_BaseChart):
     basemap_format: typing.Dict = attr.ib()
     enable_markersize: bool = attr.ib()
     scale_markersize: float = attr.ib()
+    engine: str = attr.ib(default="agg")
+    simplify: bool = attr.ib(default=False)
+    geometry_cache: typing.Union[GeometryCache, str] = attr.ib(default=None)
+    tile_store: typing.Union[TileStore, str] = attr.ib(default=None)
 
     def __attrs_post_init__(self):
         """ Properties to be determined after initialization
         """
-        self.df = self.df.copy()
+        if self.engine not in ("agg", "raster"):
+            raise ValueError('`engine` must be "agg" or "raster"')
         try:
             import descartes
         except:
@@ -47,20 +160,17 @@ class MapChart(_BaseChart):
                 "Ensure to install `descartes` if using geopandas with pandas_alive"
             )
 
-        from shapely.geometry import Point
-
-        for shape in self.df.geometry:
-            if type(shape) == Point:
-                self.enable_markersize = True
-                break
+        if (self.df.geometry.geom_type == "Point").any():
+            self.enable_markersize = True
 
+        geometry = self.df.geometry
         if self.df.crs != "EPSG:3857" and self.basemap_format:
-            self.df = self.df.to_crs(3857)
+            geometry = geometry.to_crs(3857)
 
-        # Convert all columns except geometry to datetime
+        # Values are interpolated as a NumPy array, geometries are kept apart
+        data = self.get_geo_data(self.df)
         try:
-            self.df = self.convert_data_cols_to_datetime(self.df)
-            self.df = self.get_interpolated_geo_df(self.df)
+            periods = pd.to_datetime(data.columns)
         except:
             import warnings
 
@@ -68,11 +178,17 @@ class MapChart(_BaseChart):
                 "Pandas_Alive failed to convert columns to datetime, setting interpolate_period to False and retrying..."
             )
             self.interpolate_period = False
-            self.df = self.get_interpolated_geo_df(self.df)
-
-        temp_gdf = self.df.copy()
-        self.df = pd.DataFrame(self.df)
-        self.df = self.df.drop("geometry", axis=1)
+            periods = data.columns
+        self.geo_frames = GeoFrames.from_periods(
+            data.to_numpy(dtype=float),
+            periods,
+            self.steps_per_period,
+            self.interpolate_period,
+        )
+        # Figures are laid out for the values, a DataFrame viewing them without a copy
+        self.df = pd.DataFrame(
+            self.geo_frames.values, index=data.index, columns=self.geo_frames.periods
+        )
 
         # if self.fig is None:
         #     self.fig, self.ax = self.create_figure()
@@ -93,7 +209,97 @@ class MapChart(_BaseChart):
         if self.enable_progress_bar:
             self.setup_progress_bar()
 
-        self.df = temp_gdf
+        self.df = geopandas.GeoDataFrame(geometry=geometry)
+        if isinstance(self.geometry_cache, str):
+            self.geometry_cache = GeometryCache(self.geometry_cache)
+        if isinstance(self.tile_store, str):
+            source = self.get_basemap_format().get("source")
+            self.tile_store = TileStore(
+                self.tile_store,
+                url=source.get("url") if isinstance(source, dict) else source,
+                attribution=source.get("attribution")
+                if isinstance(source, dict)
+                else None,
+            )
+        if self.simplify:
+            self.df = self.simplify_geometries(self.df)
+
+    def get_simplify_tolerance(self, bounds: typing.Sequence[float]) -> float:
+        """ Half the size of a pixel in the units of the geometries, when the map shows `bounds` at the chart's `dpi`
+
+        Geographic coordinates are stretched vertically like Geopandas does, the tolerance is half the smaller of a pixel's width & height.
+
+        Args:
+            bounds (typing.Sequence[float]): (minx, miny, maxx, maxy) extent of the map
+
+        Returns:
+            float: Simplification tolerance
+        """
+        position = self.ax.get_position()
+        width, height = self.fig.get_size_inches() * self.dpi
+        width, height = width * position.width, height * position.height
+        aspect = 1
+        if self.df.crs and self.df.crs.is_geographic:
+            aspect = 1 / np.cos(np.radians((bounds[1] + bounds[3]) / 2))
+        # The map is scaled to fit the axes in both directions
+        units_per_pixel = max(
+            (bounds[2] - bounds[0]) / width, (bounds[3] - bounds[1]) * aspect / height
+        )
+        return 0.5 * units_per_pixel / max(aspect, 1)
+
+    def simplify_geometries(
+        self, gdf: geopandas.GeoDataFrame
+    ) -> geopandas.GeoDataFrame:
+        """ Simplify geometries once to the detail a frame can show, so fewer vertices are drawn every frame
+
+        Geometries are simplified by half a pixel (see `get_simplify_tolerance`) keeping them valid. When the axes have fixed limits (eg from `fig=`), geometries are also clipped to the limits, those entirely outside them are reduced to their bounding boxes. Results are stored in the chart's `geometry_cache` if given.
+
+        Args:
+            gdf (geopandas.GeoDataFrame): Source GeoDataFrame
+
+        Returns:
+            geopandas.GeoDataFrame: GeoDataFrame with simplified geometries
+        """
+        from shapely import wkb
+        from shapely.geometry import box
+
+        geometries = gdf.geometry
+        bounds = geometries.total_bounds
+        clip = not (self.ax.get_autoscalex_on() or self.ax.get_autoscaley_on())
+        if clip:
+            (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+            bounds = np.array([x0, y0, x1, y1])
+        tolerance = self.get_simplify_tolerance(bounds)
+
+        key = None
+        if self.geometry_cache is not None:
+            key = make_key(
+                [shape.wkb for shape in geometries], tolerance, bounds.tolist(), clip
+            )
+            cached = self.geometry_cache.get_wkb(key)
+            if cached is not None:
+                simplified = [wkb.loads(data) for data in cached]
+                return gdf.set_geometry(
+                    geopandas.GeoSeries(simplified, index=gdf.index, crs=gdf.crs)
+                )
+
+        simplified = geometries.simplify(tolerance, preserve_topology=True).tolist()
+        if clip:
+            # Keep a pixel of margin so clipped edges stay outside the axes
+            view = box(*(bounds + 2 * tolerance * np.array([-1, -1, 1, 1])))
+            simplified = [
+                shape
+                if shape.within(view)
+                else shape.intersection(view)
+                if shape.intersects(view)
+                else shape.envelope
+                for shape in simplified
+            ]
+        if key is not None:
+            self.geometry_cache.put_wkb(key, [shape.wkb for shape in simplified])
+        return gdf.set_geometry(
+            geopandas.GeoSeries(simplified, index=gdf.index, crs=gdf.crs)
+        )
 
     def get_data_cols(self, gdf: geopandas.GeoDataFrame) -> typing.List:
         """
@@ -119,20 +325,34 @@ class MapChart(_BaseChart):
         Returns:
             geopandas.GeoDataFrame: GeoDataFrame with data columns converted to `Timestamp`
         """
-        converted_column_names = []
-        for col in gdf.columns:
-            if col != "geometry":
-                col = pd.to_datetime(col)
-
-            converted_column_names.append(col)
-        gdf.columns = converted_column_names
+        data_cols = gdf.columns != "geometry"
+        columns = gdf.columns.to_numpy(dtype=object, copy=True)
+        columns[data_cols] = pd.to_datetime(gdf.columns[data_cols])
+        gdf.columns = columns
         return gdf
 
+    def get_geo_data(self, gdf: geopandas.GeoDataFrame) -> pd.DataFrame:
+        """ Numeric (period) columns of a GeoDataFrame, without its geometry
+
+        Args:
+            gdf (geopandas.GeoDataFrame): Input GeoDataFrame
+
+        Raises:
+            Exception: If no numeric data was found to be plotted
+
+        Returns:
+            pd.DataFrame: Data columns, one per period
+        """
+        data = pd.DataFrame(gdf).select_dtypes(np.number)
+        if len(data.columns) == 0:
+            raise Exception("No numeric data columns found for plotting.")
+        return data
+
     def get_interpolated_geo_df(
         self, gdf: geopandas.GeoDataFrame
     ) -> geopandas.GeoDataFrame:
         """
-        Interpolates GeoDataFrame by splitting data from geometry, interpolating and joining back together
+        Interpolates GeoDataFrame by splitting data from geometry, interpolating with `GeoFrames` and joining back together
 
         Args:
             gdf (geopandas.GeoDataFrame): Input GeoDataFrame
@@ -141,22 +361,18 @@ class MapChart(_BaseChart):
             geopandas.GeoDataFrame: Interpolated GeoDataFrame
         """
 
-        # Separate data from geometry
-        temp_df = pd.DataFrame(gdf)
-        temp_df = temp_df.drop("geometry", axis=1)
-        temp_df = temp_df.T
-        geometry_column = gdf.geometry
-
-        # Interpolate data
-        interpolated_df = super().get_interpolated_df(
-            temp_df, self.steps_per_period, self.interpolate_period
+        data = self.get_geo_data(gdf)
+        geo_frames = GeoFrames.from_periods(
+            data.to_numpy(dtype=float),
+            data.columns,
+            self.steps_per_period,
+            self.interpolate_period,
         )
-
-        # Rejoin data with geometry
-        interpolated_df = interpolated_df.T
-        interpolated_df["geometry"] = geometry_column
-
-        return geopandas.GeoDataFrame(interpolated_df)
+        interpolated_gdf = geopandas.GeoDataFrame(
+            geo_frames.values, index=gdf.index, columns=geo_frames.periods
+        )
+        interpolated_gdf["geometry"] = gdf.geometry
+        return geopandas.GeoDataFrame(interpolated_gdf)
 
     def plot_geo_data(self, i: int, gdf: geopandas.GeoDataFrame) -> None:
         """
@@ -166,15 +382,15 @@ class MapChart(_BaseChart):
 
         Args:
             i (int): Frame to plot
-            gdf (geopandas.GeoDataFrame): Source GeoDataFrame
+            gdf (geopandas.GeoDataFrame): Geometries to plot, in the order of `geo_frames`
         """
         # fig, ax = plt.subplots(figsize=(5,3), dpi=100)
         # self.ax.clear()
-        column_to_plot = gdf.columns[i]
+        values = self.geo_frames.get_frame(i)
         gdf.plot(
-            column=column_to_plot,
+            column=values,
             ax=self.ax,
-            markersize=gdf[column_to_plot] * self.scale_markersize
+            markersize=values * self.scale_markersize
             if self.enable_markersize
             else None,
             # cmap='Blues',
@@ -183,21 +399,198 @@ class MapChart(_BaseChart):
         )
 
         if self.basemap_format:
-            try:
-                import contextily
+            self.add_basemap()
+
+        return self.ax
 
-                if isinstance(self.basemap_format, dict):
-                    contextily.add_basemap(self.ax, **self.basemap_format)
-                else:
-                    contextily.add_basemap(self.ax)
+    def get_basemap_format(self) -> typing.Dict:
+        """ Keyword arguments of the basemap as per `contextily.add_basemap`
 
-            except ImportError:
+        Returns:
+            typing.Dict: `basemap_format`, empty if it's only True
+        """
+        return self.basemap_format if isinstance(self.basemap_format, dict) else {}
 
-                raise ModuleNotFoundError(
-                    "Ensure contextily is installed for basemap functionality https://github.com/geopandas/contextily"
+    def get_basemap(self) -> typing.Tuple[np.ndarray, typing.Tuple, str]:
+        """ Image of the basemap, fetched once for the map's extent from the chart's `tile_store` or with contextily
+
+        Returns:
+            typing.Tuple[np.ndarray, typing.Tuple, str]: Image, its (left, right, bottom, top) extent in Web Mercator & attribution text (or None)
+        """
+        if getattr(self, "_basemap", None) is None:
+            basemap_format = self.get_basemap_format()
+            xmin, xmax, ymin, ymax = self.ax.axis()
+            zoom = basemap_format.get("zoom", "auto")
+            source = basemap_format.get("source")
+            attribution = basemap_format.get("attribution")
+            if self.tile_store is not None:
+                image, extent = self.tile_store.get_image(
+                    (xmin, ymin, xmax, ymax), zoom
                 )
+                if attribution is None:
+                    attribution = self.tile_store.attribution
+            else:
+                try:
+                    import contextily
+                except ImportError:
+                    raise ModuleNotFoundError(
+                        "Ensure contextily is installed for basemap functionality https://github.com/geopandas/contextily, or use a `tile_store`"
+                    )
+                # Contextily fetches (and warps) the basemap once, its image & attribution are kept and drawn again
+                texts = list(self.ax.texts)
+                contextily.add_basemap(self.ax, **basemap_format)
+                basemap = self.ax.images[-1]
+                image, extent = basemap.get_array(), basemap.get_extent()
+                basemap.remove()
+                for text in self.ax.texts[len(texts) :]:
+                    attribution = text.get_text()
+                    text.remove()
+                self.ax.axis((xmin, xmax, ymin, ymax))
+            self._basemap = (image, extent, attribution)
+        return self._basemap
+
+    def add_basemap(self) -> None:
+        """ Add the basemap given by `basemap_format` underneath the geometries, as contextily would
+
+        The basemap is only fetched once (see `get_basemap`), so frames that plot the GeoDataFrame again only show the same image again.
+        """
+        image, extent, attribution = self.get_basemap()
+        imshow_kwargs = {
+            key: value
+            for key, value in self.get_basemap_format().items()
+            if key not in BASEMAP_KWARGS
+        }
+        limits = self.ax.axis()
+        self.ax.imshow(
+            image,
+            extent=extent,
+            interpolation=self.get_basemap_format().get("interpolation", "bilinear"),
+            **imshow_kwargs,
+        )
+        self.ax.axis(limits)
+        if attribution:
+            from matplotlib import patheffects
+
+            self.ax.text(
+                0.005,
+                0.005,
+                attribution,
+                transform=self.ax.transAxes,
+                size=self.get_basemap_format().get("attribution_size", 8),
+                path_effects=[patheffects.withStroke(linewidth=2, foreground="w")],
+                wrap=True,
+            )
 
-        return self.ax
+    def uses_geo_collections(self) -> bool:
+        """ Whether frames update the colors (and marker sizes) of geometry collections created on the first frame, instead of plotting the GeoDataFrame again
+
+        Classification schemes, categories, legends & missing value styles depend on each frame's values as a whole, so are plotted again every frame.
+
+        Returns:
+            bool: True if the collections are created once
+        """
+        return not any(self.kwargs.get(key) for key in REPLOT_KWARGS)
+
+    def get_geo_values(self) -> np.ndarray:
+        """ Values of every geometry in every frame, a view of `geo_frames`
+
+        Returns:
+            np.ndarray: Float array of shape (number of frames, number of geometries)
+        """
+        return self.geo_frames.values.T
+
+    def create_geo_collections(self, gdf: geopandas.GeoDataFrame) -> None:
+        """ Plot every geometry once, colored by its row number so each collection's array tells which row every patch or point came from
+
+        Multi part geometries are split & grouped into polygon, line & point collections by Geopandas, the row numbers keep track of them.
+
+        Args:
+            gdf (geopandas.GeoDataFrame): Source GeoDataFrame
+        """
+        num_collections = len(self.ax.collections)
+        gdf.plot(
+            column=np.arange(len(gdf), dtype=float),
+            ax=self.ax,
+            cmap=self.cmap,
+            **self.kwargs,
+        )
+        self._geo_collections = [
+            (collection, np.asarray(collection.get_array(), dtype=int))
+            for collection in self.ax.collections[num_collections:]
+        ]
+
+    def rasterize_polygons(self) -> None:
+        """ Replace the polygon collections with a `ChoroplethImage`, which draws them as one image however detailed they are
+
+        Polygon edges are still drawn by their collection if they have a color of their own.
+        """
+        from matplotlib.collections import PatchCollection
+
+        from .raster import ChoroplethImage
+
+        polygons = [
+            (collection, rows)
+            for collection, rows in self._geo_collections
+            if isinstance(collection, PatchCollection)
+        ]
+        if not polygons:
+            return
+        collection = polygons[0][0]
+        image = ChoroplethImage(
+            [path for collection, _ in polygons for path in collection.get_paths()],
+            np.concatenate([rows for _, rows in polygons]),
+            len(self.df),
+            self.ax.transData,
+            norm=collection.norm,
+            cmap=collection.get_cmap(),
+        )
+        image.set_alpha(collection.get_alpha())
+        image.set_zorder(collection.get_zorder())
+        self.ax.add_artist(image)
+        for collection, _ in polygons:
+            collection.set_array(None)
+            collection.set_facecolor("none")
+            edge_colors = collection.get_edgecolor()
+            if not (len(edge_colors) and edge_colors[:, 3].any()):
+                collection.remove()
+        self._geo_collections = [
+            (collection, rows)
+            for collection, rows in self._geo_collections
+            if not isinstance(collection, PatchCollection)
+        ] + [(image, np.arange(len(self.df)))]
+
+    def update_geo_collections(self, i: int) -> None:
+        """ Color the geometry collections by the values of frame `i`, and size the markers of point maps
+
+        Like `GeoDataFrame.plot`, colors are normalised to the frame's values unless `vmin` or `vmax` are given, and geometries without a value aren't shown.
+
+        Args:
+            i (int): Frame number
+        """
+        values = self.get_geo_values()[i]
+        present = ~np.isnan(values)
+        if present.any():
+            vmin = self.kwargs.get("vmin", values[present].min())
+            vmax = self.kwargs.get("vmax", values[present].max())
+        for collection, rows in self._geo_collections:
+            collection_values = values[rows]
+            collection.set_array(np.ma.masked_invalid(collection_values))
+            if present.any() and "norm" not in self.kwargs:
+                collection.set_clim(vmin, vmax)
+            if self.enable_markersize and isinstance(collection, PathCollection):
+                collection.set_sizes(
+                    np.nan_to_num(collection_values * self.scale_markersize)
+                )
+
+    def reset_frames(self, first: int = 0) -> None:
+        """ Also removes the basemap and rasterized polygons, which are added again on the first frame
+
+        Args:
+            first (int, optional): Frame number to draw next. Defaults to 0.
+        """
+        for image in self.ax.images + self.ax.artists:
+            image.remove()
+        super().reset_frames(first)
 
     def anim_func(self, i: int) -> None:
         """ Animation function
@@ -208,28 +601,87 @@ class MapChart(_BaseChart):
         if self.enable_progress_bar:
             self.update_progress_bar()
 
-        self.ax.clear()
-        self.ax.set_axis_off()
-        self.plot_geo_data(i, self.df)
+        if not self.uses_geo_collections():
+            self.ax.clear()
+            self.ax.set_axis_off()
+            self.plot_geo_data(i, self.df)
+        else:
+            # Geometries don't change between frames, only their colors & sizes do
+            if self.is_first_frame(i):
+                self.ax.set_axis_off()
+                self.create_geo_collections(self.df)
+                if self.engine == "raster":
+                    self.rasterize_polygons()
+                if self.basemap_format:
+                    self.add_basemap()
+            self.update_geo_collections(i)
         if self.period_fmt:
             self.show_period(i)
 
     def init_func(self) -> None:
         """ Initialization function for animation
         """
-        column_to_plot = self.df.columns[0]
-        self.df.plot(
-            column=column_to_plot,
-            markersize=self.df[column_to_plot],
-            # cmap='viridis',
-        )
-        # self.ax.scatter([], [])
+        # Geometries are plotted by `anim_func` on the first frame
+        pass
+
+    def get_frame_data(self, i: int) -> typing.Tuple:
+        """ Map frames show a single (period) column of values
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            typing.Tuple: Period & values of frame `i`
+        """
+        return (self.geo_frames.periods[i], self.geo_frames.get_frame(i))
+
+    def get_style_params(self) -> typing.Dict[str, typing.Any]:
+        """ Geometries change how every frame looks, so are included with the chart's style
+
+        Returns:
+            typing.Dict[str, typing.Any]: Chart style parameters
+        """
+        params = super().get_style_params()
+        params["geometry"] = [shape.wkb for shape in self.df.geometry]
+        return params
 
     def get_frames(self):
         """
         Get number of frames to animate
         """
-        return range(len(self.get_data_cols(self.df)))
+        return range(len(self.geo_frames))
+
+    def get_period_labels(self) -> np.ndarray:
+        """ Period label of every frame, formatted once
+
+        Returns:
+            np.ndarray: Object array of period labels, one per frame
+        """
+        if getattr(self, "_period_labels", None) is None:
+            self._period_labels = self.format_periods(self.geo_frames.periods)
+        return self._period_labels
+
+    def get_period_texts(self, i: int) -> typing.Tuple:
+        """ Maps only show the period label
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            typing.Tuple: Period label, None if not shown
+        """
+        return (self.get_period_text(i) if self.period_label else None,)
+
+    def get_repeated_frames(self) -> np.ndarray:
+        """ Map frames show a single (period) column, frames repeat when its values and period label do
+
+        Returns:
+            np.ndarray: Boolean for each frame
+        """
+        values = pd.DataFrame(self.get_geo_values())
+        return self.get_repeated_periods(
+            pd.util.hash_pandas_object(values, index=False).values
+        )
 
     def show_period(self, i: int) -> None:
         """
@@ -242,21 +694,14 @@ class MapChart(_BaseChart):
             ValueError: If custom period label location is used must contain `x`, `y` and `s` in dictionary.
         """
         if self.period_label:
-            if self.period_fmt:
-                idx_val = self.df.columns[i]
-                if type(idx_val) == pd.Timestamp:  # Date time
-                    s = idx_val.strftime(self.period_fmt)
-                else:
-                    s = self.period_fmt.format(x=idx_val)
-            else:
-                s = self.df.columns.astype(str)[i]
-            num_texts = len(self.ax.texts)
-            if num_texts == 0:
-                # first frame
-                self.ax.text(
+            s = self.get_period_text(i)
+            period_text = getattr(self, "_period_text", None)
+            # Also created again after the axes are cleared, the basemap's attribution is a text too
+            if period_text not in self.ax.texts:
+                self._period_text = self.ax.text(
                     s=s,
                     transform=self.ax.transAxes,
                     **self.get_period_label(self.period_label),
                 )
             else:
-                self.ax.texts[0].set_text(s)
+                period_text.set_text(s)
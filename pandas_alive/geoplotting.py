@@ -6,7 +6,9 @@ import pandas as pd
 from matplotlib.animation import FuncAnimation
 from matplotlib.colors import Colormap
 
+from .cache import FrameCache, GeometryCache
 from .geocharts import MapChart
+from .tiles import TileStore
 from pandas_alive.plotting import verify_filename
 
 
@@ -32,10 +34,16 @@ def geoplot(
     dpi: float = 144,
     writer: str = None,
     enable_progress_bar: bool = False,
+    frame_cache: typing.Union[FrameCache, str] = None,
+    append: bool = False,
     # Geo Chart
     basemap_format: typing.Dict = None,
     enable_markersize: bool = False,
     scale_markersize: float = 1,
+    engine: str = "agg",
+    simplify: bool = False,
+    geometry_cache: typing.Union[GeometryCache, str] = None,
+    tile_store: typing.Union[TileStore, str] = None,
     **kwargs,
 ):
     """
@@ -43,10 +51,16 @@ def geoplot(
 
 
     Args:
-        basemap_format (Dict, optional): If provided with a dictionary with keywords arguments as per https://contextily.readthedocs.io/en/latest/reference.html#contextily.add_basemap, this will add a basemap. Defaults to None.
-            Ensure to have contextily installed: https://contextily.readthedocs.io/en/latest/index.html
+        frame_cache (typing.Union[FrameCache, str], optional): Reuse frames from a previous save when their data and styling are unchanged, see :func: pandas_alive.plotting.plot. Defaults to None.
+        append (bool, optional): Only render and append frames for periods added since the previous save to `filename`, see :func: pandas_alive.plotting.plot. Defaults to False.
+        basemap_format (Dict, optional): If provided with a dictionary with keywords arguments as per https://contextily.readthedocs.io/en/latest/reference.html#contextily.add_basemap, this will add a basemap. It's fetched once and drawn again every frame. Defaults to None.
+            Ensure to have contextily installed: https://contextily.readthedocs.io/en/latest/index.html, or use a `tile_store`.
         enable_markersize (bool, optional): Set to True if using Points, this will use the values being plotted as the size of the markers. Defaults to False.
         scale_markersize (float, optional): To be used with enable_markersize, this will scale the size of the markers by the number specified. Defaults to 1.
+        engine (str, optional): How polygons are drawn. "agg" draws them as a matplotlib collection every frame. "raster" rasterizes them once into an image of polygon numbers and colors it with a lookup each frame, so frames of detailed maps draw many times faster, apart from polygons not being antialiased. Points, lines and plots using classification schemes, categories or legends are drawn the same with either. Defaults to "agg".
+        simplify (bool, optional): Simplify geometries once by half a pixel at the chart's size & `dpi`, so detailed boundaries draw with fewer vertices every frame. With `fig=` axes whose limits are set, geometries are also clipped to the limits. Defaults to False.
+        geometry_cache (typing.Union[GeometryCache, str], optional): Cache (or directory for one) to store simplified geometries in, so they're only simplified once for each resolution. Defaults to None.
+        tile_store (typing.Union[TileStore, str], optional): Store (or directory for one) of basemap tiles on local disk, so basemaps render without network access once the store holds their tiles. A directory downloads missing tiles from the `source` URL of `basemap_format`, if given. Defaults to None.
 
     Returns:
         MapChart: Returns an instance of the MapChart class for use in multiple plots or save.
@@ -72,8 +86,14 @@ def geoplot(
         basemap_format=basemap_format,
         enable_markersize=enable_markersize,
         scale_markersize=scale_markersize,
+        engine=engine,
+        simplify=simplify,
+        geometry_cache=geometry_cache,
+        tile_store=tile_store,
         kwargs=kwargs,
     )
     if filename:
-        map_chart.save(verify_filename(filename))
+        map_chart.save(
+            verify_filename(filename), frame_cache=frame_cache, append=append
+        )
     return map_chart
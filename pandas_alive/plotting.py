@@ -13,9 +13,12 @@ from typing import Sequence
 import matplotlib.pyplot as plt
 import pandas as pd
 from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import Colormap
 from pandas.core.base import PandasObject
 
+from ._base_chart import PREVIEW_DPI_SCALE, SaveProgress, _iter_steps_async
+from .cache import FrameCache
 from .charts import (
     BarChart,
     BarChartRace,
@@ -24,6 +27,7 @@ from .charts import (
     PieChart,
     ScatterChart,
 )
+from .encoders import get_encoder
 
 
 def get_allowed_kinds() -> typing.List[str]:
@@ -83,6 +87,10 @@ def plot(
     dpi: int = 144,
     writer: str = None,
     enable_progress_bar: bool = False,
+    frame_cache: typing.Union[FrameCache, str] = None,
+    append: bool = False,
+    frame_budget: int = None,
+    preview: bool = False,
     # Bar chart
     orientation: str = "h",
     sort: str = "desc",
@@ -91,6 +99,7 @@ def plot(
     n_visible: int = None,
     fixed_order: typing.Union[bool, list] = False,
     perpendicular_bar_func: typing.Union[typing.Callable, str] = None,
+    engine: str = "agg",
     # Line Chart
     line_width: int = 2,
     label_events: typing.Dict[str, datetime.datetime] = None,
@@ -184,12 +193,37 @@ def plot(
 
                 df.plot_animated(period_summary_func=func)
 
+            Functions marked with `pandas_alive.vectorized` are called once with the DataFrame of all frames instead, returning one string per frame in "s".
+            .. code-block::
+                @pandas_alive.vectorized
+                def func(df):
+                    s = df.sum(axis=1).map('Total Generation: {}'.format)
+                    return {'x': .85, 'y': .2, 's': s, 'ha': 'right', 'size': 11}
+
         dpi (float, optional): It is possible for some bars to be out of order momentarily during a transition since both height and location change linearly. Defaults to 144.
 
         writer (str, optional): Specify writer library, must be within list of available writers (`matplotlib.animation.writers.list()`) and `pillow` is not supported. Defaults to None.
 
         enable_progress_bar (bool,optional): Enable tqdm bar to show progress on generating animation, see more details at https://github.com/tqdm/tqdm. Defaults to False.
 
+        frame_cache (typing.Union[FrameCache, str], optional): Reuse frames from a previous save when their data and styling are unchanged, only redrawing frames that changed. Provide a `pandas_alive.FrameCache` or a directory to store frames in. Only supported for GIFs and the ffmpeg writer. Defaults to None.
+            .. code-block::
+                cache = pandas_alive.FrameCache("~/.cache/pandas_alive", max_bytes=2 * 2 ** 30)
+                df.plot_animated(filename="race.mp4", frame_cache=cache)
+
+        append (bool, optional): Render incrementally as rows are added to the DataFrame. If the data extends the data previously saved to `filename`, only frames for the new periods are rendered (interpolating from the last previous row) and appended to the existing GIF or video without re-encoding it.
+            A manifest of rendered frames is kept next to the file (`<filename>.pandas_alive.json`). If fixed limits change (eg, `fixed_max=True` with a new maximum), a warning lists the previously rendered frames that need a re-render. Only supported for GIFs and the ffmpeg writer. Defaults to False.
+            .. code-block::
+                # Run daily as new rows are added
+                df.plot_animated(filename="covid-race.mp4", append=True)
+
+        frame_budget (int, optional): Adaptive timeline, only draw this many distinct frames. Periods with large changes in values or ranks get more of the `steps_per_period` interpolation steps than calm ones, frames between steps hold the previous step and are repeated rather than drawn, so the animation's duration and pacing don't change. Defaults to None.
+            .. code-block::
+                # Smooth where the leaderboard reshuffles, at most 200 frames drawn
+                df.plot_animated(filename="race.gif", steps_per_period=20, frame_budget=200)
+
+        preview (bool, optional): Draft render to check an animation before the final render. Only a couple of frames per period are drawn, each shown for longer so the duration and period pacing match, at a quarter of the resolution without antialiasing, tick labels or bar labels. The layout is the same as the final render. Defaults to False.
+
         sort (str, optional): 'asc' or 'desc'. Choose how to sort the bars. Use 'desc' to put largest bars on top and 'asc' to place largest bars on bottom. Defaults to "desc".
 
         label_bars (bool, optional): Whether to label the bars with their value on their right. Defaults to True.
@@ -226,8 +260,18 @@ def plot(
                 def func(values):
                     return values.quantile(.75).
 
+            String aggregations are calculated for all frames at once. Functions marked with `pandas_alive.vectorized` are also called once, with DataFrames of all frames' values & ranks, and return one value per frame.
+            .. code-block::
+                @pandas_alive.vectorized
+                def func(df, df_rank):
+                    return df.quantile(.75, axis=1)
+
             Defaults to None.
 
+        engine (str, optional): How bar chart races draw frames when saved or drawn on their own. "agg" lays out & draws matplotlib artists every frame. "raster" draws the figure's background and layout once with matplotlib, then fills bars in as rectangles and blends in texts rendered once as sprites, which is many times faster and looks the same apart from bar edges not being antialiased. `animate_multiple_plots` always draws with matplotlib. Defaults to "agg".
+            .. code-block::
+                df.plot_animated(filename="race.mp4", engine="raster")
+
         line_width (int, optional): Line width provided on line charts. Defaults to 2.
 
         label_events (typing.Dict[str,datetime.datetime],optional): Provide list of events to label with a vertical bar on line charts. Defaults to None.
@@ -312,9 +356,14 @@ def plot(
             fixed_order=fixed_order,
             perpendicular_bar_func=perpendicular_bar_func,
             kwargs=kwargs,
+            engine=engine,
         )
+        if frame_budget:
+            bcr.apply_frame_budget(frame_budget)
+        if preview:
+            bcr.apply_preview()
         if filename:
-            bcr.save(verify_filename(filename))
+            bcr.save(verify_filename(filename), frame_cache=frame_cache, append=append)
         return bcr
 
     elif kind == "line":
@@ -341,8 +390,14 @@ def plot(
             add_legend=add_legend,
             kwargs=kwargs,
         )
+        if frame_budget:
+            line_race.apply_frame_budget(frame_budget)
+        if preview:
+            line_race.apply_preview()
         if filename:
-            line_race.save(verify_filename(filename))
+            line_race.save(
+                verify_filename(filename), frame_cache=frame_cache, append=append
+            )
         return line_race
     elif kind == "scatter":
         animated_scatter = ScatterChart(
@@ -366,8 +421,14 @@ def plot(
             add_legend=add_legend,
             kwargs=kwargs,
         )
+        if frame_budget:
+            animated_scatter.apply_frame_budget(frame_budget)
+        if preview:
+            animated_scatter.apply_preview()
         if filename:
-            animated_scatter.save(verify_filename(filename))
+            animated_scatter.save(
+                verify_filename(filename), frame_cache=frame_cache, append=append
+            )
         return animated_scatter
     elif kind == "pie":
         animated_pie = PieChart(
@@ -389,8 +450,14 @@ def plot(
             enable_progress_bar=enable_progress_bar,
             kwargs=kwargs,
         )
+        if frame_budget:
+            animated_pie.apply_frame_budget(frame_budget)
+        if preview:
+            animated_pie.apply_preview()
         if filename:
-            animated_pie.save(verify_filename(filename))
+            animated_pie.save(
+                verify_filename(filename), frame_cache=frame_cache, append=append
+            )
         return animated_pie
     elif kind == "bar":
         animated_bar = BarChart(
@@ -412,8 +479,14 @@ def plot(
             enable_progress_bar=enable_progress_bar,
             kwargs=kwargs,
         )
+        if frame_budget:
+            animated_bar.apply_frame_budget(frame_budget)
+        if preview:
+            animated_bar.apply_preview()
         if filename:
-            animated_bar.save(verify_filename(filename))
+            animated_bar.save(
+                verify_filename(filename), frame_cache=frame_cache, append=append
+            )
         return animated_bar
     elif kind == "bubble":
         animated_bubble = BubbleChart(
@@ -441,11 +514,81 @@ def plot(
             color_data_label=color_data_label,
             kwargs=kwargs,
         )
+        if frame_budget:
+            animated_bubble.apply_frame_budget(frame_budget)
+        if preview:
+            animated_bubble.apply_preview()
         if filename:
-            animated_bubble.save(verify_filename(filename))
+            animated_bubble.save(
+                verify_filename(filename), frame_cache=frame_cache, append=append
+            )
         return animated_bubble
 
 
+def setup_subplot(
+    plot: typing.Union[BarChartRace, LineChart, PieChart, ScatterChart], ax: plt.Axes,
+) -> None:
+    """ Style axes as a subplot of multiple plots and make it the plot's axes
+
+    Args:
+        plot (typing.Union[BarChartRace, LineChart, PieChart, ScatterChart]): Plot to draw on `ax`
+        ax (plt.Axes): Subplot axes
+    """
+    ax = plot.apply_style(ax)
+    ax.set_title(plot.title)
+    plot.ax = ax
+    # plot.set_x_y_limits(plot.df,1,axes[num])
+    if plot.fixed_max:
+        # Hodgepodge way of fixing this, should refactor to contain all figures and axes
+        # TODO plot.axes_format(self,ax) and pass current ax or desired ax
+        if plot.__class__.__name__ == "BarChartRace" and plot.orientation == "h":
+            ax.set_xlim(ax.get_xlim()[0], plot.df.values.max() * 1.1)
+        elif plot.__class__.__name__ == "BarChartRace" and plot.orientation == "v":
+            ax.set_ylim(ax.get_ylim()[0], plot.df.values.max() * 1.1)
+    # TODO: add colorbar from bubbleChart if it exists, into multiple plots
+
+
+def _iter_save_composite(
+    filename: str,
+    frames: typing.Iterator["np.ndarray"],
+    num_frames: int,
+    fps: float,
+    interval: float,
+    progress_bar: "tqdm.tqdm" = None,
+) -> typing.Iterator[SaveProgress]:
+    """ Encode composited frames, yielding progress after each frame written
+
+    Args:
+        filename (str): GIF or video file name to write
+        frames (typing.Iterator[np.ndarray]): RGBA frames, see :func: pandas_alive.compositing.iter_composite_frames
+        num_frames (int): Number of frames
+        fps (float): Frames per second for videos
+        interval (float): Milliseconds per frame for GIFs
+        progress_bar (tqdm.tqdm, optional): Progress bar to update after each frame. Defaults to None.
+
+    Yields:
+        SaveProgress: Number of frames written so far
+    """
+    from PIL import Image
+
+    encoder = get_encoder(filename, fps, interval)
+    try:
+        for num, frame in enumerate(frames):
+            encoder.add_frame(Image.fromarray(frame, "RGBA"))
+            if progress_bar is not None:
+                progress_bar.update(1)
+            yield SaveProgress(filename, num + 1, num_frames)
+    except BaseException:
+        encoder.abort()
+        raise
+    finally:
+        # Stops worker processes when the save ends early
+        frames.close()
+    encoder.finish()
+    if progress_bar is not None:
+        progress_bar.close()
+
+
 def animate_multiple_plots(
     filename: str,
     plots: typing.List[typing.Union[BarChartRace, LineChart, PieChart, ScatterChart]],
@@ -460,6 +603,9 @@ def animate_multiple_plots(
     adjust_subplot_top: float = 0.9,
     adjust_subplot_wspace: float = 0.2,
     adjust_subplot_hspace: float = 0.25,
+    composite: bool = False,
+    workers: int = None,
+    preview: bool = False,
 ):
     """ Plot multiple animated subplots with plt.subplots().
 
@@ -489,15 +635,98 @@ def animate_multiple_plots(
         adjust_subplot_wspace (float, optional): the amount of width reserved for space between subplots, expressed as a fraction of the average axis width. Defaults to 0.2.
         
         adjust_subplot_hspace (float, optional): the amount of height reserved for space between subplots, expressed as a fraction of the average axis height. Defaults to 0.25.
+        composite (bool, optional): Draw each plot on its own offscreen canvas, in parallel worker processes, and composite the frames instead of drawing all plots on one figure. Only GIFs and ffmpeg videos are supported. Defaults to False.
+        workers (int, optional): With `composite=True`, number of processes to draw plots in, 0 draws them all in this process. Defaults to one process per plot.
+        preview (bool, optional): Draft render to check the animation before the final render, see :func: pandas_alive.plotting.plot. Defaults to False.
 
     Raises:
         UserWarning: If Error found when plotting, prompt user to ensure indexes of plots are same length.
     """
+    for _ in iter_animate_multiple_plots(
+        filename,
+        plots,
+        custom_fig=custom_fig,
+        title=title,
+        title_fontsize=title_fontsize,
+        dpi=dpi,
+        enable_progress_bar=enable_progress_bar,
+        adjust_subplot_left=adjust_subplot_left,
+        adjust_subplot_right=adjust_subplot_right,
+        adjust_subplot_bottom=adjust_subplot_bottom,
+        adjust_subplot_top=adjust_subplot_top,
+        adjust_subplot_wspace=adjust_subplot_wspace,
+        adjust_subplot_hspace=adjust_subplot_hspace,
+        composite=composite,
+        workers=workers,
+        preview=preview,
+    ):
+        pass
+
+
+async def animate_multiple_plots_async(
+    filename: str,
+    plots: typing.List[typing.Union[BarChartRace, LineChart, PieChart, ScatterChart]],
+    executor: "concurrent.futures.Executor" = None,
+    timeout: float = None,
+    progress_callback: typing.Callable[[SaveProgress], None] = None,
+    **kwargs,
+) -> None:
+    """ Plot multiple animated subplots without blocking the event loop
+
+    Frames are drawn one at a time in `executor`. On cancellation or timeout, the save stops after the frame being drawn and partial output is removed, see `_BaseChart.iter_save_async`.
+
+    Example:
+        ``await pandas_alive.animate_multiple_plots_async("multiple.gif", [bar_chart, line_chart], timeout=120)``
+
+    Args:
+        filename (str): Output file name with extension to write to.
+        plots (typing.List[typing.Union[BarChartRace, LineChart, PieChart, ScatterChart]]): List of chart instances.
+        executor (concurrent.futures.Executor, optional): Executor to draw frames in. Defaults to the event loop's default executor.
+        timeout (float, optional): Seconds allowed for the whole save before raising `asyncio.TimeoutError`. Defaults to None.
+        progress_callback (typing.Callable[[SaveProgress], None], optional): Called in the event loop with progress after each frame. Defaults to None.
+        **kwargs: Options as per :func: pandas_alive.plotting.animate_multiple_plots
+    """
+    steps = iter_animate_multiple_plots(filename, plots, stepwise=True, **kwargs)
+    async for progress in _iter_steps_async(steps, executor, timeout):
+        if progress_callback is not None:
+            progress_callback(progress)
+
+
+def iter_animate_multiple_plots(
+    filename: str,
+    plots: typing.List[typing.Union[BarChartRace, LineChart, PieChart, ScatterChart]],
+    custom_fig: plt.Figure = None,
+    title: str = None,
+    title_fontsize: typing.Union[int, float, str] = 16,
+    dpi: int = 144,
+    enable_progress_bar: bool = False,
+    adjust_subplot_left: float = 0.15,
+    adjust_subplot_right: float = 0.9,
+    adjust_subplot_bottom: float = 0.1,
+    adjust_subplot_top: float = 0.9,
+    adjust_subplot_wspace: float = 0.2,
+    adjust_subplot_hspace: float = 0.25,
+    composite: bool = False,
+    workers: int = None,
+    preview: bool = False,
+    stepwise: bool = False,
+) -> typing.Iterator[SaveProgress]:
+    """ Plot multiple animated subplots, yielding progress after each frame written
+
+    See :func: pandas_alive.plotting.animate_multiple_plots for arguments.
+
+    Args:
+        stepwise (bool, optional): Write videos frame by frame with ffmpeg instead of in a single step with `FuncAnimation.save`. Defaults to False.
+
+    Yields:
+        SaveProgress: Number of frames written so far
+    """
     # Current figure just number of rows for number of plots
     # TODO add option for number of rows/columns
     # TODO Use gridspec?
     if not custom_fig:
         fig = plt.Figure()
+        FigureCanvasAgg(fig)
         for i in range(len(plots)):
             fig.add_subplot(len(plots), 1, i+1)
         axes = fig.axes
@@ -520,6 +749,10 @@ def animate_multiple_plots(
             for item in ax.lines + ax.collections + ax.containers + ax.texts:
                 item.remove()
 
+    if preview:
+        for plot in plots:
+            plot.apply_preview()
+        dpi = max(1, int(dpi * PREVIEW_DPI_SCALE))
     num_frames = len(plots[0].get_frames())
     # This is setup here and not based directly on a plot df (e.g. plots[0]) 
     # coz it causes trouble when passing a `custom_fig` and re-using axes. 
@@ -551,8 +784,7 @@ def animate_multiple_plots(
     
 
     # Otherwise titles overlap and adjust_subplot does nothing
-    from matplotlib import rcParams
-    rcParams.update({"figure.autolayout": False})
+    fig.set_tight_layout(False)
 
     if title is not None:
         fig.suptitle(title)
@@ -579,20 +811,32 @@ def animate_multiple_plots(
     # plt.subplots_adjust()
     # plt.rcParams.update({'figure.autolayout': True})
     num_plots = len(plots)
-    for num, plot in enumerate(plots):
-        axes[num] = plot.apply_style(axes[num])
-        axes[num].set_title(plot.title)
-        plot.ax = axes[num]
-        # plot.set_x_y_limits(plot.df,1,axes[num])
-        if plot.fixed_max:
-            # Hodgepodge way of fixing this, should refactor to contain all figures and axes
-            # TODO plot.axes_format(self,ax) and pass current ax or desired ax
-            if plot.__class__.__name__ == "BarChartRace" and plot.orientation == "h":
-                axes[num].set_xlim(axes[num].get_xlim()[0], plot.df.values.max() * 1.1)
-            elif plot.__class__.__name__ == "BarChartRace" and plot.orientation == "v":
-                axes[num].set_ylim(axes[num].get_ylim()[0], plot.df.values.max() * 1.1)
-        # TODO: add colorbar from bubbleChart if it exists, into multiple plots
+    if composite:
+        from .compositing import iter_composite_frames
 
+        if len(fig.axes) != num_plots:
+            raise ValueError(
+                "Ensure number of axes in figure and number of plots match"
+            )
+        if plots[0].writer not in (None, "ffmpeg"):
+            raise ValueError(
+                "`composite=True` writes GIFs or videos with ffmpeg, `writer` must be None or 'ffmpeg'"
+            )
+        filename = verify_filename(filename)
+        interval = plots[0].period_length / plots[0].steps_per_period
+        frames = iter_composite_frames(fig, plots, num_frames, dpi, workers)
+        yield from _iter_save_composite(
+            filename,
+            frames,
+            num_frames,
+            1000 / interval,
+            interval,
+            progress_bar if enable_progress_bar else None,
+        )
+        return
+
+    for num, plot in enumerate(plots):
+        setup_subplot(plot, axes[num])
         plot.init_func()
 
     # Check for number of axes vs plots here, in case a colorbar axes has been added.
@@ -602,11 +846,14 @@ def animate_multiple_plots(
         )
 
     
-    def save_multiple(filename: str) -> None:
+    def save_multiple(filename: str) -> typing.Iterator[SaveProgress]:
         """ Save method for `FuncAnimation` for multiple plots.
 
         Args:
             filename (str): File name with extension to save animation to, supported formats at https://matplotlib.org/3.1.1/api/animation_api.html
+
+        Yields:
+            SaveProgress: Number of frames written so far
         """
         fps = 1000 / plots[0].period_length * plots[0].steps_per_period
         interval = plots[0].period_length / plots[0].steps_per_period
@@ -622,35 +869,39 @@ def animate_multiple_plots(
         )
 
         extension = filename.split(".")[-1]
+        # Other writers can only save all frames in one go
+        encode_video = stepwise and plots[0].writer in (None, "ffmpeg")
         try:
-            if plots[0].writer:
+            if plots[0].writer and not encode_video:
                 anim.save(filename, fps=fps, dpi=dpi, writer=plots[0].writer)
+                yield SaveProgress(filename, num_frames, num_frames)
             else:
-                if extension == "gif":
+                if extension == "gif" or encode_video:
                     import io
-                    import matplotlib
-                    matplotlib.use("Agg")
                     from PIL import Image
 
-                    frames = []
-                    for frame in range(0, num_frames):
-                        update_all_graphs(frame)
-                        buffer = io.BytesIO()
-                        fig.savefig(buffer, format="png")
-                        buffer.seek(0)
-                        image = Image.open(buffer)
-                        plt.close()
-                        frames.append(image)
-                    frames[0].save(
-                        filename,
-                        save_all=True,
-                        append_images=frames[:],
-                        optimize=False,
-                        duration=interval,
-                        loop=0,
-                    )
+                    encoder = get_encoder(filename, fps, interval)
+                    try:
+                        for frame in range(0, num_frames):
+                            update_all_graphs(frame)
+                            buffer = io.BytesIO()
+                            # GIFs are drawn at the figure's resolution rather than `dpi`
+                            fig.savefig(
+                                buffer,
+                                format="png",
+                                dpi=fig.dpi * PREVIEW_DPI_SCALE if preview else None,
+                            )
+                            buffer.seek(0)
+                            image = Image.open(buffer)
+                            encoder.add_frame(image)
+                            yield SaveProgress(filename, frame + 1, num_frames)
+                    except BaseException:
+                        encoder.abort()
+                        raise
+                    encoder.finish()
                 else:
                     anim.save(filename, fps=fps, dpi=dpi)
+                    yield SaveProgress(filename, num_frames, num_frames)
             if enable_progress_bar:
                 progress_bar.close()
             # Clearing axes contents after save, so that fig, axes can be re-used in a 
@@ -662,7 +913,7 @@ def animate_multiple_plots(
                 "Ensure that a matplotlib writer library is installed, see https://github.com/JackMcKew/pandas_alive/blob/main/README.md#requirements for more details"
             )
     # save multiple plots
-    save_multiple(verify_filename(filename))
+    yield from save_multiple(verify_filename(filename))
 
 
 ##############################################################################
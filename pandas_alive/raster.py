@@ -0,0 +1,956 @@
+""" Draw bar chart race frames straight into NumPy arrays instead of through matplotlib's artists
+
+The parts of the figure that don't change between frames (figure & axes faces, title) are drawn once with matplotlib. Each frame starts from a copy of them, bars & grid lines are filled in as rectangles and texts are blended in from sprites. Values change every frame, so their texts are composed from sprites of each character instead. Styling & layout come from the chart's figure, so frames look the same as those drawn with Agg, apart from bar edges not being antialiased.
+
+Sprites are kept in a `SpriteCache`, which rasterizes each string once per style. It can be shared with `SpriteText` artists drawn by matplotlib's Agg renderer, or used to draw labels into frames of other engines.
+
+Map charts with `engine="raster"` draw their polygons as a `ChoroplethImage`, rasterized once into an image of polygon numbers which each frame colors with a lookup.
+
+Example:
+    ``df.plot_animated("race.gif", engine="raster")``
+"""
+
+import collections
+import typing
+
+import attr
+import numpy as np
+from matplotlib import artist, cm
+from matplotlib.text import Text
+
+
+@attr.s
+class Sprite:
+    """
+    Image of a text, drawn wherever the text is drawn
+
+    Args:
+        image (np.ndarray): RGBA image of shape (height, width, 4)
+        anchor (typing.Tuple[float, float]): (column, row) of the text's position in the image, which it's aligned to. Its fractional part rounds the sprite to pixels the way Agg rounds the text.
+    """
+
+    image: np.ndarray = attr.ib()
+    anchor: typing.Tuple[float, float] = attr.ib()
+
+    def __attrs_post_init__(self):
+        """ Premultiply colors by opacity for blending
+        """
+        self.alpha = self.image[..., 3:].astype(np.float32) / 255
+        self.color = self.image[..., :3] * self.alpha
+
+    def get_position(self, x: float, y: float) -> typing.Tuple[int, int]:
+        """ Pixel of the sprite's top left corner when its anchor is at (x, y)
+
+        Args:
+            x (float): Column
+            y (float): Row, counting down from the top
+
+        Returns:
+            typing.Tuple[int, int]: (column, row) of the top left corner
+        """
+        return int(round(x - self.anchor[0])), int(round(y - self.anchor[1]))
+
+    def draw(self, frame: np.ndarray, x: float, y: float) -> None:
+        """ Blend sprite into frame with its anchor at pixel (x, y), clipped to the frame
+
+        Args:
+            frame (np.ndarray): RGBA frame of shape (height, width, 4)
+            x (float): Column
+            y (float): Row, counting down from the top
+        """
+        height, width = self.alpha.shape[:2]
+        left, top = self.get_position(x, y)
+        rows = slice(max(top, 0), min(top + height, frame.shape[0]))
+        columns = slice(max(left, 0), min(left + width, frame.shape[1]))
+        if rows.start >= rows.stop or columns.start >= columns.stop:
+            return
+        sprite_rows = slice(rows.start - top, rows.stop - top)
+        sprite_columns = slice(columns.start - left, columns.stop - left)
+        region = frame[rows, columns, :3]
+        blended = region * (1 - self.alpha[sprite_rows, sprite_columns])
+        blended += self.color[sprite_rows, sprite_columns]
+        region[...] = blended + 0.5
+
+    def draw_agg(
+        self, renderer: "RendererAgg", gc: "GraphicsContextBase", x: float, y: float
+    ) -> None:
+        """ Draw sprite with matplotlib's Agg renderer, with its anchor at (x, y)
+
+        Args:
+            renderer (RendererAgg): Renderer to draw with
+            gc (GraphicsContextBase): Graphics context, eg with clipping
+            x (float): Column in display coordinates
+            y (float): Row in display coordinates, counting up from the bottom
+        """
+        height = self.image.shape[0]
+        if not self.image.size:
+            return
+        left, top = self.get_position(x, renderer.height - y)
+        # Images are drawn from their bottom row up
+        renderer.draw_image(gc, left, renderer.height - top - height, self.image[::-1])
+
+
+def get_font_lock() -> "threading.RLock":
+    """ Lock on the fonts matplotlib shares between threads
+
+    Agg holds it while drawing a figure, texts measured or rasterized outside of a figure's draw hold it too, so charts can be rendered on several threads at once.
+
+    Returns:
+        threading.RLock: Reentrant lock, already held inside a figure's draw
+    """
+    from matplotlib.backends.backend_agg import RendererAgg
+
+    return RendererAgg.lock
+
+
+def get_pixel_offset(
+    text: "matplotlib.text.Text", renderer: "RendererAgg"
+) -> typing.Tuple[float, float]:
+    """ Offset Agg adds to a text's position before rounding it to the pixel its bitmap is drawn at
+
+    Args:
+        text (matplotlib.text.Text): Text
+        renderer (RendererAgg): Renderer the text is drawn with
+
+    Returns:
+        typing.Tuple[float, float]: (column, row) offset in pixels, zero for texts with several lines or mathtext, which are rounded differently
+    """
+    from matplotlib.backends.backend_agg import get_hinting_flag
+    from matplotlib.font_manager import findfont, get_font
+
+    _, info, _ = text._get_layout(renderer)
+    s = text.get_text()
+    if len(info) != 1 or text._preprocess_math(s)[1]:
+        return 0.0, 0.0
+    properties = text.get_fontproperties()
+    font = get_font(findfont(properties))
+    font.clear()
+    font.set_size(properties.get_size_in_points(), renderer.dpi)
+    font.set_text(s, 0.0, flags=get_hinting_flag())
+    descent = font.get_descent() / 64
+    bearing_x, bearing_y = (offset / 64 for offset in font.get_bitmap_offset())
+    angle = np.radians(text.get_rotation())
+    _, _, x, y = info[0]
+    return (
+        x + bearing_x + descent * np.sin(angle),
+        -y + bearing_y + descent * np.cos(angle),
+    )
+
+
+def render_text(text: "matplotlib.text.Text") -> Sprite:
+    """ Render text with matplotlib's Agg renderer, cropped to its pixels
+
+    Args:
+        text (matplotlib.text.Text): Text in a figure, positioned in pixels by an `IdentityTransform`. It's moved to fit the rendered image.
+
+    Returns:
+        Sprite: Rendered text
+    """
+    from matplotlib.backends.backend_agg import RendererAgg
+
+    dpi = text.figure.dpi
+    text.set_position((0, 0))
+    extent = text.get_window_extent(RendererAgg(1, 1, dpi))
+    x, y = np.ceil(2 - extent.x0), np.ceil(2 - extent.y0)
+    renderer = RendererAgg(
+        int(np.ceil(extent.width + 4)), int(np.ceil(extent.height + 4)), dpi
+    )
+    text.set_position((x, y))
+    text.draw(renderer)
+    image = np.array(renderer.buffer_rgba())
+    # Agg rounds the text's position to whole pixels after offsetting it, keeping the fractional part of the offset in the anchor rounds the sprite's position the same way
+    offset_x, offset_y = get_pixel_offset(text, renderer)
+    anchor = (
+        round(x + offset_x) - offset_x,
+        round(renderer.height - y + offset_y) - offset_y,
+    )
+
+    rows = np.flatnonzero(image[..., 3].any(axis=1))
+    columns = np.flatnonzero(image[..., 3].any(axis=0))
+    if not len(rows):
+        return Sprite(image[:0, :0], anchor)
+    return Sprite(
+        image[rows[0] : rows[-1] + 1, columns[0] : columns[-1] + 1],
+        (anchor[0] - columns[0], anchor[1] - rows[0]),
+    )
+
+
+@attr.s(frozen=True)
+class TextStyle:
+    """
+    Properties of a text its sprite depends on, apart from its string
+
+    Args:
+        font_properties (FontProperties): Font family, style, weight & size
+        color (typing.Tuple[float, float, float, float]): RGBA color from 0 to 1
+        rotation (float): Angle in degrees
+        ha (str): Horizontal alignment
+        va (str): Vertical alignment
+    """
+
+    font_properties: "FontProperties" = attr.ib()
+    color: typing.Tuple[float, float, float, float] = attr.ib()
+    rotation: float = attr.ib()
+    ha: str = attr.ib()
+    va: str = attr.ib()
+
+    @classmethod
+    def from_text(cls, text: "matplotlib.text.Text") -> "TextStyle":
+        """ Style of a matplotlib `Text`
+
+        Args:
+            text (matplotlib.text.Text): Text
+
+        Returns:
+            TextStyle: Its style
+        """
+        from matplotlib.colors import to_rgba
+
+        return cls(
+            text.get_fontproperties().copy(),
+            to_rgba(text.get_color(), text.get_alpha()),
+            text.get_rotation(),
+            text.get_ha(),
+            text.get_va(),
+        )
+
+    @classmethod
+    def from_kwargs(cls, **text_kwargs) -> "TextStyle":
+        """ Style of a matplotlib `Text` created with these properties
+
+        Args:
+            **text_kwargs: Properties of the matplotlib `Text`, eg fontsize, color, ha, va & rotation
+
+        Returns:
+            TextStyle: Its style
+        """
+        return cls.from_text(Text(0, 0, "", **text_kwargs))
+
+    def create_text(self, dpi: float) -> "matplotlib.text.Text":
+        """ Text in this style to render sprites with, positioned in pixels
+
+        Args:
+            dpi (float): Resolution to render at
+
+        Returns:
+            matplotlib.text.Text: Empty text in a figure
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.transforms import IdentityTransform
+
+        text = Text(
+            0,
+            0,
+            "",
+            transform=IdentityTransform(),
+            fontproperties=self.font_properties,
+            color=self.color,
+            rotation=self.rotation,
+            ha=self.ha,
+            va=self.va,
+        )
+        text.set_figure(Figure(dpi=dpi))
+        return text
+
+
+@attr.s
+class SpriteCache:
+    """
+    Sprites of texts, each string is rasterized once per style & resolution
+
+    Once it holds `max_sprites` sprites, the least recently used sprite is evicted for each new one, so strings that change from frame to frame (eg, values) don't make the cache grow without bound while labels drawn every frame (eg, column names) stay cached.
+
+    Example:
+        ``cache.get("USA", 144, TextStyle.from_kwargs(fontsize=8)).draw(frame, x, y)``
+
+    Args:
+        max_sprites (int, optional): Number of sprites to keep. Defaults to 4096.
+    """
+
+    max_sprites: int = attr.ib(default=4096)
+
+    def __attrs_post_init__(self):
+        """ Start empty
+        """
+        self._sprites = collections.OrderedDict()
+        self._uses = collections.OrderedDict()
+        self._texts = {}
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def get(
+        self, s: str, dpi: float, style: TextStyle, min_uses: int = 1
+    ) -> typing.Optional[Sprite]:
+        """ Sprite of a string, rendering it if it isn't cached
+
+        Args:
+            s (str): Text
+            dpi (float): Resolution to render at
+            style (TextStyle): Style of the text
+            min_uses (int, optional): Only render strings requested at least this many times, so strings only drawn once aren't rendered twice. Defaults to 1.
+
+        Returns:
+            typing.Optional[Sprite]: Rendered text, None if it hasn't been requested `min_uses` times yet
+        """
+        # Caches may be shared by charts drawn on other threads
+        with get_font_lock():
+            key = (s, dpi, style)
+            sprite = self._sprites.get(key)
+            if sprite is not None:
+                self._sprites.move_to_end(key)
+                return sprite
+            if min_uses > 1:
+                uses = self._uses.pop(key, 0) + 1
+                if uses < min_uses:
+                    self._uses[key] = uses
+                    if len(self._uses) > self.max_sprites:
+                        self._uses.popitem(last=False)
+                    return None
+
+            if (dpi, style) not in self._texts:
+                self._texts[(dpi, style)] = style.create_text(dpi)
+            text = self._texts[(dpi, style)]
+            text.set_text(s)
+            sprite = self._sprites[key] = render_text(text)
+            if len(self._sprites) > self.max_sprites:
+                self._sprites.popitem(last=False)
+            return sprite
+
+
+class SpriteText(Text):
+    """
+    Text drawn from a `SpriteCache` by matplotlib's Agg renderer, so it's only laid out & rasterized once for each string
+
+    Other renderers, and texts with path effects, a bbox or TeX, are drawn as a usual `Text`.
+
+    Args:
+        *args: See matplotlib's `Text`
+        sprite_cache (SpriteCache): Cache of the text's sprites
+        min_uses (int, optional): See `SpriteCache.get`, strings without a sprite yet are drawn as a usual `Text`. Defaults to 1.
+        **kwargs: See matplotlib's `Text`
+    """
+
+    def __init__(self, *args, sprite_cache: SpriteCache, min_uses: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sprite_cache = sprite_cache
+        self.min_uses = min_uses
+
+    @artist.allow_rasterization
+    def draw(self, renderer: "RendererBase") -> None:
+        """ Draw text from its sprite
+
+        Args:
+            renderer (RendererBase): Renderer to draw with
+        """
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        if (
+            not isinstance(renderer, RendererAgg)
+            or self.get_path_effects()
+            or self.get_bbox_patch()
+            or self.get_usetex()
+        ):
+            return super().draw(renderer)
+        if not self.get_visible() or not self.get_text():
+            return
+        sprite = self.sprite_cache.get(
+            self.get_text(), renderer.dpi, TextStyle.from_text(self), self.min_uses
+        )
+        if sprite is None:
+            return super().draw(renderer)
+        x, y = self.get_transform().transform(self.get_unitless_position())
+        if np.isfinite(x) and np.isfinite(y):
+            gc = renderer.new_gc()
+            gc.set_url(self._url)
+            self._set_gc_clip(gc)
+            sprite.draw_agg(renderer, gc, x, y)
+            gc.restore()
+        self.stale = False
+
+
+@attr.s
+class TextSprites:
+    """
+    Texts drawn in one style from a `SpriteCache`
+
+    With `compose`, horizontal & vertical strings are drawn from sprites of each of their characters, laid out as Agg lays them out, so strings that change every frame (eg, values) don't need rendering.
+
+    Args:
+        dpi (float): Resolution to render at
+        text_kwargs (typing.Dict[str, typing.Any]): Properties of the matplotlib `Text`, eg fontsize, color, ha, va & rotation
+        compose (bool, optional): Compose strings from sprites of their characters. Defaults to False.
+        cache (SpriteCache, optional): Cache of sprites, may be shared with other texts. Defaults to a new cache.
+    """
+
+    dpi: float = attr.ib()
+    text_kwargs: typing.Dict[str, typing.Any] = attr.ib()
+    compose: bool = attr.ib(default=False)
+    cache: SpriteCache = attr.ib(factory=SpriteCache)
+
+    def __attrs_post_init__(self):
+        """ Resolve the text's style & alignment
+        """
+        self.style = TextStyle.from_kwargs(**self.text_kwargs)
+        self.font_properties = self.style.font_properties
+        self.rotation = self.style.rotation
+        self._bearings = {}
+        # Fraction of a composed string's width before its position, along its direction
+        self._offset = None
+        if self.compose and self.rotation == 0:
+            self._offset = {"left": 0, "center": 0.5, "right": 1}.get(self.style.ha)
+            self._character_style = attr.evolve(self.style, ha="left")
+        elif self.compose and self.rotation == 90:
+            self._offset = {"bottom": 0, "center": 0.5, "top": 1}.get(self.style.va)
+            self._character_style = attr.evolve(self.style, va="bottom")
+
+    def get_sprite(self, s: str) -> Sprite:
+        """ Sprite of an entire string
+
+        Args:
+            s (str): Text
+
+        Returns:
+            Sprite: Rendered text
+        """
+        return self.cache.get(s, self.dpi, self.style)
+
+    def get_font(self) -> "matplotlib.ft2font.FT2Font":
+        """ Font of the text, set up as Agg sets it up to draw text
+
+        Returns:
+            matplotlib.ft2font.FT2Font: Font shared with matplotlib, only valid until it's next used, hold `get_font_lock()` while using it
+        """
+        from matplotlib.font_manager import findfont, get_font
+
+        font = get_font(findfont(self.font_properties))
+        font.clear()
+        font.set_size(self.font_properties.get_size_in_points(), self.dpi)
+        return font
+
+    def get_character(self, character: str) -> typing.Tuple[Sprite, float]:
+        """ Sprite of a character positioned at the start of its advance along the text's direction, with the offset Agg gives it when drawn on its own
+
+        Args:
+            character (str): Single character
+
+        Returns:
+            typing.Tuple[Sprite, float]: Rendered character and its left side bearing in pixels
+        """
+        from matplotlib.backends.backend_agg import get_hinting_flag
+
+        if character not in self._bearings:
+            with get_font_lock():
+                font = self.get_font()
+                font.set_text(character, 0.0, flags=get_hinting_flag())
+                self._bearings[character] = font.get_bitmap_offset()[0] / 64
+        sprite = self.cache.get(character, self.dpi, self._character_style)
+        return sprite, self._bearings[character]
+
+    def layout(self, s: str) -> typing.Tuple[np.ndarray, float, float]:
+        """ Lay out string as Agg lays it out to draw it
+
+        Args:
+            s (str): Text
+
+        Returns:
+            typing.Tuple[np.ndarray, float, float]: Pixels from the start of the string to each character, and the width & left side bearing of the string in pixels
+        """
+        from matplotlib.backends.backend_agg import get_hinting_flag
+
+        with get_font_lock():
+            font = self.get_font()
+            positions = font.set_text(s, 0.0, flags=get_hinting_flag())[:, 0] / 64
+            width = font.get_width_height()[0] / 64
+            bearing = font.get_bitmap_offset()[0] / 64
+        # The first glyph starts the string, its position isn't set by every version of matplotlib
+        positions[0] = 0
+        return positions, width, bearing
+
+    def draw(self, frame: np.ndarray, x: float, y: float, s: str) -> None:
+        """ Draw string aligned to pixel (x, y)
+
+        Args:
+            frame (np.ndarray): RGBA frame of shape (height, width, 4)
+            x (float): Column
+            y (float): Row, counting down from the top
+            s (str): Text
+        """
+        if not s:
+            return
+        if self._offset is None:
+            self.get_sprite(s).draw(frame, x, y)
+            return
+        positions, width, bearing = self.layout(s)
+        start = -self._offset * width
+        for character, position in zip(s, positions):
+            sprite, character_bearing = self.get_character(character)
+            # Agg draws the string as one bitmap, each glyph at whole pixels from its left edge
+            pixels = int(np.floor(position + character_bearing) - bearing)
+            if self.rotation == 0:
+                sprite.draw(frame, x + start + bearing + pixels - character_bearing, y)
+            else:
+                # The bitmap is offset across rotated text by its left side bearing
+                sprite.draw(frame, x + bearing - character_bearing, y - start - pixels)
+
+
+@attr.s
+class RasterBarChartRace:
+    """
+    Draws frames of a `BarChartRace` as arrays, without laying out & drawing matplotlib artists every frame
+
+    The chart's figure is drawn once for the background & layout, so styling set up by `create_figure` (or the figure passed as `fig=`) is kept. Bars are drawn without antialiasing.
+
+    Args:
+        chart (BarChartRace): Chart to draw frames of
+    """
+
+    chart: "BarChartRace" = attr.ib()
+
+    def __attrs_post_init__(self):
+        """ Draw the background and take the layout & styling from the chart's axes
+        """
+        from matplotlib import rcParams, ticker
+        from matplotlib.colors import to_rgba
+
+        chart = self.chart
+        ax = chart.ax
+        self.dpi = chart.dpi
+        self.sprite_cache = chart.get_sprite_cache()
+        self.horizontal = chart.orientation == "h"
+        if self.horizontal:
+            value_axis, category_axis = ax.xaxis, ax.yaxis
+        else:
+            value_axis, category_axis = ax.yaxis, ax.xaxis
+
+        self.background = self.render_background()
+        height, width = self.background.shape[:2]
+        box = ax.get_position()
+        self.left, self.right = box.x0 * width, box.x1 * width
+        self.top, self.bottom = (1 - box.y1) * height, (1 - box.y0) * height
+        self.rank_limits = (0.2, chart.n_visible + 0.8)
+        if chart.fixed_max:
+            self.value_limits = ax.get_xlim() if self.horizontal else ax.get_ylim()
+        else:
+            # Bars start from zero, which is where autoscaling leaves the lower limit
+            self.value_limits = (min(0, np.nanmin(chart.df.values)), None)
+
+        points = self.dpi / 72
+        tick = value_axis.get_major_ticks()[0]
+        self.tick_pad = tick.get_pad() * points
+        self.grid_width = 0
+        if tick.gridline.get_visible():
+            self.grid_width = tick.gridline.get_linewidth() * points
+            self.grid_color = self.get_rgba(
+                to_rgba(tick.gridline.get_color(), tick.gridline.get_alpha())
+            )
+        # Same ticks as the default locator for the axis' length & tick label size
+        self.locator = ticker.AutoLocator()
+        self.locator.set_params(nbins=int(np.clip(value_axis.get_tick_space(), 1, 9)))
+        self.formatter = value_axis.get_major_formatter()
+        self.value_labels = self.get_tick_labels(value_axis, compose=True)
+        self.category_labels = self.get_tick_labels(category_axis)
+
+        self.bar_colors = self.get_rgba([to_rgba(color) for color in chart.bar_colors])
+        self.edge_color = self.get_rgba(to_rgba("white"))
+        self.edge_width = rcParams["patch.linewidth"] * points
+        self.perpendicular_color = self.get_rgba(to_rgba(".5"))
+        self.perpendicular_width = 8 * points
+        if self.horizontal:
+            bar_label_kwargs = dict(ha="left", va="center")
+        else:
+            bar_label_kwargs = dict(ha="center", va="bottom", rotation=90)
+        self.bar_labels = TextSprites(
+            self.dpi,
+            dict(fontsize=chart.bar_label_size, **bar_label_kwargs),
+            True,
+            self.sprite_cache,
+        )
+        self.period_labels = None
+        if chart.period_label:
+            text_kwargs = dict(chart.get_period_label(chart.period_label))
+            self.period_position = (text_kwargs.pop("x"), text_kwargs.pop("y"))
+            self.period_labels = TextSprites(
+                self.dpi, text_kwargs, cache=self.sprite_cache
+            )
+        self.summaries = {}
+
+    def get_rgba(self, colors: np.ndarray) -> np.ndarray:
+        """ Colors as 0-255 RGBA
+
+        Args:
+            colors (np.ndarray): RGBA colors from 0 to 1
+
+        Returns:
+            np.ndarray: RGBA colors from 0 to 255
+        """
+        return np.round(np.asarray(colors) * 255)
+
+    def get_tick_labels(self, axis: "matplotlib.axis.Axis", compose: bool = False):
+        """ Texts styled like the axis' tick labels, None if they're hidden
+
+        Args:
+            axis (matplotlib.axis.Axis): Axis to take the style of tick labels from
+            compose (bool, optional): See `TextSprites`. Defaults to False.
+
+        Returns:
+            TextSprites: Tick label texts
+        """
+        label = axis.get_major_ticks()[0].label1
+        if not label.get_visible():
+            return None
+        text_kwargs = dict(
+            fontproperties=label.get_fontproperties(),
+            color=label.get_color(),
+            rotation=label.get_rotation(),
+            ha=label.get_ha(),
+            va=label.get_va(),
+        )
+        return TextSprites(self.dpi, text_kwargs, compose, self.sprite_cache)
+
+    def render_background(self) -> np.ndarray:
+        """ Draw the chart's figure without its axis, bars & texts
+
+        Returns:
+            np.ndarray: RGBA image, the same size as frames saved by the chart
+        """
+        import io
+
+        from PIL import Image
+
+        ax = self.chart.ax
+        artists = ax.lines + ax.patches + ax.collections + ax.texts
+        hidden = [
+            artist for artist in artists + [ax.xaxis, ax.yaxis] if artist.get_visible()
+        ]
+        for artist in hidden:
+            artist.set_visible(False)
+        try:
+            buffer = io.BytesIO()
+            self.chart.fig.savefig(buffer, format="png", dpi=self.dpi)
+        finally:
+            for artist in hidden:
+                artist.set_visible(True)
+        buffer.seek(0)
+        return np.array(Image.open(buffer).convert("RGBA"))
+
+    def fill(
+        self,
+        frame: np.ndarray,
+        columns: typing.Tuple[float, float],
+        rows: typing.Tuple[float, float],
+        color: np.ndarray,
+    ) -> None:
+        """ Fill rectangle, clipped to the axes
+
+        Args:
+            frame (np.ndarray): RGBA frame of shape (height, width, 4)
+            columns (typing.Tuple[float, float]): Pixels of the left & right edges, in either order
+            rows (typing.Tuple[float, float]): Pixels of the top & bottom edges, in either order
+            color (np.ndarray): RGBA color from 0 to 255
+        """
+        left = int(round(max(min(columns), self.left)))
+        right = int(round(min(max(columns), self.right)))
+        top = int(round(max(min(rows), self.top)))
+        bottom = int(round(min(max(rows), self.bottom)))
+        if left >= right or top >= bottom:
+            return
+        region = frame[top:bottom, left:right, :3]
+        if color[3] == 255:
+            region[...] = color[:3]
+        else:
+            alpha = color[3] / 255
+            region[...] = region * (1 - alpha) + color[:3] * alpha + 0.5
+
+    def draw(self, i: int) -> np.ndarray:
+        """ Draw frame `i`
+
+        Args:
+            i (int): Frame number
+
+        Returns:
+            np.ndarray: RGBA image of shape (height, width, 4)
+        """
+        chart = self.chart
+        frame = self.background.copy()
+        bar_location, bar_length, cols, colors = chart.get_visible_bars(i)
+        colors = self.bar_colors[np.isin(chart.df.columns, cols)]
+        # Bars with missing values aren't drawn, nor are their labels
+        drawn = np.isfinite(bar_length)
+        bar_location, bar_length = bar_location[drawn], bar_length[drawn]
+        cols, colors = cols[drawn], colors[drawn]
+
+        lower, upper = self.value_limits
+        if upper is None:
+            upper = bar_length.max(initial=lower) * (1.1 if self.horizontal else 1.16)
+        if not upper > lower:
+            # Same fallback as matplotlib for identical limits
+            upper = lower + 1
+        width, height = self.right - self.left, self.bottom - self.top
+        rank_lower, rank_upper = self.rank_limits
+
+        def to_value(value: float) -> float:
+            if self.horizontal:
+                return self.left + (value - lower) / (upper - lower) * width
+            return self.bottom - (value - lower) / (upper - lower) * height
+
+        def to_rank(rank: float) -> float:
+            fraction = (rank - rank_lower) / (rank_upper - rank_lower)
+            if self.horizontal:
+                return self.bottom - fraction * height
+            return self.left + fraction * width
+
+        def fill(value_span: typing.Tuple, rank_span: typing.Tuple, color) -> None:
+            if self.horizontal:
+                self.fill(frame, value_span, rank_span, color)
+            else:
+                self.fill(frame, rank_span, value_span, color)
+
+        # Across the axes, perpendicular to the bars
+        full_span = (
+            (self.top, self.bottom) if self.horizontal else (self.left, self.right)
+        )
+        ticks = self.locator.tick_values(lower, upper)
+        ticks = ticks[(ticks >= lower) & (ticks <= upper)]
+        if self.grid_width:
+            for tick in ticks:
+                position = to_value(tick)
+                fill(
+                    (position - self.grid_width / 2, position + self.grid_width / 2),
+                    full_span,
+                    self.grid_color,
+                )
+
+        if chart.perpendicular_bar_func:
+            position = to_value(chart.get_perpendicular_value(i))
+            half = self.perpendicular_width / 2
+            fill(
+                (position - half, position + half), full_span, self.perpendicular_color
+            )
+
+        half_edge = self.edge_width / 2
+        for location, length, color in zip(bar_location, bar_length, colors):
+            start, end = sorted((to_value(0), to_value(length)))
+            first, last = sorted((to_rank(location - 0.4), to_rank(location + 0.4)))
+            fill(
+                (start - half_edge, end + half_edge),
+                (first - half_edge, last + half_edge),
+                self.edge_color,
+            )
+            fill(
+                (start + half_edge, end - half_edge),
+                (first + half_edge, last - half_edge),
+                color,
+            )
+
+        if self.value_labels is not None:
+            self.formatter.set_locs(ticks)
+            for num, tick in enumerate(ticks):
+                label = self.formatter(tick, num)
+                if self.horizontal:
+                    self.value_labels.draw(
+                        frame, to_value(tick), self.bottom + self.tick_pad, label
+                    )
+                else:
+                    self.value_labels.draw(
+                        frame, self.left - self.tick_pad, to_value(tick), label
+                    )
+
+        if self.category_labels is not None:
+            for location, col in zip(bar_location, cols):
+                if not rank_lower <= location <= rank_upper:
+                    continue
+                if self.horizontal:
+                    self.category_labels.draw(
+                        frame, self.left - self.tick_pad, to_rank(location), col
+                    )
+                else:
+                    self.category_labels.draw(
+                        frame, to_rank(location), self.bottom + self.tick_pad, col
+                    )
+
+        if chart.label_bars:
+            for location, length in zip(bar_location, bar_length):
+                if self.horizontal:
+                    x, y = to_value(length) + 0.01 * width, to_rank(location)
+                else:
+                    x, y = to_rank(location), to_value(length) - 0.015 * height
+                self.bar_labels.draw(frame, x, y, f"{length:,.0f}")
+
+        if self.period_labels is not None:
+            x, y = self.period_position
+            self.period_labels.draw(
+                frame,
+                self.left + x * width,
+                self.bottom - y * height,
+                chart.get_period_text(i),
+            )
+        if chart.period_summary_func:
+            self.draw_summary(frame, chart.get_period_summary(i))
+        return frame
+
+    def draw_summary(self, frame: np.ndarray, text_dict: typing.Dict) -> None:
+        """ Draw the text returned by `period_summary_func`
+
+        Args:
+            frame (np.ndarray): RGBA frame of shape (height, width, 4)
+            text_dict (typing.Dict): Text & its position in axes coordinates, along with properties of the matplotlib `Text`
+        """
+        text_kwargs = {
+            key: value for key, value in text_dict.items() if key not in ("x", "y", "s")
+        }
+        key = repr(sorted(text_kwargs.items()))
+        if key not in self.summaries:
+            self.summaries[key] = TextSprites(
+                self.dpi, text_kwargs, cache=self.sprite_cache
+            )
+        self.summaries[key].draw(
+            frame,
+            self.left + text_dict["x"] * (self.right - self.left),
+            self.bottom - text_dict["y"] * (self.bottom - self.top),
+            text_dict["s"],
+        )
+
+
+class ChoroplethImage(artist.Artist, cm.ScalarMappable):
+    """
+    Polygons of a map drawn as a single image, colored by the value of each polygon's row
+
+    Matplotlib's Agg renderer rasterizes the polygons once for each resolution, into an image of the row number covering each pixel. Frames look up each pixel's color from the colors of the rows, so they take as long to draw however many polygons there are & however detailed they are. Polygons aren't antialiased, other renderers draw them as a collection.
+
+    Args:
+        paths (typing.Sequence[matplotlib.path.Path]): Outline of each polygon
+        rows (np.ndarray): Row of each polygon, multi polygons have a polygon for each part
+        num_rows (int): Number of rows, the length of the array of values
+        transform (matplotlib.transforms.Transform): Transform of the paths, eg the axes' `transData`
+        norm (matplotlib.colors.Normalize, optional): Normalization of values. Defaults to None.
+        cmap (matplotlib.colors.Colormap, optional): Colormap of normalized values. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        paths: typing.Sequence["matplotlib.path.Path"],
+        rows: np.ndarray,
+        num_rows: int,
+        transform: "matplotlib.transforms.Transform",
+        norm: "matplotlib.colors.Normalize" = None,
+        cmap: "matplotlib.colors.Colormap" = None,
+    ):
+        from matplotlib.collections import PathCollection
+
+        artist.Artist.__init__(self)
+        cm.ScalarMappable.__init__(self, norm, cmap)
+        self.labels = np.asarray(rows) + 1
+        self.num_rows = num_rows
+        if num_rows >= 2 ** 24:
+            raise ValueError("Maps can only rasterize fewer than 2 ** 24 rows")
+        self.label_colors = (
+            np.column_stack(
+                [
+                    self.labels & 255,
+                    self.labels >> 8 & 255,
+                    self.labels >> 16 & 255,
+                    np.full(len(self.labels), 255),
+                ]
+            )
+            / 255
+        )
+        self.label_collection = PathCollection(
+            paths,
+            facecolors=self.label_colors,
+            edgecolors="none",
+            antialiaseds=False,
+            transform=transform,
+        )
+        self.set_transform(transform)
+        self._label_image = None
+        self._label_image_key = None
+
+    def get_label_image(self, renderer: "RendererAgg") -> typing.Tuple:
+        """ Image of the row number + 1 covering each pixel (0 for none), cropped to the polygons
+
+        Rasterized again when the resolution or the transform of the polygons changes.
+
+        Args:
+            renderer (RendererAgg): Renderer the image is drawn with
+
+        Returns:
+            typing.Tuple: Label image counting rows up from the bottom, and the display coordinates of its bottom left pixel
+        """
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        key = (
+            renderer.width,
+            renderer.height,
+            renderer.dpi,
+            tuple(self.get_transform().transform([(0, 0), (1, 1)]).ravel()),
+        )
+        if key != self._label_image_key:
+            label_renderer = RendererAgg(renderer.width, renderer.height, renderer.dpi)
+            self.label_collection.draw(label_renderer)
+            buffer = np.asarray(label_renderer.buffer_rgba())
+            labels = buffer[..., :3].astype(np.int32)
+            labels = labels[..., 0] | labels[..., 1] << 8 | labels[..., 2] << 16
+            # Agg clears to transparent white
+            labels[buffer[..., 3] == 0] = 0
+            rows = np.flatnonzero(labels.any(axis=1))
+            columns = np.flatnonzero(labels.any(axis=0))
+            if len(rows):
+                top, bottom = rows[0], rows[-1] + 1
+                left, right = columns[0], columns[-1] + 1
+            else:
+                top = bottom = left = right = 0
+            # Images are drawn from their bottom row up
+            self._label_image = (
+                labels[top:bottom, left:right][::-1].copy(),
+                left,
+                buffer.shape[0] - bottom,
+            )
+            self._label_image_key = key
+        return self._label_image
+
+    def get_lookup(self) -> np.ndarray:
+        """ RGBA color of each label, the colors of the rows after transparent for no polygon
+
+        Returns:
+            np.ndarray: Unsigned byte array of shape (`num_rows` + 1, 4)
+        """
+        lookup = np.zeros((self.num_rows + 1, 4), dtype=np.uint8)
+        if self.get_array() is not None:
+            lookup[1:] = self.to_rgba(self.get_array(), self.get_alpha(), bytes=True)
+        return lookup
+
+    @artist.allow_rasterization
+    def draw(self, renderer: "RendererBase") -> None:
+        """ Draw polygons colored by their rows' values
+
+        Args:
+            renderer (RendererBase): Renderer to draw with
+        """
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        if not self.get_visible():
+            return
+        lookup = self.get_lookup()
+        self.label_collection.set_figure(self.figure)
+        if not isinstance(renderer, RendererAgg):
+            self.label_collection.set_clip_box(self.get_clip_box())
+            self.label_collection.set_clip_path(self.get_clip_path())
+            self.label_collection.set_facecolor(lookup[self.labels] / 255)
+            self.label_collection.set_antialiased(True)
+            self.label_collection.draw(renderer)
+            self.label_collection.set_facecolor(self.label_colors)
+            self.label_collection.set_antialiased(False)
+            return
+        labels, x, y = self.get_label_image(renderer)
+        if labels.size:
+            gc = renderer.new_gc()
+            gc.set_url(self._url)
+            self._set_gc_clip(gc)
+            # Looking up pixels as 32 bit integers is faster than as 4 bytes
+            image = lookup.view(np.uint32).ravel().take(labels)
+            renderer.draw_image(
+                gc, x, y, image.view(np.uint8).reshape(labels.shape + (4,))
+            )
+            gc.restore()
+        self.stale = False
@@ -0,0 +1,254 @@
+""" Animate charts from rows as they arrive
+
+Instead of interpolating an entire DataFrame up front, a streaming chart interpolates (and ranks) one period at a time as records arrive from an iterator or async iterator, writing each frame to a sink as soon as it's drawn. Only `max_periods` periods of history are kept, so live metrics can be animated without buffering their whole history.
+
+Example:
+    ``pandas_alive.stream_plot(df.iterrows(), filename="live.gif", kind="race")``
+"""
+
+import typing
+
+import attr
+import pandas as pd
+
+from ._base_chart import _BaseChart
+
+
+@attr.s
+class CallbackSink:
+    """
+    Sink passing each frame to a callable, eg to serve frames over a websocket
+
+    Args:
+        callback (typing.Callable): Called with each frame as a `PIL.Image.Image`
+    """
+
+    callback: typing.Callable = attr.ib()
+
+    def add_frame(self, image: "PIL.Image.Image") -> None:
+        """ Pass frame to `callback`
+
+        Args:
+            image (PIL.Image.Image): Rendered frame
+        """
+        self.callback(image)
+
+    def abort(self) -> None:
+        """ Nothing is buffered, so there is nothing to discard
+        """
+
+    def finish(self) -> None:
+        """ Nothing is buffered, so there is nothing to write
+        """
+
+
+@attr.s
+class StreamingChart:
+    """
+    Animate a chart period by period, emitting frames to a sink as rows arrive
+
+    Example:
+        ``with StreamingChart(df.head(1).plot_animated(kind="race"), GifStreamEncoder("live.gif", 100)) as stream: stream.feed(records)``
+
+    Args:
+        chart (_BaseChart): Chart created from the first period(s) of data, eg with `plot_animated()` and no `filename`
+        sink (typing.Any): Encoder (see `pandas_alive.encoders`) or any object with `add_frame(image)` & `finish()` methods, or a callable taking each frame as a `PIL.Image.Image`
+        max_periods (int, optional): Number of periods of history to keep, older periods are dropped from the chart. Defaults to 100.
+
+    Raises:
+        ValueError: If the chart uses `fixed_max`, as limits can't be fixed before all data has arrived
+    """
+
+    chart: _BaseChart = attr.ib()
+    sink: typing.Any = attr.ib()
+    max_periods: int = attr.ib(default=100)
+
+    def __attrs_post_init__(self):
+        """ Frames of the chart's initial data are emitted along with the first new period
+        """
+        if self.chart.fixed_max:
+            raise ValueError(
+                "`fixed_max` can't be used when streaming, as limits aren't known until all data has arrived"
+            )
+        if callable(self.sink) and not hasattr(self.sink, "add_frame"):
+            self.sink = CallbackSink(self.sink)
+        # The progress bar needs the total number of frames up front
+        self.chart.enable_progress_bar = False
+        self._started = False
+
+    def start(self) -> None:
+        """ Emit the frames of the chart's initial data, once
+        """
+        if not self._started:
+            self._started = True
+            self.emit(self.chart.get_frames())
+
+    def emit(self, frames: typing.Iterable[int]) -> None:
+        """ Draw frames and write them to the sink
+
+        Args:
+            frames (typing.Iterable[int]): Frame numbers to draw in order
+        """
+        for i in frames:
+            self.sink.add_frame(self.chart.render_image(i))
+
+    def push(
+        self, period: typing.Any, values: typing.Union[pd.Series, typing.Mapping]
+    ) -> None:
+        """ Add a period and emit the frames interpolated up to it
+
+        Args:
+            period (typing.Any): Index value of the new period, must follow the previous period
+            values (typing.Union[pd.Series, typing.Mapping]): Values of the new period for each column
+        """
+        self.start()
+        self.emit(self.chart.push_period(period, values, self.max_periods))
+
+    def feed(
+        self, records: typing.Iterable[typing.Tuple[typing.Any, typing.Any]]
+    ) -> None:
+        """ Push (period, values) records from an iterator until it's exhausted
+
+        Args:
+            records (typing.Iterable[typing.Tuple[typing.Any, typing.Any]]): Records of period and values
+        """
+        for period, values in records:
+            self.push(period, values)
+
+    async def afeed(
+        self, records: typing.AsyncIterable[typing.Tuple[typing.Any, typing.Any]]
+    ) -> None:
+        """ Push (period, values) records from an async iterator until it's exhausted
+
+        Frames are drawn in the event loop's default executor, so the loop isn't blocked while drawing.
+
+        Args:
+            records (typing.AsyncIterable[typing.Tuple[typing.Any, typing.Any]]): Records of period and values
+        """
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        async for period, values in records:
+            await loop.run_in_executor(None, self.push, period, values)
+
+    def close(self) -> None:
+        """ Emit the initial frames if no period was pushed and finish the sink
+        """
+        self.start()
+        self.sink.finish()
+
+    def __enter__(self) -> "StreamingChart":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.sink.abort()
+
+
+def _create_stream(
+    period: typing.Any,
+    values: typing.Union[pd.Series, typing.Mapping],
+    filename: str,
+    frame_callback: typing.Callable,
+    max_periods: int,
+    kwargs: typing.Dict[str, typing.Any],
+) -> StreamingChart:
+    """ Create chart from the first record and a sink for `filename` or `frame_callback`
+
+    Raises:
+        ValueError: If neither or both of `filename` and `frame_callback` are given
+
+    Returns:
+        StreamingChart: Streaming chart ready for the next record
+    """
+    from .encoders import get_encoder
+    from .plotting import plot, verify_filename
+
+    if (filename is None) == (frame_callback is None):
+        raise ValueError("Provide one of `filename` or `frame_callback`")
+    chart = plot(pd.DataFrame([values], index=[period]), **kwargs)
+    if filename is not None:
+        interval = chart.period_length / chart.steps_per_period
+        sink = get_encoder(
+            verify_filename(filename), 1000 / interval, interval, stream=True
+        )
+    else:
+        sink = frame_callback
+    return StreamingChart(chart, sink, max_periods=max_periods)
+
+
+def stream_plot(
+    records: typing.Iterable[typing.Tuple[typing.Any, typing.Any]],
+    filename: str = None,
+    frame_callback: typing.Callable = None,
+    max_periods: int = 100,
+    **kwargs,
+) -> StreamingChart:
+    """
+    Animate (period, values) records from an iterator as they arrive
+
+    The first record sets the columns of the chart, each following record is interpolated from the previous one and its frames are written to `filename` (GIF or ffmpeg video) or passed to `frame_callback` straight away.
+
+    Example:
+        ``pandas_alive.stream_plot(poll_metrics(), filename="live.mp4", kind="line", max_periods=50)``
+
+    Args:
+        records (typing.Iterable[typing.Tuple[typing.Any, typing.Any]]): Records of period (index value) and values (Series or dict of column to value)
+        filename (str, optional): File name with extension to stream frames to. Defaults to None.
+        frame_callback (typing.Callable, optional): Called with each frame as a `PIL.Image.Image`, instead of writing to a file. Defaults to None.
+        max_periods (int, optional): Number of periods of history to keep. Defaults to 100.
+        **kwargs: Chart options as per :func: pandas_alive.plotting.plot, eg `kind`, `steps_per_period`
+
+    Raises:
+        ValueError: If `records` is empty
+
+    Returns:
+        StreamingChart: Finished streaming chart, `chart` holds the last `max_periods` periods
+    """
+    records = iter(records)
+    try:
+        period, values = next(records)
+    except StopIteration:
+        raise ValueError("`records` must contain at least one record")
+    with _create_stream(
+        period, values, filename, frame_callback, max_periods, kwargs
+    ) as stream:
+        stream.feed(records)
+    return stream
+
+
+async def astream_plot(
+    records: typing.AsyncIterable[typing.Tuple[typing.Any, typing.Any]],
+    filename: str = None,
+    frame_callback: typing.Callable = None,
+    max_periods: int = 100,
+    **kwargs,
+) -> StreamingChart:
+    """
+    Animate (period, values) records from an async iterator as they arrive, see :func: pandas_alive.streaming.stream_plot
+
+    Args:
+        records (typing.AsyncIterable[typing.Tuple[typing.Any, typing.Any]]): Records of period (index value) and values (Series or dict of column to value)
+        filename (str, optional): File name with extension to stream frames to. Defaults to None.
+        frame_callback (typing.Callable, optional): Called with each frame as a `PIL.Image.Image`, instead of writing to a file. Defaults to None.
+        max_periods (int, optional): Number of periods of history to keep. Defaults to 100.
+        **kwargs: Chart options as per :func: pandas_alive.plotting.plot
+
+    Raises:
+        ValueError: If `records` is empty
+
+    Returns:
+        StreamingChart: Finished streaming chart
+    """
+    records = records.__aiter__()
+    try:
+        period, values = await records.__anext__()
+    except StopAsyncIteration:
+        raise ValueError("`records` must contain at least one record")
+    with _create_stream(
+        period, values, filename, frame_callback, max_periods, kwargs
+    ) as stream:
+        await stream.afeed(records)
+    return stream
@@ -0,0 +1,209 @@
+""" Offline store of web map tiles for the basemaps of map charts
+
+Tiles are kept on local disk in the usual XYZ layout, `<path>/<z>/<x>/<y>.png`, so a store can be seeded by copying tiles from elsewhere (eg, a tile server's cache, or a store seeded with `TileStore.seed` on a machine with network access). Missing tiles are only downloaded if the store has a `url`, so maps render without network access once the store holds their tiles.
+
+Basemaps are in Web Mercator (EPSG:3857), the projection map charts with a basemap are drawn in.
+
+Example:
+    ``gdf.plot_animated("map.gif", basemap_format={"zoom": 8}, tile_store=pandas_alive.TileStore("~/tiles"))``
+"""
+
+import io
+import os
+import tempfile
+import typing
+
+import attr
+import numpy as np
+
+# Half the width of the Web Mercator world, in metres
+HALF_WORLD = 20037508.342789244
+
+# Radius of the sphere Web Mercator projects from, in metres
+EARTH_RADIUS = 6378137.0
+
+
+def get_auto_zoom(bounds: typing.Sequence[float]) -> int:
+    """ Zoom level contextily picks for a map, the first with at least two tiles across each side
+
+    Args:
+        bounds (typing.Sequence[float]): (left, bottom, right, top) extent of the map in Web Mercator
+
+    Returns:
+        int: Zoom level
+    """
+    left, bottom, right, top = bounds
+    lon_length = (right - left) / HALF_WORLD * 180
+    lat_length = np.degrees(
+        np.diff(2 * np.arctan(np.exp(np.array([bottom, top]) / EARTH_RADIUS)))[0]
+    )
+    return int(max(np.ceil(np.log2(720 / min(lon_length, lat_length))), 0))
+
+
+def get_tile_range(
+    bounds: typing.Sequence[float], zoom: int
+) -> typing.Tuple[range, range]:
+    """ Tiles covering an extent
+
+    Args:
+        bounds (typing.Sequence[float]): (left, bottom, right, top) extent in Web Mercator
+        zoom (int): Zoom level
+
+    Returns:
+        typing.Tuple[range, range]: Columns (x) & rows (y, counting down from the top) of the tiles
+    """
+    num_tiles = 2 ** zoom
+    left, bottom, right, top = (
+        (np.array(bounds) * [1, -1, 1, -1] + HALF_WORLD) / (2 * HALF_WORLD) * num_tiles
+    )
+    x0, y0 = (int(np.clip(np.floor(edge), 0, num_tiles - 1)) for edge in (left, top))
+    x1, y1 = (int(np.clip(np.ceil(edge), 1, num_tiles)) for edge in (right, bottom))
+    return range(x0, max(x1, x0 + 1)), range(y0, max(y1, y0 + 1))
+
+
+def get_tile_extent(x: range, y: range, zoom: int) -> typing.Tuple[float, ...]:
+    """ Extent of a block of tiles, as given to `imshow`
+
+    Args:
+        x (range): Columns of the tiles
+        y (range): Rows of the tiles, counting down from the top
+        zoom (int): Zoom level
+
+    Returns:
+        typing.Tuple[float, ...]: (left, right, bottom, top) in Web Mercator
+    """
+    size = 2 * HALF_WORLD / 2 ** zoom
+    return (
+        -HALF_WORLD + x.start * size,
+        -HALF_WORLD + x.stop * size,
+        HALF_WORLD - y.stop * size,
+        HALF_WORLD - y.start * size,
+    )
+
+
+@attr.s
+class TileStore:
+    """
+    Map tiles on local disk, downloaded from `url` when missing if it's given
+
+    Args:
+        path (str): Directory of the store, with tiles at `<path>/<z>/<x>/<y>.png`. Will be created if missing.
+        url (str, optional): Template of the URL to download missing tiles from, eg "https://tile.openstreetmap.org/{z}/{x}/{y}.png". `file://` URLs copy tiles from another directory. Defaults to None, only tiles in the store are used.
+        attribution (str, optional): Attribution of the tiles, shown in the corner of maps. Defaults to None.
+        timeout (float, optional): Seconds to wait for each download. Defaults to 10.
+    """
+
+    path: str = attr.ib(
+        converter=lambda path: os.path.abspath(os.path.expanduser(str(path)))
+    )
+    url: str = attr.ib(default=None)
+    attribution: str = attr.ib(default=None)
+    timeout: float = attr.ib(default=10)
+
+    def __attrs_post_init__(self):
+        """ Create the store's directory
+        """
+        os.makedirs(self.path, exist_ok=True)
+
+    def get_path(self, x: int, y: int, zoom: int) -> str:
+        """ Location on disk of a tile
+
+        Args:
+            x (int): Column of the tile
+            y (int): Row of the tile, counting down from the top
+            zoom (int): Zoom level
+
+        Returns:
+            str: Path to tile
+        """
+        return os.path.join(self.path, str(zoom), str(x), f"{y}.png")
+
+    def download(self, x: int, y: int, zoom: int) -> None:
+        """ Download a tile from `url` into the store
+
+        Args:
+            x (int): Column of the tile
+            y (int): Row of the tile, counting down from the top
+            zoom (int): Zoom level
+
+        Raises:
+            FileNotFoundError: If the store has no `url` to download tiles from
+        """
+        import urllib.request
+
+        path = self.get_path(x, y, zoom)
+        if self.url is None:
+            raise FileNotFoundError(
+                f"Tile {zoom}/{x}/{y} isn't in the tile store at {self.path}, which has no `url` to download it from"
+            )
+        request = urllib.request.Request(
+            self.url.format(x=x, y=y, z=zoom, s="a", r=""),
+            headers={"User-Agent": "pandas_alive"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            data = response.read()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written whole, so other processes sharing the store never read part of a tile
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get_tile(self, x: int, y: int, zoom: int) -> np.ndarray:
+        """ Read a tile, downloading it first if it's missing
+
+        Args:
+            x (int): Column of the tile
+            y (int): Row of the tile, counting down from the top
+            zoom (int): Zoom level
+
+        Returns:
+            np.ndarray: RGB image of the tile
+        """
+        from PIL import Image
+
+        path = self.get_path(x, y, zoom)
+        if not os.path.exists(path):
+            self.download(x, y, zoom)
+        with open(path, "rb") as f:
+            return np.asarray(Image.open(io.BytesIO(f.read())).convert("RGB"))
+
+    def seed(self, bounds: typing.Sequence[float], zoom: int) -> int:
+        """ Download the tiles covering an extent that aren't in the store yet, eg before rendering offline
+
+        Args:
+            bounds (typing.Sequence[float]): (left, bottom, right, top) extent in Web Mercator
+            zoom (int): Zoom level
+
+        Returns:
+            int: Number of tiles downloaded
+        """
+        x_range, y_range = get_tile_range(bounds, zoom)
+        downloaded = 0
+        for x in x_range:
+            for y in y_range:
+                if not os.path.exists(self.get_path(x, y, zoom)):
+                    self.download(x, y, zoom)
+                    downloaded += 1
+        return downloaded
+
+    def get_image(
+        self, bounds: typing.Sequence[float], zoom: typing.Union[int, str] = "auto"
+    ) -> typing.Tuple[np.ndarray, typing.Tuple[float, ...]]:
+        """ Image of the tiles covering an extent, merged into one
+
+        Args:
+            bounds (typing.Sequence[float]): (left, bottom, right, top) extent in Web Mercator
+            zoom (typing.Union[int, str], optional): Zoom level, or "auto" to pick one as contextily does. Defaults to "auto".
+
+        Returns:
+            typing.Tuple[np.ndarray, typing.Tuple[float, ...]]: RGB image and its (left, right, bottom, top) extent for `imshow`
+        """
+        if zoom == "auto":
+            zoom = get_auto_zoom(bounds)
+        x_range, y_range = get_tile_range(bounds, zoom)
+        rows = [
+            np.concatenate([self.get_tile(x, y, zoom) for x in x_range], axis=1)
+            for y in y_range
+        ]
+        return np.concatenate(rows), get_tile_extent(x_range, y_range, zoom)
@@ -0,0 +1,22 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="function")
+def example_dataframe():
+    test_data = [
+        [np.random.randint(0, 10000), np.random.randint(0, 10000)],
+        [np.random.randint(0, 10000), np.random.randint(0, 10000)],
+    ]
+    test_columns = ["A", "B"]
+    index_start = datetime(
+        np.random.randint(2000, 2020),
+        np.random.randint(1, 12),
+        np.random.randint(1, 28),
+    )
+    index_end = index_start + timedelta(days=np.random.randint(1, 364))
+    test_index = [index_start, index_end]
+    return pd.DataFrame(data=test_data, columns=test_columns, index=test_index)
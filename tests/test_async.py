@@ -0,0 +1,61 @@
+import asyncio
+import os
+
+import pytest
+from PIL import Image
+
+import pandas_alive
+
+
+def test_save_async_reports_progress(example_dataframe, tmp_path):
+    filename = str(tmp_path / "race.gif")
+    chart = example_dataframe.plot_animated(steps_per_period=2)
+    events = []
+    asyncio.run(chart.save_async(filename, progress_callback=events.append))
+    num_frames = len(chart.get_frames())
+    assert [event.frame for event in events] == list(range(1, num_frames + 1))
+    assert all(event.total == num_frames for event in events)
+    with Image.open(filename) as im:
+        assert im.n_frames == num_frames
+
+
+def test_save_async_timeout_removes_output(example_dataframe, tmp_path):
+    filename = str(tmp_path / "race.gif")
+    chart = example_dataframe.plot_animated()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(chart.save_async(filename, timeout=0))
+    assert not os.path.exists(filename)
+
+
+def test_save_async_cancel_removes_output(example_dataframe, tmp_path):
+    filename = str(tmp_path / "race.gif")
+    chart = example_dataframe.plot_animated()
+
+    async def cancel_after_first_frame():
+        started = asyncio.Event()
+        task = asyncio.ensure_future(
+            chart.save_async(filename, progress_callback=lambda event: started.set())
+        )
+        await started.wait()
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel_after_first_frame())
+    assert not os.path.exists(filename)
+
+
+def test_animate_multiple_plots_async(example_dataframe, tmp_path):
+    filename = str(tmp_path / "multiple.gif")
+    plots = [
+        example_dataframe.plot_animated(steps_per_period=2),
+        example_dataframe.plot_animated(kind="line", steps_per_period=2),
+    ]
+    events = []
+    asyncio.run(
+        pandas_alive.animate_multiple_plots_async(
+            filename, plots, progress_callback=events.append
+        )
+    )
+    with Image.open(filename) as im:
+        assert im.n_frames == events[-1].total == len(events)
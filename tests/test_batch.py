@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+from PIL import Image
+
+import pandas_alive
+from pandas_alive import _base_chart
+from pandas_alive.batch import BatchJob, render_job
+
+
+def test_layout_cache_matches_measured_layout(example_dataframe, monkeypatch):
+    measured = example_dataframe.plot_animated()
+    monkeypatch.setattr(_base_chart, "_layout_cache", {})
+    first = example_dataframe.plot_animated()
+    cached = example_dataframe.plot_animated()
+    assert len(_base_chart._layout_cache) == 1
+    for chart in (first, cached):
+        np.testing.assert_allclose(
+            chart.fig.get_size_inches(), measured.fig.get_size_inches()
+        )
+        np.testing.assert_allclose(
+            chart.ax.get_position().bounds, measured.ax.get_position().bounds
+        )
+
+
+def test_render_job_reads_csv(example_dataframe, tmp_path):
+    path = str(tmp_path / "data.csv")
+    example_dataframe.to_csv(path)
+    output = str(tmp_path / "race.gif")
+    result = render_job(BatchJob(path, {"steps_per_period": 2}, output))
+    assert result.ok and result.seconds > 0
+    with Image.open(output) as im:
+        assert im.n_frames == len(example_dataframe) * 2 - 1
+
+
+def test_render_batch(example_dataframe, tmp_path):
+    outputs = [str(tmp_path / f"{kind}.gif") for kind in ("race", "line", "nope")]
+    results = pandas_alive.render_batch(
+        [(example_dataframe, {"kind": "race"}, outputs[0])]
+        + [
+            BatchJob(example_dataframe, {"kind": kind}, output)
+            for kind, output in zip(("line", "nope"), outputs[1:])
+        ],
+        workers=2,
+    )
+    assert [result.output for result in results] == outputs
+    assert [result.ok for result in results] == [True, True, False]
+    assert "Allowed plot kinds" in results[2].error
+    assert os.path.exists(outputs[0]) and os.path.exists(outputs[1])
+
+
+def test_render_batch_threads(example_dataframe, tmp_path):
+    kinds = ("race", "line", "scatter", "race")
+    jobs = [
+        BatchJob(
+            example_dataframe.iloc[:, : num % 2 + 1],
+            {"kind": kind},
+            str(tmp_path / f"{num}.gif"),
+        )
+        for num, kind in enumerate(kinds)
+    ]
+    expected = []
+    for job in jobs:
+        assert render_job(job).ok
+        with open(job.output, "rb") as f:
+            expected.append(f.read())
+    results = pandas_alive.render_batch(jobs, workers=4, threads=True)
+    assert all(result.ok for result in results)
+    for job, data in zip(jobs, expected):
+        with open(job.output, "rb") as f:
+            assert f.read() == data
@@ -0,0 +1,77 @@
+import os
+
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+import pandas_alive
+from pandas_alive.cache import FrameCache, GeometryCache, make_key
+
+
+def read_gif_frames(filename):
+    return [
+        np.asarray(frame.convert("RGB"))
+        for frame in ImageSequence.Iterator(Image.open(filename))
+    ]
+
+
+def test_make_key_is_content_addressed():
+    assert make_key({"a": 1, "b": [1.0, "x"]}) == make_key({"b": [1.0, "x"], "a": 1})
+    assert make_key(np.arange(3)) != make_key(np.arange(4))
+
+
+def test_frame_cache_evicts_least_recently_used(tmp_path):
+    cache = FrameCache(tmp_path, max_bytes=250)
+    for key in "abc":
+        cache.put(key, b"0" * 100)
+        os.utime(cache.get_path(key), (0, {"a": 1, "b": 2, "c": 3}[key]))
+    assert "a" not in cache
+    assert cache.get("c") == b"0" * 100
+
+
+def test_geometry_cache_round_trips_wkb(tmp_path):
+    cache = GeometryCache(tmp_path)
+    wkbs = [b"\x01\x03", b"", b"\x01" * 300]
+    cache.put_wkb("key", wkbs)
+    assert cache.get_wkb("key") == wkbs
+    assert cache.get_wkb("missing") is None
+
+
+@pytest.mark.parametrize("kind", ["race", "bar"])
+def test_frame_cache_only_redraws_changed_frames(example_dataframe, kind, tmp_path):
+    cache = FrameCache(tmp_path / "frames")
+    example_dataframe.plot_animated(
+        filename=str(tmp_path / "first.gif"), kind=kind, frame_cache=cache
+    )
+    num_cached = len(os.listdir(cache.path))
+
+    changed_df = example_dataframe.copy()
+    changed_df.iloc[-1] += 1
+    changed_df.plot_animated(
+        filename=str(tmp_path / "second.gif"), kind=kind, frame_cache=cache
+    )
+
+    # Only the frames interpolated towards the changed last row are redrawn
+    assert len(os.listdir(cache.path)) == num_cached + 5
+
+
+@pytest.mark.parametrize("kind", ["race", "line", "scatter", "pie", "bar"])
+def test_frame_cache_matches_uncached_render(example_dataframe, kind, tmp_path):
+    cache = FrameCache(tmp_path / "frames")
+    example_dataframe.plot_animated(
+        filename=str(tmp_path / "first.gif"), kind=kind, frame_cache=cache
+    )
+
+    # Changing a later row also changes the limits of earlier frames on some charts
+    changed_df = example_dataframe.copy()
+    changed_df.iloc[-1] = 100000
+    changed_df.plot_animated(
+        filename=str(tmp_path / "cached.gif"), kind=kind, frame_cache=cache
+    )
+    changed_df.plot_animated(filename=str(tmp_path / "uncached.gif"), kind=kind)
+
+    cached = read_gif_frames(str(tmp_path / "cached.gif"))
+    uncached = read_gif_frames(str(tmp_path / "uncached.gif"))
+    assert len(cached) == len(uncached)
+    for cached_frame, uncached_frame in zip(cached, uncached):
+        assert np.array_equal(cached_frame, uncached_frame)
@@ -0,0 +1,63 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+import pandas_alive
+from pandas_alive.compositing import get_cells, iter_composite_frames
+
+
+def make_plots(df):
+    return [
+        df.plot_animated(steps_per_period=2),
+        df.plot_animated(kind="line", steps_per_period=2),
+    ]
+
+
+def make_figure(num_plots):
+    fig = plt.Figure()
+    for num in range(num_plots):
+        fig.add_subplot(num_plots, 1, num + 1)
+    fig.suptitle("Dashboard")
+    return fig
+
+
+def test_get_cells_split_gaps():
+    fig = make_figure(2)
+    top_cell, bottom_cell = get_cells(fig, top=0.95)
+    upper, lower = [ax.get_position() for ax in fig.axes]
+    assert top_cell[3] == 0.95 and bottom_cell[1] == 0
+    assert top_cell[1] == bottom_cell[3]
+    assert lower.y1 < bottom_cell[3] < upper.y0
+
+
+@pytest.mark.parametrize("workers", [None, 1])
+def test_workers_match_in_process(example_dataframe, workers):
+    num_frames = len(example_dataframe) * 2 - 1
+    expected = list(
+        iter_composite_frames(
+            make_figure(2), make_plots(example_dataframe), num_frames, 72, workers=0
+        )
+    )
+    frames = list(
+        iter_composite_frames(
+            make_figure(2),
+            make_plots(example_dataframe),
+            num_frames,
+            72,
+            workers=workers,
+        )
+    )
+    assert len(frames) == num_frames
+    for frame, expected_frame in zip(frames, expected):
+        np.testing.assert_array_equal(frame, expected_frame)
+
+
+def test_animate_multiple_plots_composite(example_dataframe, tmp_path):
+    filename = str(tmp_path / "composite.gif")
+    pandas_alive.animate_multiple_plots(
+        filename, make_plots(example_dataframe), composite=True, dpi=72
+    )
+    with Image.open(filename) as im:
+        assert im.n_frames == len(example_dataframe) * 2 - 1
+        assert im.size == (460, 345)
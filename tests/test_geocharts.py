@@ -0,0 +1,220 @@
+import io
+import warnings
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import PIL.Image
+import pytest
+
+import pandas_alive
+
+geopandas = pytest.importorskip("geopandas")
+pytest.importorskip("descartes")
+
+
+def read_file(path):
+    with warnings.catch_warnings():
+        # Fiona warns about resetting its iterator on some GDAL versions
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return geopandas.read_file(path)
+
+
+@pytest.fixture(scope="module")
+def italy_gdf():
+    gdf = read_file("data/italy-covid-region.gpkg")
+    gdf.index = gdf.region
+    gdf = gdf.drop(columns="region").iloc[:, -4:]
+    # Regions without a value aren't shown
+    gdf.iloc[:3, 1] = np.nan
+    return gdf
+
+
+@pytest.fixture(scope="module")
+def nsw_gdf():
+    gdf = read_file("data/nsw-covid19-cases-by-postcode.gpkg")
+    gdf.index = gdf.postcode
+    return gdf.drop(columns="postcode").iloc[:, -4:]
+
+
+@pytest.mark.parametrize("gdf_name", ["italy_gdf", "nsw_gdf"])
+def test_map_collections_match_replot(request, gdf_name, monkeypatch):
+    gdf = request.getfixturevalue(gdf_name)
+    chart = gdf.plot_animated(steps_per_period=2, cmap="Greens")
+    assert chart.uses_geo_collections()
+    frames = list(chart.iter_frames())
+    collections = [collection for collection, rows in chart._geo_collections]
+    assert collections
+
+    monkeypatch.setattr(type(chart), "uses_geo_collections", lambda self: False)
+    np.testing.assert_array_equal(np.stack(frames), np.stack(list(chart.iter_frames())))
+
+
+def test_map_collections_updated_in_place(italy_gdf):
+    chart = italy_gdf.plot_animated(steps_per_period=2)
+    chart.anim_func(0)
+    ((collection, rows),) = chart._geo_collections
+    chart.anim_func(1)
+    assert chart.ax.collections == [collection]
+    values = chart.get_geo_values()[1]
+    np.testing.assert_array_equal(collection.get_array(), values[rows])
+    assert collection.get_clim() == (np.nanmin(values), np.nanmax(values))
+
+
+def test_map_classification_replots(italy_gdf):
+    chart = italy_gdf.plot_animated(legend=True)
+    assert not chart.uses_geo_collections()
+    chart.anim_func(0)
+    chart.anim_func(1)
+    assert len(chart.ax.collections) == 1
+
+
+def test_map_raster_engine(italy_gdf):
+    from pandas_alive.raster import ChoroplethImage
+
+    expected = np.stack(list(italy_gdf.plot_animated(steps_per_period=2).iter_frames()))
+    chart = italy_gdf.plot_animated(steps_per_period=2, engine="raster")
+    frames = np.stack(list(chart.iter_frames()))
+    # Only the edges of polygons differ, as they aren't antialiased
+    differences = np.abs(frames.astype(int) - expected).max(axis=-1)
+    assert (differences > 0).mean() < 0.05
+
+    chart.anim_func(0)
+    assert not chart.ax.collections
+    (image,) = chart.ax.artists
+    assert isinstance(image, ChoroplethImage)
+    chart.anim_func(1)
+    np.testing.assert_array_equal(image.get_array(), chart.get_geo_values()[1])
+    # Other renderers draw the polygons as a collection
+    chart.fig.savefig(io.BytesIO(), format="svg")
+
+
+def test_map_raster_engine_keeps_edges(italy_gdf):
+    chart = italy_gdf.plot_animated(engine="raster", edgecolor="black")
+    chart.anim_func(0)
+    (collection,) = chart.ax.collections
+    assert collection.get_array() is None
+    assert len(chart.ax.artists) == 1
+
+
+def test_map_engine_validated(italy_gdf):
+    with pytest.raises(ValueError):
+        italy_gdf.plot_animated(engine="svg")
+
+
+def count_vertices(geometries):
+    return sum(len(np.asarray(shape.exterior.coords)) for shape in geometries.explode())
+
+
+def test_map_simplify_geometries(italy_gdf, tmp_path):
+    expected = np.stack(list(italy_gdf.plot_animated(steps_per_period=2).iter_frames()))
+    chart = italy_gdf.plot_animated(
+        steps_per_period=2, simplify=True, geometry_cache=str(tmp_path)
+    )
+    assert count_vertices(chart.df.geometry) < count_vertices(italy_gdf.geometry) / 5
+    assert chart.df.crs == italy_gdf.crs
+    frames = np.stack(list(chart.iter_frames()))
+    differences = np.abs(frames.astype(int) - expected).max(axis=-1)
+    assert (differences > 0).mean() < 0.02
+
+    assert len(list(tmp_path.iterdir())) == 1
+    cached = italy_gdf.plot_animated(
+        steps_per_period=2, simplify=True, geometry_cache=str(tmp_path)
+    )
+    assert [shape.wkb for shape in cached.df.geometry] == [
+        shape.wkb for shape in chart.df.geometry
+    ]
+
+
+def test_map_simplify_clips_to_limits(italy_gdf):
+    from shapely.geometry import box
+
+    x0, y0, x1, y1 = italy_gdf.total_bounds
+    view = box(x0, y0, (x0 + x1) / 2, (y0 + y1) / 2)
+    fig, ax = plt.subplots()
+    ax.set_xlim(x0, (x0 + x1) / 2)
+    ax.set_ylim(y0, (y0 + y1) / 2)
+    chart = italy_gdf.plot_animated(fig=fig, simplify=True)
+    plt.close(fig)
+    assert len(chart.df) == len(italy_gdf)
+    # Geometries are cut at the limits, those outside them are only bounding boxes
+    margin = view.buffer((x1 - x0) / 100)
+    inside = chart.df.geometry.within(margin)
+    assert inside.any() and not inside.all()
+    outside = chart.df.geometry[~inside]
+    assert outside.geom_equals(outside.envelope).all()
+
+
+def test_map_basemap_fetched_once(nsw_gdf, tmp_path, monkeypatch):
+    from pandas_alive.tiles import get_tile_range
+
+    bounds = nsw_gdf.to_crs(3857).total_bounds
+    for zoom in range(12):
+        x_range, y_range = get_tile_range(bounds, zoom)
+        for x in x_range:
+            (tmp_path / str(zoom) / str(x)).mkdir(parents=True)
+            for y in y_range:
+                PIL.Image.new("RGB", (256, 256), (x % 256, y % 256, 0)).save(
+                    tmp_path / str(zoom) / str(x) / f"{y}.png"
+                )
+    store = pandas_alive.TileStore(tmp_path, attribution="Test tiles")
+    tiles_read = []
+    get_tile = store.get_tile
+    monkeypatch.setattr(
+        store, "get_tile", lambda *tile: tiles_read.append(tile) or get_tile(*tile)
+    )
+
+    chart = nsw_gdf.plot_animated(
+        basemap_format={"alpha": 0.5}, tile_store=store, steps_per_period=2
+    )
+    list(chart.iter_frames())
+    num_tiles = len(tiles_read)
+    assert num_tiles
+    chart.anim_func(0)
+    chart.anim_func(1)
+    assert len(tiles_read) == num_tiles
+    (basemap,) = chart.ax.images
+    assert basemap.get_alpha() == 0.5
+    texts = [text.get_text() for text in chart.ax.texts]
+    assert texts == ["Test tiles", chart.get_period_text(1)]
+
+
+@pytest.mark.parametrize("interpolate_period", [True, False])
+def test_geo_frames_match_interpolated_df(interpolate_period):
+    from pandas_alive.geocharts import GeoFrames
+
+    values = np.array(
+        [
+            [1.0, 4.0, 2.0, 8.0],
+            [np.nan, 3.0, np.nan, 6.0],
+            [5.0, 2.0, np.nan, np.nan],
+            [np.nan] * 4,
+        ]
+    )
+    periods = pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-04", "2020-01-05"])
+    geo_frames = GeoFrames.from_periods(values, periods, 3, interpolate_period)
+
+    df = pd.DataFrame(values.T, index=np.arange(4) * 3).reindex(range(10))
+    np.testing.assert_array_equal(geo_frames.values, df.interpolate().values.T)
+    assert geo_frames.values.flags.f_contiguous
+    if interpolate_period:
+        expected = pd.date_range(periods[0], periods[-1], periods=10)
+    else:
+        expected = periods.repeat(3)[:10]
+    pd.testing.assert_index_equal(geo_frames.periods, expected)
+
+
+def test_map_geo_frames_keep_geometry_apart(italy_gdf):
+    chart = italy_gdf.plot_animated(steps_per_period=2, interpolate_period=False)
+    assert list(chart.df.columns) == ["geometry"]
+    assert chart.df.index.equals(italy_gdf.index)
+    assert len(chart.get_frames()) == len(chart.get_period_labels()) == 5
+    period, values = chart.get_frame_data(3)
+    assert period == pd.Timestamp(italy_gdf.columns[1])
+    # Regions missing a value are interpolated from the periods either side
+    np.testing.assert_array_equal(
+        values[3:], (italy_gdf.iloc[3:, 1] + italy_gdf.iloc[3:, 2]) / 2
+    )
+    np.testing.assert_array_equal(
+        values[:3], italy_gdf.iloc[:3, 0] * 0.25 + italy_gdf.iloc[:3, 2] * 0.75
+    )
@@ -1,4 +1,8 @@
+import io
 import os
+import shutil
+import struct
+import subprocess
 import sys
 
 import pandas_alive
@@ -6,34 +10,19 @@ import pytest
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 from PIL import Image
 
+from pandas_alive.encoders import PaletteGifEncoder, split_gif
+
 myPath = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, "../..")
 
 
-@pytest.fixture(scope="function")
-def example_dataframe():
-    test_data = [
-        [np.random.randint(0, 10000), np.random.randint(0, 10000)],
-        [np.random.randint(0, 10000), np.random.randint(0, 10000)],
-    ]
-    test_columns = ["A", "B"]
-    index_start = datetime(
-        np.random.randint(2000, 2020),
-        np.random.randint(1, 12),
-        np.random.randint(1, 28),
-    )
-    index_end = index_start + timedelta(days=np.random.randint(1, 364))
-    test_index = [index_start, index_end]
-    return pd.DataFrame(data=test_data, columns=test_columns, index=test_index)
-
-
 @pytest.mark.parametrize("kind", ["race", "line", "scatter", "pie", "bar"])
-def test_plot(example_dataframe, kind):
-    animated_plot = example_dataframe.plot_animated(filename="test.gif", kind=kind)
-    im = Image.open("test.gif")
+def test_plot(example_dataframe, kind, tmp_path):
+    filename = str(tmp_path / "test.gif")
+    animated_plot = example_dataframe.plot_animated(filename=filename, kind=kind)
+    im = Image.open(filename)
     assert im.format == "GIF"
 
 
@@ -53,10 +42,11 @@ def test_bar_chart_race(
     n_visible,
     fixed_order,
     perpendicular_bar_func,
+    tmp_path,
 ):
-
+    filename = str(tmp_path / "test.gif")
     animated_plot = example_dataframe.plot_animated(
-        filename="test.gif",
+        filename=filename,
         kind="race",
         orientation=orientation,
         sort=sort,
@@ -66,19 +56,491 @@ def test_bar_chart_race(
         fixed_order=fixed_order,
         perpendicular_bar_func=perpendicular_bar_func,
     )
-    im = Image.open("test.gif")
+    im = Image.open(filename)
     assert im.format == "GIF"
 
 
 @pytest.mark.parametrize("line_width", [1, 2])
 @pytest.mark.parametrize("fill_under_line_color", ["blue", "red"])
-def test_line_chart(example_dataframe, line_width, fill_under_line_color):
-
+def test_line_chart(example_dataframe, line_width, fill_under_line_color, tmp_path):
+    filename = str(tmp_path / "test.gif")
     animated_plot = example_dataframe.plot_animated(
-        filename="test.gif",
+        filename=filename,
         kind="race",
         line_width=line_width,
         fill_under_line_color=fill_under_line_color,
     )
-    im = Image.open("test.gif")
+    im = Image.open(filename)
     assert im.format == "GIF"
+
+
+def composite_gif_frames(filename):
+    """ Decode GIF frames by compositing each frame's own colors onto the canvas, as
+    viewers do, rather than by palette index as older Pillow versions do
+    """
+    with open(filename, "rb") as f:
+        header, _, blocks = split_gif(f.read())
+    canvas = Image.new("RGB", (header[6] | header[7] << 8, header[8] | header[9] << 8))
+    frames = []
+    transparency = None
+    for block in blocks:
+        if block[:2] == b"\x21\xf9":
+            transparency = block[6] if block[3] & 1 else None
+        if block[0] != 0x2C:
+            continue
+        left, top, width, height = struct.unpack("<4H", block[1:9])
+        patch = Image.open(
+            io.BytesIO(
+                b"GIF89a"
+                + struct.pack("<2H", width, height)
+                + b"\x00\x00\x00"
+                + block[:1]
+                + bytes(4)
+                + block[5:]
+                + b";"
+            )
+        )
+        mask = None
+        if transparency is not None:
+            mask = Image.fromarray(
+                (np.asarray(patch) != transparency).astype(np.uint8) * 255
+            )
+        canvas.paste(patch.convert("RGB"), (left, top), mask)
+        frames.append(np.asarray(canvas))
+    return frames
+
+
+@pytest.fixture
+def extended_dataframe(example_dataframe):
+    extended_df = pd.concat([example_dataframe, example_dataframe.iloc[[-1]] * 2])
+    extended_df.index = pd.date_range(example_dataframe.index[0], periods=3)
+    return extended_df
+
+
+@pytest.mark.parametrize("kind", ["race", "bar"])
+def test_append(extended_dataframe, kind, tmp_path):
+    filename = str(tmp_path / "test.gif")
+    extended_dataframe.iloc[:2].plot_animated(filename=filename, kind=kind, append=True)
+    extended_dataframe.plot_animated(filename=filename, kind=kind, append=True)
+    extended_dataframe.plot_animated(filename=str(tmp_path / "full.gif"), kind=kind)
+
+    appended = composite_gif_frames(filename)
+    full = composite_gif_frames(str(tmp_path / "full.gif"))
+    assert len(appended) == len(full)
+    for appended_frame, full_frame in zip(appended, full):
+        assert np.array_equal(appended_frame, full_frame)
+
+
+def test_append_with_corrupt_manifest(extended_dataframe, tmp_path):
+    filename = str(tmp_path / "test.gif")
+    extended_dataframe.iloc[:2].plot_animated(filename=filename, append=True)
+    with open(filename + ".pandas_alive.json", "w") as f:
+        f.write('{"frame_keys": [')
+
+    with pytest.warns(UserWarning, match="rendering all frames"):
+        extended_dataframe.plot_animated(filename=filename, append=True)
+    extended_dataframe.plot_animated(filename=str(tmp_path / "full.gif"))
+    assert len(composite_gif_frames(filename)) == len(
+        composite_gif_frames(str(tmp_path / "full.gif"))
+    )
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_append_mp4(extended_dataframe, tmp_path):
+    filename = str(tmp_path / "test.mp4")
+    extended_dataframe.iloc[:2].plot_animated(filename=filename, append=True)
+    extended_dataframe.plot_animated(filename=filename, append=True)
+
+    num_frames = len(extended_dataframe.plot_animated().get_frames())
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-count_frames",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=nb_read_frames",
+            "-of",
+            "csv=p=0",
+            filename,
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    assert int(result.stdout) == num_frames
+    # Temporary segments are cleaned up
+    assert sorted(os.listdir(tmp_path)) == ["test.mp4", "test.mp4.pandas_alive.json"]
+
+
+@pytest.fixture
+def plateau_dataframe():
+    return pd.DataFrame(
+        [[1, 2], [1, 2], [1, 2], [3, 4]],
+        columns=["A", "B"],
+        index=pd.date_range("2020-01-01", periods=4),
+    )
+
+
+@pytest.mark.parametrize("kind", ["race", "line", "pie", "bar"])
+def test_repeated_frames_are_not_drawn(plateau_dataframe, kind, tmp_path):
+    filename = str(tmp_path / "dedup.gif")
+    chart = plateau_dataframe.plot_animated(
+        kind=kind, period_fmt="%Y-%m", steps_per_period=3, interpolate_period=False
+    )
+    repeated = chart.get_repeated_frames()
+    assert repeated[1] and not repeated[-1]
+    drawn = []
+    render_png = chart.render_png
+    chart.render_png = lambda i: drawn.append(i) or render_png(i)
+    chart.save(filename)
+    assert drawn == [i for i in chart.get_frames() if not repeated[i]]
+
+    expected_filename = str(tmp_path / "expected.gif")
+    expected_chart = plateau_dataframe.plot_animated(
+        kind=kind, period_fmt="%Y-%m", steps_per_period=3, interpolate_period=False
+    )
+    encoder = PaletteGifEncoder(
+        expected_filename,
+        chart.period_length / chart.steps_per_period,
+        expected_chart.get_palette_colors(),
+    )
+    for i in expected_chart.get_frames():
+        encoder.add_frame(Image.open(io.BytesIO(expected_chart.render_png(i))))
+    encoder.finish()
+    with open(filename, "rb") as f, open(expected_filename, "rb") as expected:
+        assert f.read() == expected.read()
+
+
+def test_repeated_frames_need_same_period_label(plateau_dataframe):
+    chart = plateau_dataframe.plot_animated(steps_per_period=3)
+    # Each period's label differs, so only the steps within a period repeat
+    np.testing.assert_array_equal(
+        chart.get_repeated_frames(),
+        [False, True, True, False, True, True, False, False, False, False],
+    )
+
+
+@pytest.mark.parametrize("kind", ["race", "line"])
+def test_frame_budget(kind, tmp_path):
+    filename = str(tmp_path / "budget.gif")
+    df = pd.DataFrame(
+        [[1, 2, 3], [1, 2, 3.1], [5, 1, 0], [5, 1.1, 0], [0, 9, 4]],
+        columns=["A", "B", "C"],
+        index=pd.date_range("2020-01-01", periods=5),
+    )
+    chart = df.plot_animated(kind=kind, steps_per_period=10)
+    num_frames = len(chart.get_frames())
+    steps = chart.get_adaptive_steps(20)
+    # Periods where values & ranks change most get the most steps
+    assert steps.sum() == 19 and steps[3] > steps[1] > steps[0] == steps[2]
+
+    drawn = []
+    render_png = chart.render_png
+    chart.render_png = lambda i: drawn.append(i) or render_png(i)
+    chart.apply_frame_budget(20)
+    chart.save(filename)
+    assert len(chart.get_frames()) == num_frames
+    assert len(drawn) == 20
+    np.testing.assert_array_equal(chart.df.iloc[::10].values, df.values)
+
+    with pytest.raises(ValueError):
+        chart.get_adaptive_steps(4)
+
+
+@pytest.mark.parametrize("kind", ["race", "line"])
+def test_preview(kind, tmp_path):
+    df = pd.DataFrame(
+        np.arange(12.0).reshape(4, 3),
+        columns=["A", "B", "C"],
+        index=pd.date_range("2020-01-01", periods=4),
+    )
+    full = df.plot_animated(kind=kind, steps_per_period=10)
+    preview = df.plot_animated(
+        filename=str(tmp_path / "preview.gif"),
+        kind=kind,
+        steps_per_period=10,
+        preview=True,
+    )
+    # Every period boundary is kept and frames are shown for longer
+    assert len(preview.get_frames()) == 7
+    assert preview.df.index.equals(full.df.index[::5])
+    assert preview.steps_per_period * 5 == full.steps_per_period
+    assert preview.dpi == full.dpi // 4
+    assert np.allclose(preview.fig.get_size_inches(), full.fig.get_size_inches())
+    assert preview.ax.get_position().bounds == full.ax.get_position().bounds
+
+
+def test_preview_multiple_plots(example_dataframe, tmp_path):
+    filename = str(tmp_path / "preview.gif")
+    plots = [
+        example_dataframe.plot_animated(steps_per_period=4),
+        example_dataframe.plot_animated(kind="line", steps_per_period=4),
+    ]
+    pandas_alive.animate_multiple_plots(filename, plots, preview=True)
+    im = Image.open(filename)
+    assert im.n_frames == len(example_dataframe) * 2 - 1
+    assert im.size == (160, 120)
+
+
+@pytest.mark.parametrize(
+    "kind, kwargs",
+    [
+        ("race", {}),
+        (
+            "line",
+            {
+                "fill_under_line_color": "blue",
+                "label_events": {"Event": "2020-01-01 12:00"},
+            },
+        ),
+        ("line", {"fixed_max": True}),
+        ("scatter", {}),
+        ("pie", {}),
+        ("bar", {}),
+    ],
+)
+def test_render_frame(example_dataframe, kind, kwargs):
+    example_dataframe.index = pd.date_range(
+        "2020-01-01", periods=len(example_dataframe)
+    )
+    chart = example_dataframe.plot_animated(kind=kind, steps_per_period=3, **kwargs)
+    frames = list(chart.iter_frames())
+    assert len(frames) == len(chart.get_frames())
+    for i in (1, len(frames) - 1, 0):
+        np.testing.assert_array_equal(chart.render_frame(i), frames[i])
+    np.testing.assert_array_equal(list(chart.iter_frames(1, 3)), frames[1:3])
+
+
+def test_save_many(example_dataframe, tmp_path):
+    chart = example_dataframe.plot_animated(kind="line", steps_per_period=3)
+    chart.save(str(tmp_path / "single.gif"))
+    drawn = []
+    render_png = chart.render_png
+    chart.render_png = lambda i: drawn.append(i) or render_png(i)
+    chart.save_many(
+        {
+            str(tmp_path / "full.gif"): {},
+            str(tmp_path / "half.gif"): {"scale": 0.5},
+            str(tmp_path / "poster.png"): {},
+            str(tmp_path / "first.jpg"): {"frame": 0, "scale": 0.25},
+        }
+    )
+    assert drawn == list(chart.get_frames())
+    with open(tmp_path / "single.gif", "rb") as single, open(
+        tmp_path / "full.gif", "rb"
+    ) as full:
+        assert single.read() == full.read()
+    width, height = Image.open(tmp_path / "full.gif").size
+    assert Image.open(tmp_path / "half.gif").size == (width // 2, height // 2)
+    np.testing.assert_array_equal(
+        np.asarray(Image.open(tmp_path / "poster.png")), chart.render_frame(-1)
+    )
+    assert Image.open(tmp_path / "first.jpg").size == (width // 4, height // 4)
+
+    # Only the frame of a still is drawn when there's no animation
+    drawn.clear()
+    chart.save_many({str(tmp_path / "poster.png"): {"frame": 1}})
+    assert drawn == [1]
+
+    with pytest.raises(ValueError):
+        chart.save_many({str(tmp_path / "full.gif"): {"frame": 1}})
+    with pytest.raises(ValueError):
+        chart.save_many({str(tmp_path / "full.gif"): {"fps": 10}})
+
+
+def test_palette_gif(example_dataframe, tmp_path):
+    filename = str(tmp_path / "palette.gif")
+    chart = example_dataframe.plot_animated(kind="race", steps_per_period=3)
+    chart.save(filename)
+    frames = list(chart.iter_frames())
+
+    images = [Image.fromarray(frame).convert("RGB") for frame in frames]
+    images[0].save(
+        str(tmp_path / "pillow.gif"),
+        save_all=True,
+        append_images=images[1:],
+        duration=chart.period_length / chart.steps_per_period,
+        loop=0,
+    )
+    assert os.path.getsize(filename) < os.path.getsize(tmp_path / "pillow.gif")
+
+    decoded = composite_gif_frames(filename)
+    assert len(decoded) == len(frames)
+    for decoded_frame, frame in zip(decoded, frames):
+        # Colors are mapped on 5 bits per channel
+        error = np.abs(decoded_frame.astype(int) - frame[..., :3]).mean()
+        assert error < 8
+
+    with open(filename, "rb") as f:
+        _, _, blocks = split_gif(f.read())
+    descriptors = [block for block in blocks if block[0] == 0x2C]
+    assert struct.unpack("<2H", descriptors[0][1:5]) == (0, 0)
+    # Later frames only cover what changed
+    width, height = Image.open(filename).size
+    assert any(
+        struct.unpack("<2H", descriptor[5:9]) != (width, height)
+        for descriptor in descriptors[1:]
+    )
+
+    # Failing while appending leaves the GIF as it was
+    with open(filename, "rb") as f:
+        original = f.read()
+    encoder = PaletteGifEncoder(filename, 100, chart.get_palette_colors(), append=True)
+    encoder.add_frame(images[0])
+    encoder.add_frame(images[-1])
+    encoder.abort()
+    with open(filename, "rb") as f:
+        assert f.read() == original
+
+
+@pytest.mark.parametrize("orientation", ["h", "v"])
+def test_raster_engine(example_dataframe, orientation, tmp_path):
+    kwargs = dict(
+        steps_per_period=3,
+        orientation=orientation,
+        perpendicular_bar_func="mean",
+        period_summary_func=lambda values: {
+            "x": 0.9,
+            "y": 0.1,
+            "s": f"Total: {values.sum():,.0f}",
+            "ha": "right",
+        },
+    )
+    agg = example_dataframe.plot_animated(**kwargs)
+    raster = example_dataframe.plot_animated(engine="raster", **kwargs)
+    for i in (0, 1, len(agg.get_frames()) - 1):
+        expected, frame = agg.render_frame(i), raster.render_frame(i)
+        assert frame.shape == expected.shape
+        # Only bar edges & antialiasing of composed values differ
+        assert np.abs(frame.astype(int) - expected).mean() < 3
+    raster.save(str(tmp_path / "raster.gif"))
+    saved = composite_gif_frames(tmp_path / "raster.gif")
+    assert np.abs(saved[-1].astype(int) - frame[..., :3]).mean() < 8
+
+    with pytest.raises(ValueError):
+        example_dataframe.plot_animated(engine="cairo")
+
+
+@pytest.mark.parametrize(
+    "index, period_fmt, expected",
+    [
+        (pd.date_range("2020-01-30", periods=3), "%B %d", "February 01"),
+        (pd.Index([1990, 1991, 1992]), "Year {x:.0f}", "Year 1992"),
+        (pd.Index(["a", "b", "c"]), None, "c"),
+    ],
+)
+def test_period_labels(index, period_fmt, expected):
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [3, 2, 1]}, index=index)
+    chart = df.plot_animated(
+        period_fmt=period_fmt, steps_per_period=2, interpolate_period=False
+    )
+    labels = chart.get_period_labels()
+    assert len(labels) == len(chart.df)
+    assert labels[-1] == expected
+    assert chart.get_period_labels() is labels
+
+
+def test_vectorized_period_summary(example_dataframe):
+    def summary(values):
+        return {"x": 0.9, "y": 0.1, "s": f"Total {values.sum():,.0f}", "ha": "right"}
+
+    calls = []
+
+    @pandas_alive.vectorized
+    def summaries(df):
+        calls.append(len(df))
+        s = df.sum(axis=1).map("Total {:,.0f}".format)
+        return {"x": 0.9, "y": 0.1, "s": s, "ha": "right"}
+
+    chart = example_dataframe.plot_animated(
+        steps_per_period=3, period_summary_func=summary
+    )
+    vectorized_chart = example_dataframe.plot_animated(
+        steps_per_period=3, period_summary_func=summaries
+    )
+    for i in chart.get_frames():
+        assert vectorized_chart.get_period_summary(i) == chart.get_period_summary(i)
+    assert calls == [len(chart.df)]
+    np.testing.assert_array_equal(
+        vectorized_chart.render_frame(2), chart.render_frame(2)
+    )
+
+    @pandas_alive.vectorized
+    def too_few(df):
+        return {"x": 0.9, "y": 0.1, "s": ["Total"]}
+
+    with pytest.raises(ValueError):
+        example_dataframe.plot_animated(period_summary_func=too_few).render_frame(0)
+
+
+@pytest.mark.parametrize("func", ["mean", "median", "max", "quantile"])
+def test_perpendicular_values(func):
+    df = pd.DataFrame(
+        np.random.randint(0, 10000, (4, 6)).astype(float),
+        columns=list("ABCDEF"),
+        index=pd.date_range("2020-01-01", periods=4),
+    )
+    df.iloc[1, 2] = np.nan
+    chart = df.plot_animated(n_visible=4, perpendicular_bar_func=func)
+    for i in chart.get_frames():
+        bar_length = chart.get_visible_bars(i)[1]
+        np.testing.assert_allclose(
+            chart.get_perpendicular_value(i), pd.Series(bar_length).agg(func)
+        )
+
+
+def test_vectorized_perpendicular_bar_func(example_dataframe):
+    calls = []
+
+    def upper_quartile(values, ranks):
+        return values.quantile(0.75)
+
+    @pandas_alive.vectorized
+    def upper_quartiles(df, df_rank):
+        calls.append(len(df))
+        return df.quantile(0.75, axis=1)
+
+    chart = example_dataframe.plot_animated(perpendicular_bar_func=upper_quartile)
+    vectorized_chart = example_dataframe.plot_animated(
+        perpendicular_bar_func=upper_quartiles
+    )
+    for i in chart.get_frames():
+        assert vectorized_chart.get_perpendicular_value(i) == pytest.approx(
+            chart.get_perpendicular_value(i)
+        )
+    assert calls == [len(chart.df)]
+
+
+def test_matplotlib_global_state_unchanged(example_dataframe, tmp_path):
+    import datetime
+
+    import matplotlib
+    import matplotlib.dates as mdates
+    import matplotlib.pyplot as plt
+    import matplotlib.units as munits
+
+    registry = dict(munits.registry)
+    user_figure = plt.figure()
+    with matplotlib.rc_context({"figure.autolayout": True}):
+        rc_params = matplotlib.rcParams.copy()
+        line = example_dataframe.plot_animated(kind="line")
+        line.save(str(tmp_path / "line.gif"))
+        pandas_alive.animate_multiple_plots(
+            str(tmp_path / "multiple.gif"),
+            [
+                example_dataframe.plot_animated(),
+                example_dataframe.plot_animated(kind="line"),
+            ],
+        )
+        assert matplotlib.rcParams.copy() == rc_params
+
+    assert dict(munits.registry) == registry
+    assert not isinstance(
+        munits.registry[datetime.datetime], mdates.ConciseDateConverter
+    )
+    assert plt.get_fignums() == [user_figure.number]
+    plt.close(user_figure)
+    # Dates are still labelled concisely, without a converter for every date
+    assert isinstance(line.ax.xaxis.get_major_formatter(), mdates.ConciseDateFormatter)
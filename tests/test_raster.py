@@ -0,0 +1,76 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.text import Text
+
+from pandas_alive.raster import SpriteCache, SpriteText, TextStyle
+
+
+def draw_texts(text_class, positions, **text_kwargs):
+    fig = plt.figure(figsize=(4, 3), dpi=144)
+    for num, (x, y) in enumerate(positions):
+        text = text_class(
+            x, y, f"{num * 12345.6:,.0f}", transform=fig.transFigure, **text_kwargs
+        )
+        text.set_figure(fig)
+        fig.texts.append(text)
+    fig.canvas.draw()
+    image = np.array(fig.canvas.buffer_rgba())
+    plt.close(fig)
+    return image
+
+
+@pytest.mark.parametrize(
+    "text_kwargs",
+    [
+        dict(ha="left", va="center"),
+        dict(ha="right", va="baseline", fontsize=13),
+        dict(ha="center", va="bottom", rotation=90, color="red"),
+    ],
+)
+def test_sprite_text_matches_text(text_kwargs):
+    cache = SpriteCache()
+    positions = [(x, y) for x in (0.3, 0.3017, 0.3042) for y in (0.4, 0.4023, 0.6)]
+    expected = draw_texts(Text, positions, **text_kwargs)
+
+    def sprite_text(*args, **kwargs):
+        return SpriteText(*args, sprite_cache=cache, **kwargs)
+
+    np.testing.assert_array_equal(
+        draw_texts(sprite_text, positions, **text_kwargs), expected
+    )
+    assert len(cache) == len(positions)
+    # Drawn again from the cached sprites
+    np.testing.assert_array_equal(
+        draw_texts(sprite_text, positions, **text_kwargs), expected
+    )
+    assert len(cache) == len(positions)
+
+
+def test_sprite_cache_evicts_least_recently_used():
+    cache = SpriteCache(max_sprites=2)
+    style = TextStyle.from_kwargs(fontsize=8)
+    first = cache.get("a", 72, style)
+    cache.get("b", 72, style)
+    assert cache.get("a", 72, style) is first
+    cache.get("c", 72, style)
+    assert len(cache) == 2
+    assert cache.get("a", 72, style) is first
+    cache.get("b", 72, style)
+    cache.get("c", 72, style)
+    assert cache.get("a", 72, style) is not first
+    # Strings are rendered separately for each style & resolution
+    assert cache.get("a", 144, style).image.shape != first.image.shape
+    assert cache.get("a", 72, TextStyle.from_kwargs(fontsize=8, color="red")) is not (
+        cache.get("a", 72, style)
+    )
+
+
+def test_sprite_cache_min_uses():
+    cache = SpriteCache()
+    style = TextStyle.from_kwargs()
+    assert cache.get("1,234", 72, style, min_uses=2) is None
+    assert len(cache) == 0
+    sprite = cache.get("1,234", 72, style, min_uses=2)
+    assert sprite is not None
+    assert cache.get("1,234", 72, style, min_uses=2) is sprite
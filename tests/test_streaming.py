@@ -0,0 +1,105 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+
+import pandas_alive
+from pandas_alive.streaming import StreamingChart
+
+
+@pytest.fixture(scope="function")
+def streamed_dataframe():
+    return pd.DataFrame(
+        np.random.randint(0, 10000, (5, 3)),
+        columns=["A", "B", "C"],
+        index=pd.date_range("2020-01-01", periods=5),
+    )
+
+
+@pytest.mark.parametrize("kind", ["race", "line", "scatter", "pie", "bar"])
+def test_stream_plot_bounds_history(streamed_dataframe, kind):
+    frames = []
+    stream = pandas_alive.stream_plot(
+        streamed_dataframe.iterrows(),
+        frame_callback=frames.append,
+        kind=kind,
+        steps_per_period=3,
+        max_periods=2,
+    )
+    assert len(frames) == 1 + 4 * 3
+    assert len(stream.chart.df) == 2 * 3 + 1
+    assert stream.chart.df.index[-1] == streamed_dataframe.index[-1]
+
+
+def test_stream_plot_matches_interpolated_race(streamed_dataframe):
+    stream = pandas_alive.stream_plot(
+        streamed_dataframe.iterrows(), frame_callback=lambda image: None
+    )
+    chart = streamed_dataframe.plot_animated()
+    np.testing.assert_allclose(stream.chart.df.values, chart.df.values)
+    assert stream.chart.df.index.equals(chart.df.index)
+    np.testing.assert_array_equal(stream.chart.df_rank.values, chart.df_rank.values)
+
+
+def test_stream_plot_to_gif(streamed_dataframe, tmp_path):
+    filename = str(tmp_path / "stream.gif")
+    pandas_alive.stream_plot(
+        streamed_dataframe.iterrows(), filename=filename, steps_per_period=2
+    )
+    with Image.open(filename) as im:
+        assert im.n_frames == 1 + 4 * 2
+
+
+def test_astream_plot(streamed_dataframe):
+    async def records():
+        for period, values in streamed_dataframe.iterrows():
+            yield period, values
+
+    frames = []
+    asyncio.run(
+        pandas_alive.astream_plot(
+            records(), frame_callback=frames.append, steps_per_period=2
+        )
+    )
+    assert len(frames) == 1 + 4 * 2
+
+
+def test_streaming_chart_rejects_fixed_max(streamed_dataframe):
+    chart = streamed_dataframe.head(1).plot_animated(fixed_max=True)
+    with pytest.raises(ValueError):
+        StreamingChart(chart, lambda image: None)
+
+
+def test_stream_plot_period_tables(streamed_dataframe):
+    @pandas_alive.vectorized
+    def summary(df):
+        return {"x": 0.9, "y": 0.1, "s": df.sum(axis=1).map("{:,.0f}".format)}
+
+    stream = pandas_alive.stream_plot(
+        streamed_dataframe.iterrows(),
+        frame_callback=lambda image: None,
+        steps_per_period=2,
+        max_periods=2,
+        period_fmt="%d/%m",
+        period_summary_func=summary,
+    )
+    chart = stream.chart
+    assert list(chart.get_period_labels()) == list(chart.df.index.strftime("%d/%m"))
+    assert [chart.get_period_summary(i)["s"] for i in chart.get_frames()] == list(
+        chart.df.sum(axis=1).map("{:,.0f}".format)
+    )
+
+
+def test_stream_plot_perpendicular_values(streamed_dataframe):
+    stream = pandas_alive.stream_plot(
+        streamed_dataframe.iterrows(),
+        frame_callback=lambda image: None,
+        steps_per_period=2,
+        max_periods=2,
+        perpendicular_bar_func="max",
+    )
+    chart = stream.chart
+    for i in chart.get_frames():
+        assert chart.get_perpendicular_value(i) == chart.get_visible_bars(i)[1].max()
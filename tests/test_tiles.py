@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from pandas_alive.tiles import TileStore, get_tile_extent, get_tile_range
+
+# Around Sydney in Web Mercator
+BOUNDS = (16700000.0, -4050000.0, 16900000.0, -3950000.0)
+
+
+def seed_tiles(path, zoom):
+    x_range, y_range = get_tile_range(BOUNDS, zoom)
+    for x in x_range:
+        for y in y_range:
+            (path / str(zoom) / str(x)).mkdir(parents=True, exist_ok=True)
+            Image.new("RGB", (256, 256), (x % 256, y % 256, zoom)).save(
+                path / str(zoom) / str(x) / f"{y}.png"
+            )
+    return x_range, y_range
+
+
+def test_tile_range_covers_bounds():
+    x_range, y_range = get_tile_range(BOUNDS, 9)
+    left, right, bottom, top = get_tile_extent(x_range, y_range, 9)
+    assert left <= BOUNDS[0] and right >= BOUNDS[2]
+    assert bottom <= BOUNDS[1] and top >= BOUNDS[3]
+    assert get_tile_range((-1e9, -1e9, 1e9, 1e9), 1) == (range(0, 2), range(0, 2))
+
+
+def test_tile_store_reads_seeded_tiles(tmp_path):
+    x_range, y_range = seed_tiles(tmp_path, 9)
+    image, extent = TileStore(tmp_path).get_image(BOUNDS, 9)
+    assert image.shape == (256 * len(y_range), 256 * len(x_range), 3)
+    assert extent == get_tile_extent(x_range, y_range, 9)
+    # Tiles are laid out left to right & top to bottom
+    np.testing.assert_array_equal(image[0, 0], [x_range[0] % 256, y_range[0] % 256, 9])
+    np.testing.assert_array_equal(
+        image[-1, -1], [x_range[-1] % 256, y_range[-1] % 256, 9]
+    )
+
+
+def test_tile_store_offline(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        TileStore(tmp_path).get_image(BOUNDS, 9)
+
+
+def test_tile_store_downloads_missing_tiles(tmp_path):
+    seed_tiles(tmp_path / "server", 9)
+    store = TileStore(
+        tmp_path / "store", url=(tmp_path / "server").as_uri() + "/{z}/{x}/{y}.png"
+    )
+    assert store.seed(BOUNDS, 9) > 0
+    assert store.seed(BOUNDS, 9) == 0
+    np.testing.assert_array_equal(
+        TileStore(tmp_path / "store").get_image(BOUNDS, 9)[0],
+        TileStore(tmp_path / "server").get_image(BOUNDS, 9)[0],
+    )